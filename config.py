@@ -1,7 +1,16 @@
 import os
+import time
+from pathlib import Path
+
 from dotenv import load_dotenv
 load_dotenv()
 
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+
+def _csv(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
 
 class Settings:
     BASE_URL = os.getenv("BASE_URL", "").rstrip("/")
@@ -10,6 +19,67 @@ class Settings:
     ACCOUNT_SETTINGS_URL = f"{BASE_URL}/account-settings"
     BROWSER_NAME = os.getenv("BROWSER", "chromium")
     HEADLESS = os.getenv("HEADLESS", "true").strip().lower() in {"1", "true", "yes", "on"}
+    BROWSER_LAUNCH_ARGS = os.getenv("BROWSER_LAUNCH_ARGS", "")
+    BROWSER_SERVER_MODE = os.getenv("BROWSER_SERVER", "auto").strip().lower()
+    BROWSER_SERVER_PORT = int(os.getenv("BROWSER_SERVER_PORT", "9333"))
+    BROWSER_SERVER_FILE = PROJECT_ROOT / os.getenv("BROWSER_SERVER_FILE", "reports/.cache/browser_server.json")
     DEFAULT_TIMEOUT_MS = int(os.getenv("DEFAULT_TIMEOUT_MS", "15000"))
     USERNAME = os.getenv("USERNAME", "")
     PASSWORD = os.getenv("PASSWORD", "")
+    WORKER_ID = os.getenv("TEST_WORKER_ID", "main")
+    AUTH_STATE_DIR = PROJECT_ROOT / os.getenv("AUTH_STATE_DIR", "reports/.auth")
+    AUTH_STATE_TTL_SECONDS = int(os.getenv("AUTH_STATE_TTL_SECONDS", "1800"))
+    SETTLE_QUIET_MS = int(os.getenv("SETTLE_QUIET_MS", "100"))
+    SETTLE_TIMEOUT_MS = int(os.getenv("SETTLE_TIMEOUT_MS", "5000"))
+    API_BASE_URL = os.getenv("API_BASE_URL", "").rstrip("/")
+    APP_MODE = os.getenv("APP_MODE", "live").strip().lower()
+    FAKE_APP_PORT = int(os.getenv("FAKE_APP_PORT", "0"))
+    LIVE_LOAD_TESTS = os.getenv("LIVE_LOAD_TESTS", "off").strip().lower() in {"1", "true", "yes", "on"}
+    RESOURCE_POLICY_ENABLED = os.getenv("RESOURCE_POLICY", "on").strip().lower() in {"1", "true", "yes", "on"}
+    BLOCKED_RESOURCE_TYPES = _csv(os.getenv("BLOCKED_RESOURCE_TYPES", "image,media,font"))
+    STUBBED_RESOURCE_TYPES = _csv(os.getenv("STUBBED_RESOURCE_TYPES", ""))
+    BLOCKED_URL_PATTERNS = _csv(
+        os.getenv("BLOCKED_URL_PATTERNS", "*google-analytics.com/*,*googletagmanager.com/*,*doubleclick.net/*")
+    )
+    CONTEXT_POOL_ENABLED = os.getenv("CONTEXT_POOL", "on").strip().lower() in {"1", "true", "yes", "on"}
+    RUN_ID = os.getenv("TEST_RUN_ID") or time.strftime("%Y%m%d-%H%M%S")
+    PERF_BUDGET_MODE = os.getenv("PERF_BUDGET_MODE", "report").strip().lower()
+    PERF_SAMPLE_EVERY = int(os.getenv("PERF_SAMPLE_EVERY", "5"))
+    PERF_TREND_DIR = PROJECT_ROOT / os.getenv("PERF_TREND_DIR", "reports/performance")
+    ACTION_TIMING_ENABLED = os.getenv("ACTION_TIMING", "on").strip().lower() in {"1", "true", "yes", "on"}
+    ACTION_TIMING_DIR = PROJECT_ROOT / os.getenv("ACTION_TIMING_DIR", "reports/action-timing")
+    RESOURCE_SIZE_LEDGER = PROJECT_ROOT / os.getenv("RESOURCE_SIZE_LEDGER", "reports/.cache/resource_sizes.json")
+    RESOURCE_SIZE_PROBE = os.getenv("RESOURCE_SIZE_PROBE", "off").strip().lower() in {"1", "true", "yes", "on"}
+    RESOURCE_SIZE_PROBE_TIMEOUT_MS = int(os.getenv("RESOURCE_SIZE_PROBE_TIMEOUT_MS", "1000"))
+    TRACING_MODE = os.getenv("TRACING", "on-failure").strip().lower()
+    TRACE_DIR = PROJECT_ROOT / os.getenv("TRACE_DIR", "reports/traces")
+    RERUN_FAILURES = int(os.getenv("RERUN_FAILURES", "0"))
+    TEST_LEDGER = PROJECT_ROOT / os.getenv("TEST_LEDGER", "reports/.cache/test_ledger.json")
+    LEDGER_WINDOW = int(os.getenv("LEDGER_WINDOW", "20"))
+    QUARANTINE_FLIPS = int(os.getenv("QUARANTINE_FLIPS", "3"))
+    QUARANTINE_MODE = os.getenv("QUARANTINE", "off").strip().lower()
+    TEST_DURATIONS = PROJECT_ROOT / os.getenv("TEST_DURATIONS", "reports/.cache/test_durations.json")
+    DURATION_HISTORY_SIZE = int(os.getenv("DURATION_HISTORY_SIZE", "5"))
+    LONGEST_FIRST = os.getenv("LONGEST_FIRST", "off").strip().lower() in {"1", "true", "yes", "on"}
+    CASE_INDEX = PROJECT_ROOT / os.getenv("CASE_INDEX", "reports/.cache/case_index.json")
+    LOAD_USERS = int(os.getenv("LOAD_USERS", "10"))
+    LOAD_RAMP_UP_SECONDS = float(os.getenv("LOAD_RAMP_UP_SECONDS", "30"))
+    LOAD_DURATION_SECONDS = float(os.getenv("LOAD_DURATION_SECONDS", "120"))
+    LOAD_THINK_TIME_SECONDS = [float(value) for value in _csv(os.getenv("LOAD_THINK_TIME_SECONDS", "1,3"))]
+    LOAD_SCENARIO_MIX = os.getenv("LOAD_SCENARIO_MIX", "browse=6,buy=2,rent=2")
+    LOAD_REPORT_DIR = PROJECT_ROOT / os.getenv("LOAD_REPORT_DIR", "reports/load")
+    FILTER_ORACLE_ENABLED = os.getenv("FILTER_ORACLE", "off").strip().lower() in {"1", "true", "yes", "on"}
+    SELECTOR_CAPTURE_DIR = PROJECT_ROOT / os.getenv("SELECTOR_CAPTURE_DIR", "reports/selector-profile/pages")
+    SELECTOR_REPORT_DIR = PROJECT_ROOT / os.getenv("SELECTOR_REPORT_DIR", "reports/selector-profile")
+    MEMORY_WATCH_ENABLED = os.getenv("MEMORY_WATCH", "on").strip().lower() in {"1", "true", "yes", "on"}
+    MEMORY_GROWTH_WINDOW = int(os.getenv("MEMORY_GROWTH_WINDOW", "5"))
+    MEMORY_GROWTH_PERCENT = float(os.getenv("MEMORY_GROWTH_PERCENT", "10"))
+    MEMORY_RECYCLE_HEAP_MB = float(os.getenv("MEMORY_RECYCLE_HEAP_MB", "256"))
+    MEMORY_REPORT_DIR = PROJECT_ROOT / os.getenv("MEMORY_REPORT_DIR", "reports/memory")
+
+    @classmethod
+    def use_base_url(cls, base_url: str) -> None:
+        cls.BASE_URL = base_url.rstrip("/")
+        cls.LOGIN_URL = f"{cls.BASE_URL}/teebay-buggy/"
+        cls.MY_PRODUCTS_URL = f"{cls.BASE_URL}/my-products"
+        cls.ACCOUNT_SETTINGS_URL = f"{cls.BASE_URL}/account-settings"
@@ -1,21 +1,11 @@
 from config import Settings
 from pages.base_page import BasePage
+from pages.selectors import AccountSettingsPageSelectors
+from support.web_vitals import measured
 
 
-class AccountSettingsPage(BasePage):
-    ACCOUNT_SETTINGS_NAV_TEXT = "Account Settings"
-    PAGE_HEADING_TEXT = "ACCOUNT SETTINGS"
-
-    FIRST_NAME_INPUT = "input[name='first_name']"
-    LAST_NAME_INPUT = "input[name='last_name']"
-    ADDRESS_INPUT = "input[name='address']"
-    EMAIL_INPUT = "input[name='email']"
-    PHONE_NUMBER_INPUT = "input[name='phone_number']"
-    UPDATE_BUTTON = "button:has-text('Update')"
-
-    UPDATE_SUCCESS_TEXT = "User updated!"
-    MY_PRODUCTS_NAV_TEXT = "My Products"
-
+class AccountSettingsPage(AccountSettingsPageSelectors, BasePage):
+    @measured("account_settings")
     def open_from_my_products(self) -> None:
         # Direct /my-products navigation is not stable on GitHub Pages; use current authenticated app page.
         if "account-settings" in self.page.url and self.page.locator(f"text={self.MY_PRODUCTS_NAV_TEXT}").count() > 0:
@@ -54,11 +44,5 @@ class AccountSettingsPage(BasePage):
         return self.body_contains(text)
 
     def current_form_values(self) -> dict:
-        return {
-            "first_name": self.page.locator(self.FIRST_NAME_INPUT).input_value(),
-            "last_name": self.page.locator(self.LAST_NAME_INPUT).input_value(),
-            "address": self.page.locator(self.ADDRESS_INPUT).input_value(),
-            "email": self.page.locator(self.EMAIL_INPUT).input_value(),
-            "phone_number": self.page.locator(self.PHONE_NUMBER_INPUT).input_value(),
-        }
+        return {name: state["value"] for name, state in self.element_states(self.FORM_INPUTS).items()}
 
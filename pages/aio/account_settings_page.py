@@ -0,0 +1,46 @@
+from config import Settings
+from pages.aio.base_page import BasePage
+from pages.selectors import AccountSettingsPageSelectors
+
+
+class AccountSettingsPage(AccountSettingsPageSelectors, BasePage):
+    async def open_from_my_products(self) -> None:
+        # Direct /my-products navigation is not stable on GitHub Pages; use current authenticated app page.
+        my_products_nav = self.page.locator(f"text={self.MY_PRODUCTS_NAV_TEXT}")
+        if "account-settings" in self.page.url and await my_products_nav.count() > 0:
+            await self.go_to_my_products()
+        elif "my-products" not in self.page.url:
+            await self.page.goto(Settings.LOGIN_URL, wait_until="domcontentloaded")
+        await self.page.locator(f"text={self.ACCOUNT_SETTINGS_NAV_TEXT}").first.click()
+        await self.page.wait_for_url(Settings.ACCOUNT_SETTINGS_URL)
+
+    async def update_account(
+        self,
+        first_name: str,
+        last_name: str,
+        address: str,
+        email: str,
+        phone_number: str,
+    ) -> None:
+        await self.page.locator(self.FIRST_NAME_INPUT).fill(first_name)
+        await self.page.locator(self.LAST_NAME_INPUT).fill(last_name)
+        await self.page.locator(self.ADDRESS_INPUT).fill(address)
+        await self.page.locator(self.EMAIL_INPUT).fill(email)
+        await self.page.locator(self.PHONE_NUMBER_INPUT).fill(phone_number)
+        await self.page.locator(self.UPDATE_BUTTON).click()
+
+    def is_on_account_settings_page(self) -> bool:
+        return self.page.url == Settings.ACCOUNT_SETTINGS_URL
+
+    async def go_to_my_products(self) -> None:
+        await self.page.locator(f"text={self.MY_PRODUCTS_NAV_TEXT}").first.click()
+        await self.page.wait_for_url(Settings.MY_PRODUCTS_URL)
+
+    async def visible_text(self) -> str:
+        return await self.body_text()
+
+    async def text_visible(self, text: str) -> bool:
+        return await self.body_contains(text)
+
+    async def current_form_values(self) -> dict:
+        return {name: state["value"] for name, state in (await self.element_states(self.FORM_INPUTS)).items()}
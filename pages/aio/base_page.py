@@ -0,0 +1,129 @@
+import warnings
+import weakref
+from typing import TYPE_CHECKING
+
+from config import Settings
+from pages.base_page import (
+    BODY_TEXT_CACHE_STATS,
+    BODY_TEXT_SNAPSHOT_SCRIPT,
+    ELEMENT_STATES_SCRIPT,
+    LOCATOR_STATE_SCRIPT,
+    SETTLE_INSTALL_SCRIPT,
+    SETTLE_WAIT_SCRIPT,
+    SettleTimeoutWarning,
+    needs_playwright_engine,
+)
+from support.web_vitals import VITALS_INSTALL_SCRIPT
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+_SETTLE_READY_PAGES = weakref.WeakSet()
+_BODY_TEXT_SNAPSHOTS: "weakref.WeakKeyDictionary[Page, BodyTextSnapshot]" = weakref.WeakKeyDictionary()
+
+
+class BodyTextSnapshot:
+    # Every read is still one page.evaluate round trip, which compares the documentId:version key in the page.
+    # A hit saves the innerText layout and sending the text back, not the call itself.
+    def __init__(self, page: "Page") -> None:
+        self.key: str | None = None
+        self.text = ""
+        self.hits = 0
+        self.misses = 0
+        page.on("framenavigated", lambda frame: self.invalidate() if frame == page.main_frame else None)
+
+    def invalidate(self) -> None:
+        self.key = None
+
+    async def read(self, page: "Page") -> str:
+        fresh = await page.evaluate(BODY_TEXT_SNAPSHOT_SCRIPT, self.key)
+        if fresh is None:
+            self.hits += 1
+            BODY_TEXT_CACHE_STATS["hits"] += 1
+            BODY_TEXT_CACHE_STATS["chars_not_sent"] += len(self.text)
+            return self.text
+        self.misses += 1
+        BODY_TEXT_CACHE_STATS["misses"] += 1
+        self.key, self.text = fresh["key"], fresh["text"]
+        return self.text
+
+
+class BasePage:
+    # Async page objects are created with `await SomePage.create(page)` so the init scripts are in place
+    # before the first action, mirroring what the sync BasePage does in __init__.
+    def __init__(self, page: "Page") -> None:
+        self.page = page
+        self.page.set_default_timeout(Settings.DEFAULT_TIMEOUT_MS)
+        if page not in _BODY_TEXT_SNAPSHOTS:
+            _BODY_TEXT_SNAPSHOTS[page] = BodyTextSnapshot(page)
+        self.body_text_snapshot = _BODY_TEXT_SNAPSHOTS[page]
+
+    @classmethod
+    async def create(cls, page: "Page", *args, **kwargs):
+        page_object = cls(page, *args, **kwargs)
+        await page_object.prepare()
+        return page_object
+
+    async def prepare(self) -> None:
+        if self.page not in _SETTLE_READY_PAGES:
+            _SETTLE_READY_PAGES.add(self.page)
+            await self.page.add_init_script(SETTLE_INSTALL_SCRIPT)
+            await self.page.add_init_script(VITALS_INSTALL_SCRIPT)
+        await self._install_settle_tracking()
+
+    async def _install_settle_tracking(self) -> None:
+        try:
+            await self.page.evaluate(SETTLE_INSTALL_SCRIPT)
+        except Exception:
+            # Document is mid-navigation; the init script installs tracking on the new one.
+            pass
+
+    async def wait_for_settle(
+        self, container: str = "body", timeout_ms: int | None = None, required: bool = False
+    ) -> None:
+        # A page that is still busy after the timeout warns (and fails the wait when the caller reads results
+        # straight after it), so slow or stuck pages do not pass for settled ones.
+        await self._install_settle_tracking()
+        timeout_ms = timeout_ms if timeout_ms is not None else Settings.SETTLE_TIMEOUT_MS
+        args = {"container": container, "quietMs": Settings.SETTLE_QUIET_MS, "timeoutMs": timeout_ms}
+        try:
+            settled = await self.page.evaluate(SETTLE_WAIT_SCRIPT, args)
+        except Exception:
+            # A full navigation destroyed the execution context while waiting.
+            await self.page.wait_for_load_state("domcontentloaded")
+            settled = await self.page.evaluate(SETTLE_WAIT_SCRIPT, args)
+        if settled:
+            return
+        message = f"{self.page.url}: {container} did not settle within {timeout_ms} ms"
+        if required:
+            raise TimeoutError(message)
+        warnings.warn(message, SettleTimeoutWarning, stacklevel=2)
+
+    async def wait_for_text_visible(self, text: str) -> bool:
+        try:
+            await self.page.get_by_text(text).first.wait_for(state="visible")
+            return True
+        except Exception:
+            return False
+
+    async def element_states(self, selectors: dict[str, str]) -> dict[str, dict]:
+        css = {name: selector for name, selector in selectors.items() if not needs_playwright_engine(selector)}
+        states = await self.page.evaluate(ELEMENT_STATES_SCRIPT, css) if css else {}
+        for name, selector in selectors.items():
+            if name not in css:
+                states[name] = await self.page.locator(selector).evaluate_all(LOCATOR_STATE_SCRIPT)
+        return {name: states[name] for name in selectors}
+
+    async def hidden_elements(self, selectors: dict[str, str]) -> list[str]:
+        return [name for name, state in (await self.element_states(selectors)).items() if not state["visible"]]
+
+    async def body_text(self) -> str:
+        try:
+            return await self.body_text_snapshot.read(self.page)
+        except Exception:
+            # Execution context went away mid-navigation; fall back to an uncached read.
+            self.body_text_snapshot.invalidate()
+            return await self.page.locator("body").inner_text()
+
+    async def body_contains(self, text: str) -> bool:
+        return text in await self.body_text()
@@ -0,0 +1,115 @@
+from typing import AsyncIterator, Callable
+
+from config import Settings
+from pages.aio.base_page import BasePage
+from pages.browse_products_page import NEW_CARDS_SCRIPT
+from pages.selectors import BrowseProductsPageSelectors
+from support.catalog_index import ProductCard
+
+
+class BrowseProductsPage(BrowseProductsPageSelectors, BasePage):
+    async def open_from_my_products(self) -> None:
+        await self.page.get_by_text(self.BROWSE_PRODUCTS_NAV_TEXT).first.click()
+        await self.page.wait_for_url(f"{Settings.BASE_URL}/browse-products")
+
+    def is_on_browse_products_page(self) -> bool:
+        return "/browse-products" in self.page.url
+
+    async def fill_title(self, title: str) -> None:
+        await self.page.locator(self.TITLE_INPUT).fill(title)
+
+    async def choose_category(self, category_name: str) -> None:
+        await self.page.locator(self.CATEGORY_DROPDOWN).click()
+        await self.page.locator(
+            f"{self.CATEGORY_DROPDOWN} {self.CATEGORY_OPTION}",
+            has_text=category_name,
+        ).first.click()
+
+    async def enable_buy_filter(self) -> None:
+        if not await self.page.locator(self.BUY_FILTER_CHECKBOX).is_checked():
+            await self.page.get_by_text(self.BUY_FILTER_LABEL_TEXT, exact=True).first.click()
+
+    async def enable_rent_filter(self) -> None:
+        if not await self.page.locator(self.RENT_FILTER_CHECKBOX).is_checked():
+            await self.page.get_by_text(self.RENT_FILTER_LABEL_TEXT, exact=True).first.click()
+
+    async def disable_buy_filter(self) -> None:
+        if await self.page.locator(self.BUY_FILTER_CHECKBOX).is_checked():
+            await self.page.get_by_text(self.BUY_FILTER_LABEL_TEXT, exact=True).first.click()
+
+    async def disable_rent_filter(self) -> None:
+        if await self.page.locator(self.RENT_FILTER_CHECKBOX).is_checked():
+            await self.page.get_by_text(self.RENT_FILTER_LABEL_TEXT, exact=True).first.click()
+
+    async def set_buy_range(self, min_value: str, max_value: str) -> None:
+        await self.enable_buy_filter()
+        await self.page.locator(self.MIN_BUY_RANGE_INPUT).fill(min_value)
+        await self.page.locator(self.MAX_BUY_RANGE_INPUT).fill(max_value)
+
+    async def set_rent_range(self, min_value: str, max_value: str, duration_type: str) -> None:
+        await self.enable_rent_filter()
+        await self.page.locator(self.MIN_RENT_RANGE_INPUT).fill(min_value)
+        await self.page.locator(self.MAX_RENT_RANGE_INPUT).fill(max_value)
+        await self.page.locator(self.RENT_DURATION_DROPDOWN).click()
+        await self.page.locator(
+            f"{self.RENT_DURATION_DROPDOWN} {self.CATEGORY_OPTION}",
+            has_text=duration_type,
+        ).first.click()
+
+    async def apply_filters(self) -> None:
+        await self.page.get_by_role("button", name=self.FILTER_BUTTON_TEXT).click()
+        await self.wait_for_settle(required=True)
+
+    async def clear_filters(self) -> None:
+        await self.page.get_by_role("button", name=self.CLEAR_BUTTON_TEXT).click()
+        await self.wait_for_settle(required=True)
+
+    async def iter_product_cards(self, limit: int | None = None) -> AsyncIterator[ProductCard]:
+        rows = self.page.locator(self.PRODUCT_ROW)
+        load_more = self.page.get_by_role("button", name=self.LOAD_MORE_BUTTON_TEXT)
+        read = yielded = 0
+        clicked = False
+        while limit is None or yielded < limit:
+            cards = await rows.evaluate_all(NEW_CARDS_SCRIPT, [self.PRODUCT_TITLE_TEXT, read])
+            read += len(cards)
+            for title, text in cards:
+                if not title:
+                    continue
+                yield ProductCard.from_card_text(title, text)
+                yielded += 1
+                if yielded == limit:
+                    return
+            # Stops when there is nothing more to load, or when the last Load More click rendered no new card
+            # (an empty first page still gets one click, so a list that never grows cannot loop forever).
+            if await load_more.count() == 0 or (clicked and not cards):
+                return
+            await load_more.first.click()
+            clicked = True
+            await self.wait_for_settle(required=True)
+
+    async def find_product_card(self, predicate: Callable[[ProductCard], bool]) -> ProductCard | None:
+        async for card in self.iter_product_cards():
+            if predicate(card):
+                return card
+        return None
+
+    # product_titles and product_count read only the cards already rendered, as they always have; the all_*
+    # variants click Load More through every page (pass `limit` to stop early).
+    async def product_titles(self) -> list[str]:
+        cards = await self.page.locator(self.PRODUCT_ROW).evaluate_all(NEW_CARDS_SCRIPT, [self.PRODUCT_TITLE_TEXT, 0])
+        return [title for title, _ in cards if title]
+
+    async def product_count(self) -> int:
+        return len(await self.product_titles())
+
+    async def all_product_cards(self, limit: int | None = None) -> list[ProductCard]:
+        return [card async for card in self.iter_product_cards(limit)]
+
+    async def all_product_titles(self, limit: int | None = None) -> list[str]:
+        return [card.title async for card in self.iter_product_cards(limit)]
+
+    async def all_product_count(self) -> int:
+        return len(await self.all_product_titles())
+
+    async def text_visible(self, text: str) -> bool:
+        return await self.body_contains(text)
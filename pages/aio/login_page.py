@@ -0,0 +1,45 @@
+from config import Settings
+from pages.aio.base_page import BasePage
+from pages.selectors import LoginPageSelectors
+
+
+class LoginPage(LoginPageSelectors, BasePage):
+    async def open(self) -> None:
+        await self.page.goto(Settings.LOGIN_URL, wait_until="domcontentloaded")
+
+    async def login(self, email: str, password: str) -> None:
+        await self.page.locator(self.EMAIL_INPUT).fill(email)
+        await self.page.locator(self.PASSWORD_INPUT).fill(password)
+        await self.page.locator(self.SIGN_IN_BUTTON).click()
+
+    async def sign_up_link_visible(self) -> bool:
+        return await self.page.locator(self.SIGN_UP_LINK).is_visible()
+
+    def is_on_login_page(self) -> bool:
+        return "teebay-buggy" in self.page.url
+
+    async def invalid_credentials_message_visible(self) -> bool:
+        return await self.wait_for_text_visible(self.INVALID_CREDENTIALS_TEXT)
+
+    async def password_required_message_count(self) -> int:
+        return await self.page.get_by_text(self.REQUIRED_PASSWORD_TEXT).count()
+
+    async def text_visible(self, text: str) -> bool:
+        return await self.wait_for_text_visible(text)
+
+    async def my_products_visible(self) -> bool:
+        return await self.wait_for_text_visible(self.MY_PRODUCTS_TEXT)
+
+    async def click_logout(self) -> None:
+        await self.page.get_by_text(self.LOGOUT_NAV_TEXT).first.click()
+
+    async def logout_modal_visible(self) -> bool:
+        return await self.text_visible(self.LOGOUT_MODAL_TEXT)
+
+    async def cancel_logout(self) -> None:
+        await self.page.get_by_role("button", name=self.LOGOUT_CANCEL_BUTTON_TEXT).click()
+        await self.wait_for_settle()
+
+    async def confirm_logout(self) -> None:
+        await self.page.get_by_role("button", name=self.LOGOUT_CONFIRM_BUTTON_TEXT).click()
+        await self.wait_for_settle()
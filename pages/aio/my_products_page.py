@@ -0,0 +1,143 @@
+from typing import TYPE_CHECKING
+
+from config import Settings
+from pages.aio.base_page import BasePage
+from pages.selectors import AddUpdateProductPageSelectors, MyProductsPageSelectors
+from support.catalog_index import CatalogIndex
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+
+class MyProductsPage(MyProductsPageSelectors, BasePage):
+    def __init__(self, page: "Page", catalog: CatalogIndex | None = None) -> None:
+        super().__init__(page)
+        self.catalog = catalog
+        self.pending_delete_title = ""
+
+    async def open(self) -> None:
+        # Avoid direct deep-link loads on GitHub Pages; prefer in-app navbar navigation.
+        if "my-products" in self.page.url:
+            return
+        if await self.page.get_by_text(self.MY_PRODUCTS_NAV_TEXT).count() > 0:
+            await self.page.get_by_text(self.MY_PRODUCTS_NAV_TEXT).first.click()
+            await self.wait_for_settle()
+
+    async def refresh(self) -> None:
+        # Re-renders the list after data changed behind the UI, without a deep-link reload.
+        await self.page.get_by_text(self.BROWSE_PRODUCTS_NAV_TEXT).first.click()
+        await self.wait_for_settle()
+        await self.page.get_by_text(self.MY_PRODUCTS_NAV_TEXT).first.click()
+        await self.page.wait_for_url(Settings.MY_PRODUCTS_URL)
+        await self.wait_for_settle()
+
+    def is_on_my_products_page(self) -> bool:
+        return "my-products" in self.page.url
+
+    async def text_visible(self, text: str) -> bool:
+        return await self.body_contains(text)
+
+    async def product_count(self, product_title: str) -> int:
+        return await self.page.locator(self.PRODUCT_TITLE_TEXT, has_text=product_title).count()
+
+    async def click_delete_for_product(self, product_title: str) -> None:
+        title = self.page.locator(self.PRODUCT_TITLE_TEXT, has_text=product_title)
+        row = self.page.locator(self.PRODUCT_ROW, has=title).first
+        await row.locator(self.DELETE_BUTTON).click()
+        self.pending_delete_title = product_title
+
+    async def delete_modal_visible(self) -> bool:
+        if await self.page.locator(self.DELETE_CONFIRM_MODAL).count() == 0:
+            return False
+        return await self.text_visible(self.DELETE_MODAL_TEXT)
+
+    async def confirm_delete(self) -> None:
+        await self.page.get_by_role("button", name=self.DELETE_CONFIRM_BUTTON_TEXT).click()
+        await self.wait_for_settle()
+        if self.catalog is not None and self.pending_delete_title:
+            self.catalog.remove(self.pending_delete_title)
+        self.pending_delete_title = ""
+
+    async def cancel_delete(self) -> None:
+        await self.page.get_by_role("button", name=self.DELETE_CANCEL_BUTTON_TEXT).click()
+        await self.wait_for_settle()
+
+    async def add_product_nav_visible(self) -> bool:
+        return await self.page.get_by_text(self.ADD_PRODUCT_NAV_TEXT).first.is_visible()
+
+
+class AddUpdateProductPage(AddUpdateProductPageSelectors, BasePage):
+    async def open_from_my_products(self) -> None:
+        my_products_nav = self.page.get_by_text(self.MY_PRODUCTS_NAV_TEXT)
+        if "my-products" not in self.page.url and await my_products_nav.count() > 0:
+            await my_products_nav.first.click()
+            await self.wait_for_settle()
+        await self.page.get_by_text(self.ADD_PRODUCT_NAV_TEXT).first.click()
+        await self.page.wait_for_url(f"{Settings.BASE_URL}/add-product")
+
+    async def choose_category(self, category_name: str) -> None:
+        await self.page.locator(self.CATEGORIES_DROPDOWN).click()
+        await self.page.locator(
+            f"{self.CATEGORIES_DROPDOWN} {self.CATEGORY_OPTION}", has_text=category_name
+        ).first.click()
+
+    async def choose_rent_duration(self, rent_duration_type: str) -> None:
+        await self.page.locator(self.RENT_DURATION_DROPDOWN).click()
+        await self.page.locator(
+            f"{self.RENT_DURATION_DROPDOWN} {self.CATEGORY_OPTION}",
+            has_text=rent_duration_type,
+        ).first.click()
+
+    async def fill_form(
+        self,
+        title: str,
+        description: str,
+        purchase_price: str,
+        rent_price: str,
+    ) -> None:
+        await self.page.locator(self.TITLE_INPUT).fill(title)
+        await self.page.locator(self.DESCRIPTION_INPUT).fill(description)
+        await self.page.locator(self.PURCHASE_PRICE_INPUT).fill(purchase_price)
+        await self.page.locator(self.RENT_PRICE_INPUT).fill(rent_price)
+
+    async def submit(self) -> None:
+        await self.page.locator(self.SUBMIT_BUTTON).click()
+
+    async def submit_product(
+        self,
+        title: str,
+        description: str,
+        purchase_price: str,
+        rent_price: str,
+        category: str,
+        rent_duration_type: str,
+    ) -> None:
+        await self.fill_form(title, description, purchase_price, rent_price)
+        await self.choose_category(category)
+        await self.choose_rent_duration(rent_duration_type)
+        await self.submit()
+
+    def is_on_add_product_page(self) -> bool:
+        return self.page.url.endswith("/add-product")
+
+    def is_on_edit_product_page(self) -> bool:
+        return "/edit-product/" in self.page.url
+
+    async def go_to_my_products(self) -> None:
+        await self.page.get_by_text(self.MY_PRODUCTS_NAV_TEXT).first.click()
+        await self.page.wait_for_url(Settings.MY_PRODUCTS_URL)
+
+    async def open_existing_product_for_update(self, product_title_contains: str) -> None:
+        if "my-products" not in self.page.url:
+            await self.page.goto(Settings.MY_PRODUCTS_URL, wait_until="domcontentloaded")
+        product_title = self.page.locator(self.PRODUCT_TITLE_TEXT, has_text=product_title_contains).first
+        if await product_title.count() == 0:
+            raise ValueError(f"Product not found for update: {product_title_contains}")
+        await product_title.click()
+        await self.page.wait_for_url("**/edit-product/**")
+
+    async def text_visible(self, text: str) -> bool:
+        return await self.body_contains(text)
+
+    async def product_visible_on_my_products(self, product_title: str) -> bool:
+        return await self.text_visible(product_title)
@@ -0,0 +1,41 @@
+from config import Settings
+from pages.aio.base_page import BasePage
+from pages.selectors import RegistrationPageSelectors
+
+
+class RegistrationPage(RegistrationPageSelectors, BasePage):
+    async def open_from_login(self) -> None:
+        await self.page.goto(Settings.LOGIN_URL, wait_until="domcontentloaded")
+        await self.page.get_by_role("link", name="Sign Up").click()
+        await self.page.wait_for_load_state("domcontentloaded")
+
+    async def register(
+        self,
+        first_name: str,
+        last_name: str,
+        address: str,
+        email: str,
+        phone_number: str,
+        password: str,
+        confirm_password: str,
+    ) -> None:
+        await self.page.locator(self.FIRST_NAME_INPUT).fill(first_name)
+        await self.page.locator(self.LAST_NAME_INPUT).fill(last_name)
+        await self.page.locator(self.ADDRESS_INPUT).fill(address)
+        await self.page.locator(self.EMAIL_INPUT).fill(email)
+        await self.page.locator(self.PHONE_NUMBER_INPUT).fill(phone_number)
+        await self.page.locator(self.PASSWORD_INPUT).fill(password)
+        await self.page.locator(self.CONFIRM_PASSWORD_INPUT).fill(confirm_password)
+        await self.page.locator(self.REGISTER_BUTTON).click()
+
+    def is_on_registration_page(self) -> bool:
+        return "/register" in self.page.url
+
+    async def text_visible(self, text: str) -> bool:
+        return await self.wait_for_text_visible(text)
+
+    async def any_text_visible(self, texts: list[str]) -> bool:
+        for text in texts:
+            if await self.text_visible(text):
+                return True
+        return False
@@ -0,0 +1,182 @@
+import re
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, AsyncIterator
+
+from config import Settings
+from pages.aio.base_page import BasePage
+from pages.selectors import ViewProductPageSelectors
+from pages.view_product_page import IN_APP_NAVIGATE_SCRIPT
+from support.catalog_index import CatalogEntry, CatalogIndex
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+
+class ViewProductPage(ViewProductPageSelectors, BasePage):
+    def __init__(self, page: "Page", catalog: CatalogIndex | None = None) -> None:
+        super().__init__(page)
+        self.catalog = catalog if catalog is not None else CatalogIndex()
+        self.current_title = ""
+
+    async def open_browse_products(self) -> None:
+        await self.page.get_by_text(self.BROWSE_PRODUCTS_NAV_TEXT).first.click()
+        await self.page.wait_for_url(f"{Settings.BASE_URL}/browse-products")
+        clear_button = self.page.get_by_role("button", name=self.CLEAR_BUTTON_TEXT)
+        if await clear_button.count() > 0:
+            await clear_button.first.click()
+            await self.wait_for_settle()
+
+    async def choose_category_and_filter(self, category_name: str) -> None:
+        await self.page.locator(self.CATEGORY_DROPDOWN).click()
+        await self.page.locator(
+            f"{self.CATEGORY_DROPDOWN} {self.CATEGORY_OPTION}",
+            has_text=category_name,
+        ).first.click()
+        await self.page.get_by_role("button", name=self.FILTER_BUTTON_TEXT).click()
+        await self.wait_for_settle()
+
+    async def open_product_by_title(self, product_title: str, category: str | None = None) -> None:
+        entry = self.catalog.get(product_title)
+        if entry is None or not entry.is_visited or not await self._navigate_in_app(entry.url, product_title):
+            await self._open_product_from_browse_list(product_title, category)
+        self.current_title = product_title
+        await self._record_current_product()
+
+    async def _open_product_from_browse_list(self, product_title: str, category: str | None = None) -> None:
+        await self.open_browse_products()
+        if category:
+            await self.choose_category_and_filter(category)
+        product_title_locator = self.page.locator(self.PRODUCT_TITLE_TEXT, has_text=product_title)
+        rows = self.page.locator(self.PRODUCT_ROW)
+        while await product_title_locator.count() == 0:
+            if not await self._show_browse_rows(await rows.count() + 1):
+                raise ValueError(f"Product not found in browse list: {product_title}")
+        await product_title_locator.first.click()
+        await self.wait_for_settle()
+
+    async def _show_browse_rows(self, count: int) -> bool:
+        rows = self.page.locator(self.PRODUCT_ROW)
+        load_more = self.page.get_by_role("button", name=self.LOAD_MORE_BUTTON_TEXT)
+        shown = await rows.count()
+        while shown < count and await load_more.count() > 0:
+            await load_more.first.click()
+            await self.wait_for_settle(required=True)
+            shown, previous = await rows.count(), shown
+            if shown == previous:
+                break
+        return shown >= count
+
+    async def _navigate_in_app(self, url: str, product_title: str) -> bool:
+        try:
+            await self.page.evaluate(IN_APP_NAVIGATE_SCRIPT, url)
+            await self.wait_for_settle()
+        except Exception:
+            return False
+        return self.page.url == url and await self.body_contains(product_title)
+
+    async def _record_current_product(self) -> CatalogEntry:
+        return self.catalog.record_visit(
+            self.current_title,
+            url=self.page.url,
+            status=await self.status_text(),
+            owned=await self.is_owned_by_logged_user(),
+            can_buy=await self.buy_button_visible(),
+            can_rent=await self.rent_button_visible(),
+        )
+
+    async def _index_browse_list(self) -> AsyncIterator[CatalogEntry]:
+        await self.open_browse_products()
+        rows = self.page.locator(self.PRODUCT_ROW)
+        position = 0
+        while await self._show_browse_rows(position + 1):
+            row = rows.nth(position)
+            position += 1
+            title_locator = row.locator(self.PRODUCT_TITLE_TEXT).first
+            title = (await title_locator.inner_text()).strip() if await title_locator.count() else ""
+            if not title or self.catalog.upsert(CatalogEntry.from_card_text(title, await row.inner_text())).is_visited:
+                continue
+            await title_locator.click()
+            await self.wait_for_settle()
+            self.current_title = title
+            yield await self._record_current_product()
+            await self.open_browse_products()
+        self.catalog.complete = True
+
+    async def index_catalog(self) -> CatalogIndex:
+        async for _ in self._index_browse_list():
+            pass
+        return self.catalog
+
+    async def open_first_available_non_owned_product(self) -> str:
+        entry = self.catalog.first_available()
+        while entry is not None:
+            await self.open_product_by_title(entry.title)
+            if self.catalog.get(entry.title).is_available_to_user:
+                return entry.title
+            entry = self.catalog.first_available()
+        if not self.catalog.complete:
+            async for entry in self._index_browse_list():
+                if entry.is_available_to_user:
+                    return entry.title
+
+        raise RuntimeError("No available non-owned product found with Buy/Rent actions.")
+
+    async def status_text(self) -> str:
+        body = await self.body_text()
+        match = re.search(r"Status:\s*([A-Za-z]+)", body, flags=re.IGNORECASE)
+        if not match:
+            return ""
+        return match.group(1).strip()
+
+    async def is_owned_by_logged_user(self) -> bool:
+        body = (await self.body_text()).lower()
+        return "you own this product" in body or "you own the product" in body
+
+    async def buy_button_visible(self) -> bool:
+        return await self.page.get_by_role("button", name=self.BUY_BUTTON_TEXT).count() > 0
+
+    async def rent_button_visible(self) -> bool:
+        return await self.page.get_by_role("button", name=self.RENT_BUTTON_TEXT).count() > 0
+
+    async def open_buy_modal(self) -> None:
+        await self.page.get_by_role("button", name=self.BUY_BUTTON_TEXT).click()
+        await self.page.locator(self.MODAL_SELECTOR).wait_for(state="visible")
+
+    async def confirm_buy(self) -> None:
+        await self.page.get_by_role("button", name=self.BUY_CONFIRM_BUTTON_TEXT).click()
+        await self.wait_for_settle()
+        await self._refresh_catalog_status()
+
+    async def cancel_buy(self) -> None:
+        await self.page.get_by_role("button", name=self.BUY_CANCEL_BUTTON_TEXT).click()
+        await self.wait_for_settle()
+
+    async def open_rent_modal(self) -> None:
+        await self.page.get_by_role("button", name=self.RENT_BUTTON_TEXT).click()
+        await self.page.locator(self.MODAL_SELECTOR).wait_for(state="visible")
+
+    async def set_rent_dates(self, start_date: str, end_date: str) -> None:
+        await self.page.locator(self.START_DATE_INPUT).fill(start_date)
+        await self.page.locator(self.END_DATE_INPUT).fill(end_date)
+
+    async def set_rent_dates_from_offsets(self, start_offset_days: int, end_offset_days: int) -> None:
+        today = date.today()
+        start_date = str(today + timedelta(days=start_offset_days))
+        end_date = str(today + timedelta(days=end_offset_days))
+        await self.set_rent_dates(start_date, end_date)
+
+    async def book_rent(self) -> None:
+        await self.page.get_by_role("button", name=self.RENT_BOOK_BUTTON_TEXT).click()
+        await self.wait_for_settle()
+        await self._refresh_catalog_status()
+
+    async def _refresh_catalog_status(self) -> None:
+        if self.current_title:
+            self.catalog.update_status(self.current_title, await self.status_text())
+
+    async def cancel_rent(self) -> None:
+        await self.page.get_by_role("button", name=self.RENT_CANCEL_BUTTON_TEXT).click()
+        await self.wait_for_settle()
+
+    async def rent_book_button_disabled(self) -> bool:
+        return await self.page.get_by_role("button", name=self.RENT_BOOK_BUTTON_TEXT).is_disabled()
@@ -1,12 +1,199 @@
-from playwright.sync_api import Page
+import warnings
+import weakref
+from typing import TYPE_CHECKING
 
 from config import Settings
+from support.action_timing import TIMER, CountingProxy, instrument_methods
+from support.web_vitals import VITALS_INSTALL_SCRIPT
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+
+class SettleTimeoutWarning(UserWarning):
+    pass
+
+# Installed on every document: tracks in-flight fetch/XHR calls, the time of the last DOM mutation and a
+# version counter bumped by every mutation, click or input so cached snapshots can tell they are stale.
+SETTLE_INSTALL_SCRIPT = """
+(() => {
+  if (window.__teebaySettle) return;
+  const state = {
+    pending: 0,
+    lastMutation: performance.now(),
+    documentId: Math.random().toString(36).slice(2),
+    version: 0,
+  };
+  window.__teebaySettle = state;
+  if (window.fetch) {
+    const originalFetch = window.fetch;
+    window.fetch = function (...args) {
+      state.pending += 1;
+      return originalFetch.apply(this, args).finally(() => { state.pending -= 1; });
+    };
+  }
+  const originalSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function (...args) {
+    state.pending += 1;
+    this.addEventListener("loadend", () => { state.pending -= 1; }, { once: true });
+    return originalSend.apply(this, args);
+  };
+  const touch = () => { state.version += 1; };
+  new MutationObserver(() => { state.lastMutation = performance.now(); touch(); })
+    .observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+  for (const type of ["click", "input", "change"]) document.addEventListener(type, touch, true);
+})();
+"""
+
+# Resolves true once there are no pending requests, no Semantic UI transition is animating and the
+# container has been mutation-free for quietMs; resolves false when timeoutMs runs out instead.
+SETTLE_WAIT_SCRIPT = """
+async ({ container, quietMs, timeoutMs }) => {
+  const state = window.__teebaySettle;
+  const start = performance.now();
+  const root = document.querySelector(container) || document.documentElement;
+  let lastMutation = state ? Math.max(state.lastMutation, start) : start;
+  const observer = new MutationObserver(() => { lastMutation = performance.now(); });
+  observer.observe(root, { subtree: true, childList: true, attributes: true, characterData: true });
+  const animating = () => document.querySelector(".ui.modal.animating, .ui.dimmer.animating, .transition.animating");
+  try {
+    while (true) {
+      const now = performance.now();
+      if ((!state || state.pending <= 0) && !animating() && now - lastMutation >= quietMs) return true;
+      if (now - start >= timeoutMs) return false;
+      await new Promise((resolve) => setTimeout(resolve, 16));
+    }
+  } finally {
+    observer.disconnect();
+  }
+}
+"""
+
+# Returns null when the snapshot identified by key is still current, otherwise the fresh text and key.
+BODY_TEXT_SNAPSHOT_SCRIPT = """
+(key) => {
+  const state = window.__teebaySettle;
+  const current = state ? `${state.documentId}:${state.version}` : null;
+  if (current !== null && current === key) return null;
+  return { key: current, text: document.body ? document.body.innerText : "" };
+}
+"""
+
+# State of the first of a list of elements: count, visibility, text, value and disabled flag.
+_ELEMENT_STATE_JS = """
+  const visible = (element) => {
+    const rect = element.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0 && getComputedStyle(element).visibility !== "hidden";
+  };
+  const elementState = (elements) => {
+    const first = elements[0];
+    return {
+      count: elements.length,
+      visible: first ? visible(first) : false,
+      text: first ? first.innerText || first.textContent || "" : "",
+      value: first && "value" in first ? String(first.value) : "",
+      disabled: first ? first.matches(":disabled") || first.getAttribute("aria-disabled") === "true" : false,
+    };
+  };
+"""
+# Every plain CSS selector of a name -> selector mapping in one evaluation.
+ELEMENT_STATES_SCRIPT = f"""
+(selectors) => {{{_ELEMENT_STATE_JS}  return Object.fromEntries(
+    Object.entries(selectors).map(([name, selector]) => [name, elementState([...document.querySelectorAll(selector)])])
+  );
+}}
+"""
+# The same state for elements Playwright already resolved (locator.evaluate_all).
+LOCATOR_STATE_SCRIPT = f"""
+(elements) => {{{_ELEMENT_STATE_JS}  return elementState(elements);
+}}
+"""
+PLAYWRIGHT_SELECTOR_MARKERS = ("text=", "role=", ">>", ":has-text(", ":text(", ":text-is(", ":text-matches(", ":visible")
+
+
+def needs_playwright_engine(selector: str) -> bool:
+    # Text and role selectors follow Playwright's matching rules (quoted text is exact and case-sensitive,
+    # unquoted text is a normalized substring), which document.querySelectorAll cannot reproduce.
+    return any(marker in selector for marker in PLAYWRIGHT_SELECTOR_MARKERS)
+
+
+_SETTLE_READY_PAGES = weakref.WeakSet()
+_BODY_TEXT_SNAPSHOTS: "weakref.WeakKeyDictionary[Page, BodyTextSnapshot]" = weakref.WeakKeyDictionary()
+BODY_TEXT_CACHE_STATS = {"hits": 0, "misses": 0, "chars_not_sent": 0}
+
+
+class BodyTextSnapshot:
+    # Every read is still one page.evaluate round trip, which compares the documentId:version key in the page.
+    # A hit saves the innerText layout and sending the text back, not the call itself.
+    def __init__(self, page: "Page") -> None:
+        self.key: str | None = None
+        self.text = ""
+        self.hits = 0
+        self.misses = 0
+        page.on("framenavigated", lambda frame: self.invalidate() if frame == page.main_frame else None)
+
+    def invalidate(self) -> None:
+        self.key = None
+
+    def read(self, page: "Page") -> str:
+        fresh = page.evaluate(BODY_TEXT_SNAPSHOT_SCRIPT, self.key)
+        if fresh is None:
+            self.hits += 1
+            BODY_TEXT_CACHE_STATS["hits"] += 1
+            BODY_TEXT_CACHE_STATS["chars_not_sent"] += len(self.text)
+            return self.text
+        self.misses += 1
+        BODY_TEXT_CACHE_STATS["misses"] += 1
+        self.key, self.text = fresh["key"], fresh["text"]
+        return self.text
 
 
 class BasePage:
-    def __init__(self, page: Page) -> None:
+    def __init__(self, page: "Page") -> None:
         self.page = page
         self.page.set_default_timeout(Settings.DEFAULT_TIMEOUT_MS)
+        if page not in _SETTLE_READY_PAGES:
+            self.page.add_init_script(SETTLE_INSTALL_SCRIPT)
+            self.page.add_init_script(VITALS_INSTALL_SCRIPT)
+            _SETTLE_READY_PAGES.add(page)
+        self._install_settle_tracking()
+        if page not in _BODY_TEXT_SNAPSHOTS:
+            _BODY_TEXT_SNAPSHOTS[page] = BodyTextSnapshot(page)
+        self.body_text_snapshot = _BODY_TEXT_SNAPSHOTS[page]
+        if TIMER.enabled:
+            self.page = CountingProxy(page)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        instrument_methods(cls)
+
+    def _install_settle_tracking(self) -> None:
+        try:
+            self.page.evaluate(SETTLE_INSTALL_SCRIPT)
+        except Exception:
+            # Document is mid-navigation; the init script installs tracking on the new one.
+            pass
+
+    def wait_for_settle(
+        self, container: str = "body", timeout_ms: int | None = None, required: bool = False
+    ) -> None:
+        # A page that is still busy after the timeout warns (and fails the wait when the caller reads results
+        # straight after it), so slow or stuck pages do not pass for settled ones.
+        self._install_settle_tracking()
+        timeout_ms = timeout_ms if timeout_ms is not None else Settings.SETTLE_TIMEOUT_MS
+        args = {"container": container, "quietMs": Settings.SETTLE_QUIET_MS, "timeoutMs": timeout_ms}
+        try:
+            settled = self.page.evaluate(SETTLE_WAIT_SCRIPT, args)
+        except Exception:
+            # A full navigation destroyed the execution context while waiting.
+            self.page.wait_for_load_state("domcontentloaded")
+            settled = self.page.evaluate(SETTLE_WAIT_SCRIPT, args)
+        if settled:
+            return
+        message = f"{self.page.url}: {container} did not settle within {timeout_ms} ms"
+        if required:
+            raise TimeoutError(message)
+        warnings.warn(message, SettleTimeoutWarning, stacklevel=2)
 
     def wait_for_text_visible(self, text: str) -> bool:
         try:
@@ -15,8 +202,27 @@ class BasePage:
         except Exception:
             return False
 
+    def element_states(self, selectors: dict[str, str]) -> dict[str, dict]:
+        css = {name: selector for name, selector in selectors.items() if not needs_playwright_engine(selector)}
+        states = self.page.evaluate(ELEMENT_STATES_SCRIPT, css) if css else {}
+        for name, selector in selectors.items():
+            if name not in css:
+                states[name] = self.page.locator(selector).evaluate_all(LOCATOR_STATE_SCRIPT)
+        return {name: states[name] for name in selectors}
+
+    def hidden_elements(self, selectors: dict[str, str]) -> list[str]:
+        return [name for name, state in self.element_states(selectors).items() if not state["visible"]]
+
     def body_text(self) -> str:
-        return self.page.locator("body").inner_text()
+        try:
+            return self.body_text_snapshot.read(self.page)
+        except Exception:
+            # Execution context went away mid-navigation; fall back to an uncached read.
+            self.body_text_snapshot.invalidate()
+            return self.page.locator("body").inner_text()
 
     def body_contains(self, text: str) -> bool:
         return text in self.body_text()
+
+
+instrument_methods(BasePage)
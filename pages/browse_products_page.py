@@ -1,33 +1,22 @@
+from typing import Callable, Iterator
+
 from config import Settings
 from pages.base_page import BasePage
+from pages.selectors import BrowseProductsPageSelectors
+from support.catalog_index import ProductCard
+from support.web_vitals import measured
 
+# Title and text of the cards after the first `offset` rows; rows read before are not sent again.
+NEW_CARDS_SCRIPT = """
+(rows, [titleSelector, offset]) => rows.slice(offset).map((row) => {
+  const title = row.querySelector(titleSelector);
+  return [title ? title.innerText.trim() : "", row.innerText];
+})
+"""
 
-class BrowseProductsPage(BasePage):
-    BROWSE_PRODUCTS_NAV_TEXT = "Browse Products"
-
-    TITLE_INPUT = "input[name='title']"
-    CATEGORY_DROPDOWN = "div[name='category']"
-    CATEGORY_OPTION = "div[role='option']"
-
-    BUY_FILTER_CHECKBOX = "input[name='is_buy_filter_turned_on']"
-    RENT_FILTER_CHECKBOX = "input[name='is_rent_filter_turned_on']"
-
-    BUY_FILTER_LABEL_TEXT = "Buy Filters"
-    RENT_FILTER_LABEL_TEXT = "Rent Filters"
-
-    MIN_BUY_RANGE_INPUT = "input[name='min_buy_range']"
-    MAX_BUY_RANGE_INPUT = "input[name='max_buy_range']"
-
-    MIN_RENT_RANGE_INPUT = "input[name='min_rent_range']"
-    MAX_RENT_RANGE_INPUT = "input[name='max_rent_range']"
-    RENT_DURATION_DROPDOWN = "div[name='rent_duration_type']"
-
-    CLEAR_BUTTON_TEXT = "Clear"
-    FILTER_BUTTON_TEXT = "Filter"
-    LOAD_MORE_BUTTON_TEXT = "Load More"
-
-    PRODUCT_TITLE_TEXT = "div.sc-hKwDye"
 
+class BrowseProductsPage(BrowseProductsPageSelectors, BasePage):
+    @measured("browse_products")
     def open_from_my_products(self) -> None:
         self.page.get_by_text(self.BROWSE_PRODUCTS_NAV_TEXT).first.click()
         self.page.wait_for_url(f"{Settings.BASE_URL}/browse-products")
@@ -53,6 +42,14 @@ class BrowseProductsPage(BasePage):
         if not self.page.locator(self.RENT_FILTER_CHECKBOX).is_checked():
             self.page.get_by_text(self.RENT_FILTER_LABEL_TEXT, exact=True).first.click()
 
+    def disable_buy_filter(self) -> None:
+        if self.page.locator(self.BUY_FILTER_CHECKBOX).is_checked():
+            self.page.get_by_text(self.BUY_FILTER_LABEL_TEXT, exact=True).first.click()
+
+    def disable_rent_filter(self) -> None:
+        if self.page.locator(self.RENT_FILTER_CHECKBOX).is_checked():
+            self.page.get_by_text(self.RENT_FILTER_LABEL_TEXT, exact=True).first.click()
+
     def set_buy_range(self, min_value: str, max_value: str) -> None:
         self.enable_buy_filter()
         self.page.locator(self.MIN_BUY_RANGE_INPUT).fill(min_value)
@@ -70,18 +67,58 @@ class BrowseProductsPage(BasePage):
 
     def apply_filters(self) -> None:
         self.page.get_by_role("button", name=self.FILTER_BUTTON_TEXT).click()
-        self.page.wait_for_timeout(800)
+        self.wait_for_settle(required=True)
 
     def clear_filters(self) -> None:
         self.page.get_by_role("button", name=self.CLEAR_BUTTON_TEXT).click()
-        self.page.wait_for_timeout(600)
-
+        self.wait_for_settle(required=True)
+
+    def iter_product_cards(self, limit: int | None = None) -> Iterator[ProductCard]:
+        # Yields the rendered cards in list order and clicks Load More only after the consumer has taken
+        # every card on screen, so breaking out of the loop (or `limit`) leaves later pages unloaded.
+        rows = self.page.locator(self.PRODUCT_ROW)
+        load_more = self.page.get_by_role("button", name=self.LOAD_MORE_BUTTON_TEXT)
+        read = yielded = 0
+        clicked = False
+        while limit is None or yielded < limit:
+            cards = rows.evaluate_all(NEW_CARDS_SCRIPT, [self.PRODUCT_TITLE_TEXT, read])
+            read += len(cards)
+            for title, text in cards:
+                if not title:
+                    continue
+                yield ProductCard.from_card_text(title, text)
+                yielded += 1
+                if yielded == limit:
+                    return
+            # Stops when there is nothing more to load, or when the last Load More click rendered no new card
+            # (an empty first page still gets one click, so a list that never grows cannot loop forever).
+            if load_more.count() == 0 or (clicked and not cards):
+                return
+            load_more.first.click()
+            clicked = True
+            self.wait_for_settle(required=True)
+
+    def find_product_card(self, predicate: Callable[[ProductCard], bool]) -> ProductCard | None:
+        return next((card for card in self.iter_product_cards() if predicate(card)), None)
+
+    # product_titles and product_count read only the cards already rendered, as they always have; the all_*
+    # variants click Load More through every page (pass `limit` to stop early).
     def product_titles(self) -> list[str]:
-        return [title.strip() for title in self.page.locator(self.PRODUCT_TITLE_TEXT).all_text_contents() if title.strip()]
+        cards = self.page.locator(self.PRODUCT_ROW).evaluate_all(NEW_CARDS_SCRIPT, [self.PRODUCT_TITLE_TEXT, 0])
+        return [title for title, _ in cards if title]
 
     def product_count(self) -> int:
         return len(self.product_titles())
 
+    def all_product_cards(self, limit: int | None = None) -> list[ProductCard]:
+        return list(self.iter_product_cards(limit))
+
+    def all_product_titles(self, limit: int | None = None) -> list[str]:
+        return [card.title for card in self.iter_product_cards(limit)]
+
+    def all_product_count(self) -> int:
+        return len(self.all_product_titles())
+
     def text_visible(self, text: str) -> bool:
         return self.body_contains(text)
 
@@ -1,23 +1,11 @@
-from playwright.sync_api import Page
-
 from config import Settings
 from pages.base_page import BasePage
+from pages.selectors import LoginPageSelectors
+from support.web_vitals import measured
 
 
-class LoginPage(BasePage):
-    EMAIL_INPUT = "input[name='email']"
-    PASSWORD_INPUT = "input[name='password']"
-    SIGN_IN_BUTTON = "button:has-text('Sign In')"
-    SIGN_UP_LINK = "a[href='/register']"
-    REQUIRED_PASSWORD_TEXT = "Password is required"
-    INVALID_CREDENTIALS_TEXT = "Incorrect username or password. Please try again!"
-    INVALID_EMAIL_FORMAT_TEXT = "Please enter a valid email address"
-    MY_PRODUCTS_TEXT = "My Products"
-    LOGOUT_NAV_TEXT = "Logout"
-    LOGOUT_MODAL_TEXT = "Are you sure you want to log out?"
-    LOGOUT_CANCEL_BUTTON_TEXT = "Cancel"
-    LOGOUT_CONFIRM_BUTTON_TEXT = "Yes I am sure!"
-
+class LoginPage(LoginPageSelectors, BasePage):
+    @measured("login")
     def open(self) -> None:
         self.page.goto(Settings.LOGIN_URL, wait_until="domcontentloaded")
 
@@ -52,7 +40,9 @@ class LoginPage(BasePage):
 
     def cancel_logout(self) -> None:
         self.page.get_by_role("button", name=self.LOGOUT_CANCEL_BUTTON_TEXT).click()
+        self.wait_for_settle()
 
     def confirm_logout(self) -> None:
         self.page.get_by_role("button", name=self.LOGOUT_CONFIRM_BUTTON_TEXT).click()
+        self.wait_for_settle()
 
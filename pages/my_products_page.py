@@ -1,18 +1,19 @@
+from typing import TYPE_CHECKING
+
 from config import Settings
 from pages.base_page import BasePage
+from pages.selectors import AddUpdateProductPageSelectors, MyProductsPageSelectors
+from support.catalog_index import CatalogIndex
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
 
 
-class MyProductsPage(BasePage):
-    PAGE_HEADING_TEXT = "My Products"
-    MY_PRODUCTS_NAV_TEXT = "My Products"
-    PRODUCT_TITLE_TEXT = "div.sc-hKwDye"
-    PRODUCT_ROW = "div.sc-jrQzAO"
-    DELETE_BUTTON = "button.ui.icon.button"
-    ADD_PRODUCT_NAV_TEXT = "Add Product"
-    DELETE_CONFIRM_MODAL = "div.ui.modal.transition.visible.active"
-    DELETE_MODAL_TEXT = "Are you sure you want to delete this product?"
-    DELETE_CONFIRM_BUTTON_TEXT = "Yes, delete"
-    DELETE_CANCEL_BUTTON_TEXT = "Cancel"
+class MyProductsPage(MyProductsPageSelectors, BasePage):
+    def __init__(self, page: "Page", catalog: CatalogIndex | None = None) -> None:
+        super().__init__(page)
+        self.catalog = catalog
+        self.pending_delete_title = ""
 
     def open(self) -> None:
         # Avoid direct deep-link loads on GitHub Pages; prefer in-app navbar navigation.
@@ -20,7 +21,15 @@ class MyProductsPage(BasePage):
             return
         if self.page.get_by_text(self.MY_PRODUCTS_NAV_TEXT).count() > 0:
             self.page.get_by_text(self.MY_PRODUCTS_NAV_TEXT).first.click()
-            self.page.wait_for_timeout(800)
+            self.wait_for_settle()
+
+    def refresh(self) -> None:
+        # Re-renders the list after data changed behind the UI, without a deep-link reload.
+        self.page.get_by_text(self.BROWSE_PRODUCTS_NAV_TEXT).first.click()
+        self.wait_for_settle()
+        self.page.get_by_text(self.MY_PRODUCTS_NAV_TEXT).first.click()
+        self.page.wait_for_url(Settings.MY_PRODUCTS_URL)
+        self.wait_for_settle()
 
     def is_on_my_products_page(self) -> bool:
         return "my-products" in self.page.url
@@ -34,41 +43,31 @@ class MyProductsPage(BasePage):
     def click_delete_for_product(self, product_title: str) -> None:
         row = self.page.locator(self.PRODUCT_ROW, has=self.page.locator(self.PRODUCT_TITLE_TEXT, has_text=product_title)).first
         row.locator(self.DELETE_BUTTON).click()
+        self.pending_delete_title = product_title
 
     def delete_modal_visible(self) -> bool:
         return self.page.locator(self.DELETE_CONFIRM_MODAL).count() > 0 and self.text_visible(self.DELETE_MODAL_TEXT)
 
     def confirm_delete(self) -> None:
         self.page.get_by_role("button", name=self.DELETE_CONFIRM_BUTTON_TEXT).click()
+        self.wait_for_settle()
+        if self.catalog is not None and self.pending_delete_title:
+            self.catalog.remove(self.pending_delete_title)
+        self.pending_delete_title = ""
 
     def cancel_delete(self) -> None:
         self.page.get_by_role("button", name=self.DELETE_CANCEL_BUTTON_TEXT).click()
+        self.wait_for_settle()
 
     def add_product_nav_visible(self) -> bool:
         return self.page.get_by_text(self.ADD_PRODUCT_NAV_TEXT).first.is_visible()
 
 
-class AddUpdateProductPage(BasePage):
-    MY_PRODUCTS_NAV_TEXT = "My Products"
-    ADD_PRODUCT_NAV_TEXT = "Add Product"
-    PAGE_HEADING_TEXT = "ADD PRODUCT"
-    EDIT_PAGE_HEADING_TEXT = "EDIT PRODUCT"
-
-    TITLE_INPUT = "input[name='title']"
-    DESCRIPTION_INPUT = "textarea[name='description']"
-    PURCHASE_PRICE_INPUT = "input[name='purchase_price']"
-    RENT_PRICE_INPUT = "input[name='rent_price']"
-    CATEGORIES_DROPDOWN = "div[name='categories']"
-    RENT_DURATION_DROPDOWN = "div[name='rent_duration_type']"
-    CATEGORY_OPTION = "div[role='option']"
-    SUBMIT_BUTTON = "button:has-text('Add Product')"
-
-    NEED_OPTION_TEXT = "Need to select an option"
-
+class AddUpdateProductPage(AddUpdateProductPageSelectors, BasePage):
     def open_from_my_products(self) -> None:
         if "my-products" not in self.page.url and self.page.get_by_text(self.MY_PRODUCTS_NAV_TEXT).count() > 0:
             self.page.get_by_text(self.MY_PRODUCTS_NAV_TEXT).first.click()
-            self.page.wait_for_timeout(800)
+            self.wait_for_settle()
         self.page.get_by_text(self.ADD_PRODUCT_NAV_TEXT).first.click()
         self.page.wait_for_url(f"{Settings.BASE_URL}/add-product")
 
@@ -125,7 +124,7 @@ class AddUpdateProductPage(BasePage):
     def open_existing_product_for_update(self, product_title_contains: str) -> None:
         if "my-products" not in self.page.url:
             self.page.goto(Settings.MY_PRODUCTS_URL, wait_until="domcontentloaded")
-        product_title = self.page.locator("div.sc-hKwDye", has_text=product_title_contains).first
+        product_title = self.page.locator(self.PRODUCT_TITLE_TEXT, has_text=product_title_contains).first
         if product_title.count() == 0:
             raise ValueError(f"Product not found for update: {product_title_contains}")
         product_title.click()
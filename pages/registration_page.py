@@ -1,27 +1,9 @@
 from config import Settings
 from pages.base_page import BasePage
+from pages.selectors import RegistrationPageSelectors
 
 
-class RegistrationPage(BasePage):
-    FIRST_NAME_INPUT = "input[name='firstName']"
-    LAST_NAME_INPUT = "input[name='lastName']"
-    ADDRESS_INPUT = "input[name='address']"
-    EMAIL_INPUT = "input[name='email']"
-    PHONE_NUMBER_INPUT = "input[name='phoneNumber']"
-    PASSWORD_INPUT = "input[name='password']"
-    CONFIRM_PASSWORD_INPUT = "input[name='confirmPassword']"
-    REGISTER_BUTTON = "button:has-text('Register')"
-    SIGN_IN_LINK = "a[href='/signin']"
-
-    INVALID_EMAIL_TEXT = "Please enter a valid email address"
-    PASSWORD_REQUIRED_TEXT = "Password is required"
-    EMAIL_REQUIRED_TEXT = "Email is required"
-    PHONE_REQUIRED_TEXT = "Phone number is required"
-    LAST_NAME_REQUIRED_TEXT = "Last Name is required"
-    ADDRESS_REQUIRED_TEXT = "Address is required"
-    INTERNAL_ERROR_TEXT = "Internal error occurred. Please check the server!"
-    PAGE_HEADING_TEXT = "REGISTRATION"
-
+class RegistrationPage(RegistrationPageSelectors, BasePage):
     def open_from_login(self) -> None:
         self.page.goto(Settings.LOGIN_URL, wait_until="domcontentloaded")
         self.page.get_by_role("link", name="Sign Up").click()
@@ -0,0 +1,178 @@
+# Selector and text constants shared by the sync page objects and their async counterparts in pages/aio.
+
+
+class LoginPageSelectors:
+    EMAIL_INPUT = "input[name='email']"
+    PASSWORD_INPUT = "input[name='password']"
+    SIGN_IN_BUTTON = "button:has-text('Sign In')"
+    SIGN_UP_LINK = "a[href='/register']"
+    REQUIRED_PASSWORD_TEXT = "Password is required"
+    INVALID_CREDENTIALS_TEXT = "Incorrect username or password. Please try again!"
+    INVALID_EMAIL_FORMAT_TEXT = "Please enter a valid email address"
+    MY_PRODUCTS_TEXT = "My Products"
+    LOGOUT_NAV_TEXT = "Logout"
+    LOGOUT_MODAL_TEXT = "Are you sure you want to log out?"
+    LOGOUT_CANCEL_BUTTON_TEXT = "Cancel"
+    LOGOUT_CONFIRM_BUTTON_TEXT = "Yes I am sure!"
+
+
+class RegistrationPageSelectors:
+    FIRST_NAME_INPUT = "input[name='firstName']"
+    LAST_NAME_INPUT = "input[name='lastName']"
+    ADDRESS_INPUT = "input[name='address']"
+    EMAIL_INPUT = "input[name='email']"
+    PHONE_NUMBER_INPUT = "input[name='phoneNumber']"
+    PASSWORD_INPUT = "input[name='password']"
+    CONFIRM_PASSWORD_INPUT = "input[name='confirmPassword']"
+    REGISTER_BUTTON = "button:has-text('Register')"
+    SIGN_IN_LINK = "a[href='/signin']"
+    FORM_CONTROLS = {
+        "first_name": FIRST_NAME_INPUT,
+        "last_name": LAST_NAME_INPUT,
+        "address": ADDRESS_INPUT,
+        "email": EMAIL_INPUT,
+        "phone_number": PHONE_NUMBER_INPUT,
+        "password": PASSWORD_INPUT,
+        "confirm_password": CONFIRM_PASSWORD_INPUT,
+        "register": REGISTER_BUTTON,
+        "sign_in": SIGN_IN_LINK,
+    }
+
+    INVALID_EMAIL_TEXT = "Please enter a valid email address"
+    PASSWORD_REQUIRED_TEXT = "Password is required"
+    EMAIL_REQUIRED_TEXT = "Email is required"
+    PHONE_REQUIRED_TEXT = "Phone number is required"
+    LAST_NAME_REQUIRED_TEXT = "Last Name is required"
+    ADDRESS_REQUIRED_TEXT = "Address is required"
+    INTERNAL_ERROR_TEXT = "Internal error occurred. Please check the server!"
+    PAGE_HEADING_TEXT = "REGISTRATION"
+
+
+class MyProductsPageSelectors:
+    PAGE_HEADING_TEXT = "My Products"
+    MY_PRODUCTS_NAV_TEXT = "My Products"
+    BROWSE_PRODUCTS_NAV_TEXT = "Browse Products"
+    PRODUCT_TITLE_TEXT = "div.sc-hKwDye"
+    PRODUCT_ROW = "div.sc-jrQzAO"
+    DELETE_BUTTON = "button.ui.icon.button"
+    ADD_PRODUCT_NAV_TEXT = "Add Product"
+    DELETE_CONFIRM_MODAL = "div.ui.modal.transition.visible.active"
+    DELETE_MODAL_TEXT = "Are you sure you want to delete this product?"
+    DELETE_CONFIRM_BUTTON_TEXT = "Yes, delete"
+    DELETE_CANCEL_BUTTON_TEXT = "Cancel"
+
+
+class AddUpdateProductPageSelectors:
+    MY_PRODUCTS_NAV_TEXT = "My Products"
+    ADD_PRODUCT_NAV_TEXT = "Add Product"
+    PAGE_HEADING_TEXT = "ADD PRODUCT"
+    EDIT_PAGE_HEADING_TEXT = "EDIT PRODUCT"
+
+    TITLE_INPUT = "input[name='title']"
+    DESCRIPTION_INPUT = "textarea[name='description']"
+    PURCHASE_PRICE_INPUT = "input[name='purchase_price']"
+    RENT_PRICE_INPUT = "input[name='rent_price']"
+    CATEGORIES_DROPDOWN = "div[name='categories']"
+    RENT_DURATION_DROPDOWN = "div[name='rent_duration_type']"
+    CATEGORY_OPTION = "div[role='option']"
+    SUBMIT_BUTTON = "button:has-text('Add Product')"
+    FORM_CONTROLS = {
+        "title": TITLE_INPUT,
+        "description": DESCRIPTION_INPUT,
+        "purchase_price": PURCHASE_PRICE_INPUT,
+        "rent_price": RENT_PRICE_INPUT,
+        "categories": CATEGORIES_DROPDOWN,
+        "rent_duration_type": RENT_DURATION_DROPDOWN,
+        "submit": SUBMIT_BUTTON,
+    }
+
+    NEED_OPTION_TEXT = "Need to select an option"
+
+
+class BrowseProductsPageSelectors:
+    BROWSE_PRODUCTS_NAV_TEXT = "Browse Products"
+
+    TITLE_INPUT = "input[name='title']"
+    CATEGORY_DROPDOWN = "div[name='category']"
+    CATEGORY_OPTION = "div[role='option']"
+
+    BUY_FILTER_CHECKBOX = "input[name='is_buy_filter_turned_on']"
+    RENT_FILTER_CHECKBOX = "input[name='is_rent_filter_turned_on']"
+
+    BUY_FILTER_LABEL_TEXT = "Buy Filters"
+    RENT_FILTER_LABEL_TEXT = "Rent Filters"
+
+    MIN_BUY_RANGE_INPUT = "input[name='min_buy_range']"
+    MAX_BUY_RANGE_INPUT = "input[name='max_buy_range']"
+
+    MIN_RENT_RANGE_INPUT = "input[name='min_rent_range']"
+    MAX_RENT_RANGE_INPUT = "input[name='max_rent_range']"
+    RENT_DURATION_DROPDOWN = "div[name='rent_duration_type']"
+
+    CLEAR_BUTTON_TEXT = "Clear"
+    FILTER_BUTTON_TEXT = "Filter"
+    LOAD_MORE_BUTTON_TEXT = "Load More"
+
+    PRODUCT_TITLE_TEXT = "div.sc-hKwDye"
+    PRODUCT_ROW = "div.sc-jrQzAO"
+
+    FILTER_CONTROLS = {
+        "title": TITLE_INPUT,
+        "category": CATEGORY_DROPDOWN,
+        "clear": f"button:has-text('{CLEAR_BUTTON_TEXT}')",
+        "filter": f"button:has-text('{FILTER_BUTTON_TEXT}')",
+    }
+    FILTER_TOGGLES = {"buy_filter": BUY_FILTER_CHECKBOX, "rent_filter": RENT_FILTER_CHECKBOX}
+    BUY_RANGE_CONTROLS = {"min_buy_range": MIN_BUY_RANGE_INPUT, "max_buy_range": MAX_BUY_RANGE_INPUT}
+    RENT_RANGE_CONTROLS = {
+        "min_rent_range": MIN_RENT_RANGE_INPUT,
+        "max_rent_range": MAX_RENT_RANGE_INPUT,
+        "rent_duration_type": RENT_DURATION_DROPDOWN,
+    }
+
+
+class ViewProductPageSelectors:
+    BROWSE_PRODUCTS_NAV_TEXT = "Browse Products"
+    CLEAR_BUTTON_TEXT = "Clear"
+    FILTER_BUTTON_TEXT = "Filter"
+    CATEGORY_DROPDOWN = "div[name='category']"
+    CATEGORY_OPTION = "div[role='option']"
+
+    BUY_BUTTON_TEXT = "Buy"
+    RENT_BUTTON_TEXT = "Rent"
+    BUY_CONFIRM_BUTTON_TEXT = "Yes!"
+    BUY_CANCEL_BUTTON_TEXT = "Cancel"
+    RENT_BOOK_BUTTON_TEXT = "Book rent"
+    RENT_CANCEL_BUTTON_TEXT = "Cancel"
+
+    MODAL_SELECTOR = "div.ui.modal.transition.visible.active"
+
+    START_DATE_INPUT = "input[name='start_date']"
+    END_DATE_INPUT = "input[name='end_date']"
+
+    PRODUCT_TITLE_TEXT = "div.sc-hKwDye"
+    PRODUCT_ROW = "div.sc-jrQzAO"
+    LOAD_MORE_BUTTON_TEXT = "Load More"
+
+
+class AccountSettingsPageSelectors:
+    ACCOUNT_SETTINGS_NAV_TEXT = "Account Settings"
+    PAGE_HEADING_TEXT = "ACCOUNT SETTINGS"
+
+    FIRST_NAME_INPUT = "input[name='first_name']"
+    LAST_NAME_INPUT = "input[name='last_name']"
+    ADDRESS_INPUT = "input[name='address']"
+    EMAIL_INPUT = "input[name='email']"
+    PHONE_NUMBER_INPUT = "input[name='phone_number']"
+    UPDATE_BUTTON = "button:has-text('Update')"
+    FORM_INPUTS = {
+        "first_name": FIRST_NAME_INPUT,
+        "last_name": LAST_NAME_INPUT,
+        "address": ADDRESS_INPUT,
+        "email": EMAIL_INPUT,
+        "phone_number": PHONE_NUMBER_INPUT,
+    }
+    FORM_CONTROLS = {**FORM_INPUTS, "update": UPDATE_BUTTON}
+
+    UPDATE_SUCCESS_TEXT = "User updated!"
+    MY_PRODUCTS_NAV_TEXT = "My Products"
@@ -1,30 +1,30 @@
 import re
 from datetime import date, timedelta
+from typing import TYPE_CHECKING, Iterator
 
 from config import Settings
 from pages.base_page import BasePage
+from pages.selectors import ViewProductPageSelectors
+from support.catalog_index import CatalogEntry, CatalogIndex
+from support.web_vitals import measured
 
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
 
-class ViewProductPage(BasePage):
-    BROWSE_PRODUCTS_NAV_TEXT = "Browse Products"
-    CLEAR_BUTTON_TEXT = "Clear"
-    FILTER_BUTTON_TEXT = "Filter"
-    CATEGORY_DROPDOWN = "div[name='category']"
-    CATEGORY_OPTION = "div[role='option']"
+# Client-side route change: lets the SPA router render the product without a full document load.
+IN_APP_NAVIGATE_SCRIPT = """
+(url) => {
+  window.history.pushState({}, "", url);
+  window.dispatchEvent(new PopStateEvent("popstate", { state: {} }));
+}
+"""
 
-    BUY_BUTTON_TEXT = "Buy"
-    RENT_BUTTON_TEXT = "Rent"
-    BUY_CONFIRM_BUTTON_TEXT = "Yes!"
-    BUY_CANCEL_BUTTON_TEXT = "Cancel"
-    RENT_BOOK_BUTTON_TEXT = "Book rent"
-    RENT_CANCEL_BUTTON_TEXT = "Cancel"
 
-    MODAL_SELECTOR = "div.ui.modal.transition.visible.active"
-
-    START_DATE_INPUT = "input[name='start_date']"
-    END_DATE_INPUT = "input[name='end_date']"
-
-    PRODUCT_TITLE_TEXT = "div.sc-hKwDye"
+class ViewProductPage(ViewProductPageSelectors, BasePage):
+    def __init__(self, page: "Page", catalog: CatalogIndex | None = None) -> None:
+        super().__init__(page)
+        self.catalog = catalog if catalog is not None else CatalogIndex()
+        self.current_title = ""
 
     def open_browse_products(self) -> None:
         self.page.get_by_text(self.BROWSE_PRODUCTS_NAV_TEXT).first.click()
@@ -32,7 +32,7 @@ class ViewProductPage(BasePage):
         clear_button = self.page.get_by_role("button", name=self.CLEAR_BUTTON_TEXT)
         if clear_button.count() > 0:
             clear_button.first.click()
-            self.page.wait_for_timeout(300)
+            self.wait_for_settle()
 
     def choose_category_and_filter(self, category_name: str) -> None:
         self.page.locator(self.CATEGORY_DROPDOWN).click()
@@ -41,31 +41,99 @@ class ViewProductPage(BasePage):
             has_text=category_name,
         ).first.click()
         self.page.get_by_role("button", name=self.FILTER_BUTTON_TEXT).click()
-        self.page.wait_for_timeout(500)
+        self.wait_for_settle()
 
+    @measured("product_details")
     def open_product_by_title(self, product_title: str, category: str | None = None) -> None:
+        entry = self.catalog.get(product_title)
+        if entry is None or not entry.is_visited or not self._navigate_in_app(entry.url, product_title):
+            self._open_product_from_browse_list(product_title, category)
+        self.current_title = product_title
+        self._record_current_product()
+
+    def _open_product_from_browse_list(self, product_title: str, category: str | None = None) -> None:
         self.open_browse_products()
         if category:
             self.choose_category_and_filter(category)
         product_title_locator = self.page.locator(self.PRODUCT_TITLE_TEXT, has_text=product_title)
-        if product_title_locator.count() == 0:
-            raise ValueError(f"Product not found in browse list: {product_title}")
+        rows = self.page.locator(self.PRODUCT_ROW)
+        while product_title_locator.count() == 0:
+            if not self._show_browse_rows(rows.count() + 1):
+                raise ValueError(f"Product not found in browse list: {product_title}")
         product_title_locator.first.click()
-        self.page.wait_for_timeout(500)
+        self.wait_for_settle()
+
+    def _show_browse_rows(self, count: int) -> bool:
+        # Clicks Load More until at least `count` cards are listed; False once the list runs out first.
+        rows = self.page.locator(self.PRODUCT_ROW)
+        load_more = self.page.get_by_role("button", name=self.LOAD_MORE_BUTTON_TEXT)
+        shown = rows.count()
+        while shown < count and load_more.count() > 0:
+            load_more.first.click()
+            self.wait_for_settle(required=True)
+            shown, previous = rows.count(), shown
+            if shown == previous:
+                break
+        return shown >= count
+
+    def _navigate_in_app(self, url: str, product_title: str) -> bool:
+        try:
+            self.page.evaluate(IN_APP_NAVIGATE_SCRIPT, url)
+            self.wait_for_settle()
+        except Exception:
+            return False
+        return self.page.url == url and self.body_contains(product_title)
+
+    def _record_current_product(self) -> CatalogEntry:
+        return self.catalog.record_visit(
+            self.current_title,
+            url=self.page.url,
+            status=self.status_text(),
+            owned=self.is_owned_by_logged_user(),
+            can_buy=self.buy_button_visible(),
+            can_rent=self.rent_button_visible(),
+        )
+
+    def _index_browse_list(self) -> Iterator[CatalogEntry]:
+        # Walks the browse list card by card across Load More pages and opens every product not indexed yet
+        # from its own card, yielding it once visited. Coming back reloads the list up to the next card, so a
+        # caller that stops early leaves the rest of the catalog unvisited.
+        self.open_browse_products()
+        rows = self.page.locator(self.PRODUCT_ROW)
+        position = 0
+        while self._show_browse_rows(position + 1):
+            row = rows.nth(position)
+            position += 1
+            title_locator = row.locator(self.PRODUCT_TITLE_TEXT).first
+            title = title_locator.inner_text().strip() if title_locator.count() else ""
+            if not title or self.catalog.upsert(CatalogEntry.from_card_text(title, row.inner_text())).is_visited:
+                continue
+            title_locator.click()
+            self.wait_for_settle()
+            self.current_title = title
+            yield self._record_current_product()
+            self.open_browse_products()
+        self.catalog.complete = True
+
+    def index_catalog(self) -> CatalogIndex:
+        for _ in self._index_browse_list():
+            pass
+        return self.catalog
 
     def open_first_available_non_owned_product(self) -> str:
-        self.open_browse_products()
-        titles = [title.strip() for title in self.page.locator(self.PRODUCT_TITLE_TEXT).all_text_contents() if title.strip()]
-
-        for title in titles:
-            self.open_product_by_title(title)
-            if (
-                self.status_text().lower() == "available"
-                and not self.is_owned_by_logged_user()
-                and self.buy_button_visible()
-                and self.rent_button_visible()
-            ):
-                return title
+        # Known products are tried first; the browse list is only walked, and only as far as the first
+        # available product owned by someone else, when the index has none.
+        entry = self.catalog.first_available()
+        while entry is not None:
+            # Re-reads the live status, so a product taken meanwhile drops out of the next query.
+            self.open_product_by_title(entry.title)
+            if self.catalog.get(entry.title).is_available_to_user:
+                return entry.title
+            entry = self.catalog.first_available()
+        if not self.catalog.complete:
+            for entry in self._index_browse_list():
+                if entry.is_available_to_user:
+                    return entry.title
 
         raise RuntimeError("No available non-owned product found with Buy/Rent actions.")
 
@@ -92,11 +160,12 @@ class ViewProductPage(BasePage):
 
     def confirm_buy(self) -> None:
         self.page.get_by_role("button", name=self.BUY_CONFIRM_BUTTON_TEXT).click()
-        self.page.wait_for_timeout(900)
+        self.wait_for_settle()
+        self._refresh_catalog_status()
 
     def cancel_buy(self) -> None:
         self.page.get_by_role("button", name=self.BUY_CANCEL_BUTTON_TEXT).click()
-        self.page.wait_for_timeout(400)
+        self.wait_for_settle()
 
     def open_rent_modal(self) -> None:
         self.page.get_by_role("button", name=self.RENT_BUTTON_TEXT).click()
@@ -114,11 +183,16 @@ class ViewProductPage(BasePage):
 
     def book_rent(self) -> None:
         self.page.get_by_role("button", name=self.RENT_BOOK_BUTTON_TEXT).click()
-        self.page.wait_for_timeout(1000)
+        self.wait_for_settle()
+        self._refresh_catalog_status()
+
+    def _refresh_catalog_status(self) -> None:
+        if self.current_title:
+            self.catalog.update_status(self.current_title, self.status_text())
 
     def cancel_rent(self) -> None:
         self.page.get_by_role("button", name=self.RENT_CANCEL_BUTTON_TEXT).click()
-        self.page.wait_for_timeout(400)
+        self.wait_for_settle()
 
     def rent_book_button_disabled(self) -> bool:
         return self.page.get_by_role("button", name=self.RENT_BOOK_BUTTON_TEXT).is_disabled()
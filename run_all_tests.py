@@ -1,18 +1,123 @@
+import argparse
+import os
 import subprocess
 import sys
+import time
 
+from support.durations import DurationHistory
+from support.parallel import (
+    ALLURE_RESULTS_DIR,
+    build_units,
+    collect_tests,
+    distribute,
+    predicted_seconds,
+    run_workers,
+    shard,
+)
+from support.quarantine import QuarantineLedger
 
-def main() -> int:
-    cmd = [sys.executable, "-m", "pytest"]
-    extra_args = sys.argv[1:]
-    if extra_args:
-        cmd.extend(extra_args)
-    else:
-        cmd.extend(["tests", "-q"])
 
+def _shard(value: str) -> tuple[int, int]:
+    index, _, count = value.partition("/")
+    try:
+        index, count = int(index), int(count)
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected i/n, e.g. 2/4") from None
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError("shard index must be between 1 and the shard count")
+    return index, count
+
+
+def _parse_args(argv: list[str]) -> tuple[argparse.Namespace, list[str]]:
+    parser = argparse.ArgumentParser(description="Run the UI test suite.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="number of pytest processes, each with its own Playwright instance and browser",
+    )
+    parser.add_argument(
+        "--shard",
+        type=_shard,
+        metavar="I/N",
+        help="run only shard I of N, split by the recorded test durations",
+    )
+    parser.add_argument(
+        "--compare-tracing",
+        action="store_true",
+        help="run the suite with TRACING=off and TRACING=on-failure and report the wall-time overhead",
+    )
+    parser.add_argument(
+        "--no-quarantine",
+        action="store_true",
+        help="run quarantined tests in the main, blocking run instead of a separate batch",
+    )
+    return parser.parse_known_args(argv)
+
+
+def _run(args: argparse.Namespace, pytest_args: list[str], clean_results: bool = True) -> int:
+    if args.workers > 1 or args.shard:
+        manifest = collect_tests(pytest_args)
+        units = build_units(manifest)
+        predicted = DurationHistory().predict([entry["nodeid"] for entry in manifest])
+        if args.shard:
+            index, count = args.shard
+            units = shard(units, index, count, predicted)
+            tests = [nodeid for unit in units for nodeid in unit]
+            print(f"Shard {index}/{count}: {len(tests)} tests, predicted {predicted_seconds(tests, predicted):.0f}s")
+        buckets = distribute(units, args.workers, predicted)
+        return run_workers(buckets, pytest_args, clean_results, predicted)
+
+    cmd = [sys.executable, "-m", "pytest", *pytest_args]
+    if not clean_results:
+        # Adds to the main run's Allure results instead of replacing them.
+        cmd[3:3] = ["-o", f"addopts=-ra --alluredir={ALLURE_RESULTS_DIR}"]
     result = subprocess.run(cmd, check=False)
     return result.returncode
 
 
+def _run_with_quarantine(args: argparse.Namespace, pytest_args: list[str]) -> int:
+    if args.no_quarantine:
+        os.environ["QUARANTINE"] = "off"
+        return _run(args, pytest_args)
+    quarantined = QuarantineLedger().quarantined()
+    os.environ["QUARANTINE"] = "exclude"
+    exit_code = _run(args, pytest_args)
+    if quarantined:
+        # Flaky tests still run, and keep feeding the ledger, but cannot fail the build.
+        print(f"Running {len(quarantined)} quarantined tests (non-blocking):")
+        os.environ["QUARANTINE"] = "only"
+        quarantine_exit_code = _run(args, pytest_args, clean_results=False)
+        print(f"Quarantine batch finished with exit code {quarantine_exit_code} (ignored).")
+    return exit_code
+
+
+def _compare_tracing(args: argparse.Namespace, pytest_args: list[str]) -> int:
+    timings = {}
+    exit_code = 0
+    for mode in ("off", "on-failure"):
+        os.environ["TRACING"] = mode
+        start = time.perf_counter()
+        return_code = _run_with_quarantine(args, pytest_args)
+        timings[mode] = time.perf_counter() - start
+        exit_code = exit_code or return_code
+    overhead = timings["on-failure"] - timings["off"]
+    print(f"tracing off:        {timings['off']:.1f}s")
+    print(f"tracing on-failure: {timings['on-failure']:.1f}s ({overhead:+.1f}s, {overhead / timings['off']:+.1%})")
+    return exit_code
+
+
+def main() -> int:
+    args, extra_args = _parse_args(sys.argv[1:])
+    # Plain pytest runs report every failure as is; the runner retries once unless RERUN_FAILURES says otherwise.
+    os.environ.setdefault("RERUN_FAILURES", "1")
+    os.environ.setdefault("LONGEST_FIRST", "on")
+    pytest_args = extra_args or ["tests", "-q"]
+
+    if args.compare_tracing:
+        return _compare_tracing(args, pytest_args)
+    return _run_with_quarantine(args, pytest_args)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,214 @@
+import argparse
+import functools
+import inspect
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import allure
+
+from config import Settings
+
+# BasePage helpers whose whole duration is waiting on the app rather than acting on it.
+WAIT_METHODS = {"wait_for_settle", "wait_for_text_visible"}
+SLEEP_CALLS = {"wait_for_timeout"}
+
+
+class _Frame:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.wait_ms = 0.0
+        self.sleep_ms = 0.0
+        self.ipc_calls = 0
+        self.timeouts = 0
+
+
+class ActionTimer:
+    def __init__(self) -> None:
+        self.enabled = Settings.ACTION_TIMING_ENABLED
+        self.records: list[dict] = []
+        self.current_test = ""
+        self._stack: list[_Frame] = []
+
+    def reset(self) -> None:
+        self.records.clear()
+        self._stack.clear()
+
+    def _add(self, wait_ms: float = 0.0, sleep_ms: float = 0.0, ipc_calls: int = 0, timeouts: int = 0) -> None:
+        # Totals are inclusive: a nested page-object call also counts towards every caller on the stack.
+        for frame in self._stack:
+            frame.wait_ms += wait_ms
+            frame.sleep_ms += sleep_ms
+            frame.ipc_calls += ipc_calls
+            frame.timeouts += timeouts
+
+    def record_ipc(self, name: str, elapsed_ms: float, timed_out: bool) -> None:
+        if name in SLEEP_CALLS:
+            self._add(sleep_ms=elapsed_ms, ipc_calls=1)
+        elif name.startswith("wait_for"):
+            self._add(wait_ms=elapsed_ms, ipc_calls=1, timeouts=int(timed_out))
+        else:
+            self._add(ipc_calls=1, timeouts=int(timed_out))
+
+    def run(self, owner: str, method: str, call, *args, **kwargs):
+        name = f"{owner}.{method}"
+        frame = _Frame(name)
+        depth = len(self._stack)
+        self._stack.append(frame)
+        start = time.perf_counter()
+        failed = False
+        try:
+            with allure.step(name):
+                return call(*args, **kwargs)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            wall_ms = (time.perf_counter() - start) * 1000
+            self._stack.pop()
+            if method in WAIT_METHODS:
+                # Everything but explicit sleeps inside a wait helper is waiting; pass the extra on to callers.
+                extra_wait_ms = max(wall_ms - frame.sleep_ms - frame.wait_ms, 0.0)
+                frame.wait_ms += extra_wait_ms
+                self._add(wait_ms=extra_wait_ms)
+            self.records.append(
+                {
+                    "test": self.current_test,
+                    "method": name,
+                    "depth": depth,
+                    "wall_ms": round(wall_ms, 2),
+                    "wait_ms": round(frame.wait_ms, 2),
+                    "sleep_ms": round(frame.sleep_ms, 2),
+                    "ipc_calls": frame.ipc_calls,
+                    "timeouts": frame.timeouts,
+                    "failed": failed,
+                }
+            )
+
+    def write_report(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {"worker": Settings.WORKER_ID, "records": self.records, "summary": summarize(self.records)}
+        path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+TIMER = ActionTimer()
+
+
+def summarize(records: list[dict]) -> list[dict]:
+    grouped: dict[str, list[dict]] = defaultdict(list)
+    for record in records:
+        grouped[record["method"]].append(record)
+    summary = []
+    for method, calls in grouped.items():
+        total_ms = sum(call["wall_ms"] for call in calls)
+        summary.append(
+            {
+                "method": method,
+                "calls": len(calls),
+                "total_ms": round(total_ms, 2),
+                "mean_ms": round(total_ms / len(calls), 2),
+                "max_ms": max(call["wall_ms"] for call in calls),
+                "wait_ms": round(sum(call["wait_ms"] for call in calls), 2),
+                "sleep_ms": round(sum(call["sleep_ms"] for call in calls), 2),
+                "ipc_calls": sum(call["ipc_calls"] for call in calls),
+                "timeouts": sum(call["timeouts"] for call in calls),
+            }
+        )
+    return sorted(summary, key=lambda row: row["total_ms"], reverse=True)
+
+
+def format_summary(summary: list[dict], limit: int = 10) -> list[str]:
+    lines = [f"{'method':<55} {'calls':>5} {'total ms':>10} {'mean ms':>9} {'wait ms':>9} {'sleep ms':>9} {'ipc':>5}"]
+    for row in summary[:limit]:
+        lines.append(
+            f"{row['method']:<55} {row['calls']:>5} {row['total_ms']:>10.0f} {row['mean_ms']:>9.0f} "
+            f"{row['wait_ms']:>9.0f} {row['sleep_ms']:>9.0f} {row['ipc_calls']:>5}"
+        )
+    return lines
+
+
+@functools.cache
+def _playwright_types() -> tuple[type, type]:
+    # Imported on first use so collecting tests does not pay for loading Playwright.
+    from playwright.sync_api import Locator, TimeoutError as PlaywrightTimeoutError
+
+    return Locator, PlaywrightTimeoutError
+
+
+class CountingProxy:
+    # Wraps a Page (and the locators it hands out) so every call that crosses to the browser is counted.
+    def __init__(self, target, timer: ActionTimer = TIMER) -> None:
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_timer", timer)
+
+    def __getattr__(self, name: str):
+        Locator, PlaywrightTimeoutError = _playwright_types()
+        value = getattr(self._target, name)
+        if isinstance(value, Locator):
+            return CountingProxy(value, self._timer)
+        if not callable(value) or name.startswith("_"):
+            return value
+
+        @functools.wraps(value)
+        def call(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = value(*args, **kwargs)
+            except Exception as error:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                self._timer.record_ipc(name, elapsed_ms, isinstance(error, PlaywrightTimeoutError))
+                raise
+            if isinstance(result, Locator):
+                # Building a locator is local; only the action performed on it later reaches the browser.
+                return CountingProxy(result, self._timer)
+            self._timer.record_ipc(name, (time.perf_counter() - start) * 1000, False)
+            return result
+
+        return call
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self._target, name, value)
+
+    def __eq__(self, other) -> bool:
+        return self._target == getattr(other, "_target", other)
+
+    def __hash__(self) -> int:
+        return hash(self._target)
+
+
+def instrument_methods(cls: type) -> None:
+    for name, value in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(value) or getattr(value, "__action_timed__", False):
+            continue
+        if inspect.isgeneratorfunction(value):
+            # A generator runs while its consumer iterates; its Playwright calls count towards that method.
+            continue
+        setattr(cls, name, _timed(cls.__name__, name, value))
+
+
+def _timed(owner: str, method: str, function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not TIMER.enabled:
+            return function(*args, **kwargs)
+        return TIMER.run(owner, method, function, *args, **kwargs)
+
+    wrapper.__action_timed__ = True
+    return wrapper
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Summarize page-object timing reports across workers.")
+    parser.add_argument("reports", nargs="*", type=Path)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+    paths = args.reports or sorted(Settings.ACTION_TIMING_DIR.glob("*.json"))
+    records = [record for path in paths for record in json.loads(path.read_text(encoding="utf-8"))["records"]]
+    for line in format_summary(summarize(records), args.limit):
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
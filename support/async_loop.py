@@ -0,0 +1,23 @@
+import asyncio
+import threading
+from collections.abc import Coroutine
+
+
+class LoopThread:
+    # One event loop on a daemon thread for the whole session: sync fixtures and tests hand coroutines to it,
+    # so the async page objects run without an asyncio pytest plugin and objects stay bound to a single loop.
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="playwright-async-loop", daemon=True)
+
+    def start(self) -> "LoopThread":
+        self.thread.start()
+        return self
+
+    def run(self, coroutine: Coroutine, timeout_s: float | None = None):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout_s)
+
+    def stop(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
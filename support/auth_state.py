@@ -0,0 +1,37 @@
+import hashlib
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+from typing import TYPE_CHECKING
+
+from config import Settings
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext
+
+
+class AuthStateCache:
+    def __init__(self, path: Path, ttl_seconds: int) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+
+    @classmethod
+    def for_worker(cls, worker_id: str | None = None) -> "AuthStateCache":
+        # Keyed by origin and user as well, so switching BASE_URL or USERNAME never resumes another session.
+        worker_id = worker_id or Settings.WORKER_ID
+        parts = urlsplit(Settings.BASE_URL)
+        identity = f"{parts.scheme}://{parts.netloc}|{Settings.USERNAME}"
+        key = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:12]
+        return cls(Settings.AUTH_STATE_DIR / f"storage_state-{worker_id}-{key}.json", Settings.AUTH_STATE_TTL_SECONDS)
+
+    def is_fresh(self) -> bool:
+        if not self.path.exists():
+            return False
+        return time.time() - self.path.stat().st_mtime < self.ttl_seconds
+
+    def save(self, context: "BrowserContext") -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        context.storage_state(path=str(self.path))
+
+    def invalidate(self) -> None:
+        self.path.unlink(missing_ok=True)
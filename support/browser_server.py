@@ -0,0 +1,175 @@
+import argparse
+import json
+import os
+import shlex
+import signal
+import threading
+from typing import TYPE_CHECKING, Callable
+from urllib.error import URLError
+from urllib.request import urlopen
+
+from config import Settings
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, Playwright
+
+# Chromium switches that cut background work a headless CI run never needs.
+CI_LAUNCH_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-breakpad",
+    "--disable-features=Translate,OptimizationHints,MediaRouter",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--mute-audio",
+]
+PRESETS = {"@ci": CI_LAUNCH_ARGS}
+
+
+def launch_args() -> list[str]:
+    args = []
+    for token in shlex.split(Settings.BROWSER_LAUNCH_ARGS):
+        if token in PRESETS:
+            # The presets are Chromium switches; other engines would reject them.
+            args.extend(PRESETS[token] if Settings.BROWSER_NAME == "chromium" else [])
+        else:
+            args.append(token)
+    return args
+
+
+def read_endpoint() -> str | None:
+    # The running server's CDP endpoint, or None when no server file exists or the server no longer answers.
+    if Settings.BROWSER_SERVER_MODE == "off" or not Settings.BROWSER_SERVER_FILE.exists():
+        return None
+    try:
+        server = json.loads(Settings.BROWSER_SERVER_FILE.read_text(encoding="utf-8"))
+    except ValueError:
+        return None
+    if server.get("browser") != Settings.BROWSER_NAME:
+        return None
+    try:
+        with urlopen(f"{server['endpoint']}/json/version", timeout=1):
+            pass
+    except (URLError, OSError):
+        return None
+    return server["endpoint"]
+
+
+def connect(playwright: "Playwright") -> "Browser | None":
+    # The running browser server over CDP, or None when there is none to connect to.
+    endpoint = read_endpoint()
+    if endpoint:
+        try:
+            return getattr(playwright, Settings.BROWSER_NAME).connect_over_cdp(endpoint, timeout=5000)
+        except Exception:
+            # The server went away between the health check and the connect; launching is always safe.
+            pass
+    return None
+
+
+def launch(playwright: "Playwright") -> "Browser":
+    return getattr(playwright, Settings.BROWSER_NAME).launch(headless=Settings.HEADLESS, args=launch_args())
+
+
+def connect_or_launch(playwright: "Playwright") -> "Browser":
+    return connect(playwright) or launch(playwright)
+
+
+class RecyclableBrowser:
+    # Stands in for the session Browser so fixtures holding it keep working when the browser is replaced
+    # mid-session. Callbacks in before_recycle release what belongs to the old browser (pooled contexts) first.
+    # Only a browser this process launched can be recycled: closing a browser server's CDP connection leaves
+    # its Chromium (and memory) untouched, and a test process must not restart a server others share.
+    def __init__(self, playwright: "Playwright") -> None:
+        self.playwright = playwright
+        connected = connect(playwright)
+        self.connected = connected is not None
+        self.browser = connected or launch(playwright)
+        self.before_recycle: list[Callable[[], None]] = []
+        self.recycles = 0
+
+    def __getattr__(self, name: str):
+        return getattr(self.browser, name)
+
+    def recycle(self) -> None:
+        if self.connected:
+            raise RuntimeError("A browser server connected over CDP cannot be recycled from a test process.")
+        for callback in self.before_recycle:
+            callback()
+        self.browser.close()
+        self.browser = launch(self.playwright)
+        self.recycles += 1
+
+
+async def connect_or_launch_async(playwright):
+    browser_type = getattr(playwright, Settings.BROWSER_NAME)
+    endpoint = read_endpoint()
+    if endpoint:
+        try:
+            return await browser_type.connect_over_cdp(endpoint, timeout=5000)
+        except Exception:
+            pass
+    return await browser_type.launch(headless=Settings.HEADLESS, args=launch_args())
+
+
+def serve(port: int) -> None:
+    from playwright.sync_api import sync_playwright
+
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(
+            headless=Settings.HEADLESS, args=[*launch_args(), f"--remote-debugging-port={port}"]
+        )
+        endpoint = f"http://127.0.0.1:{port}"
+        Settings.BROWSER_SERVER_FILE.parent.mkdir(parents=True, exist_ok=True)
+        Settings.BROWSER_SERVER_FILE.write_text(
+            json.dumps({"browser": "chromium", "endpoint": endpoint, "pid": os.getpid()}), encoding="utf-8"
+        )
+        print(f"Browser server listening on {endpoint} (Ctrl+C or --stop to shut down)", flush=True)
+        try:
+            while not stopped.wait(1):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            Settings.BROWSER_SERVER_FILE.unlink(missing_ok=True)
+            browser.close()
+
+
+def stop() -> int:
+    if not Settings.BROWSER_SERVER_FILE.exists():
+        print("No browser server is running.")
+        return 1
+    server = json.loads(Settings.BROWSER_SERVER_FILE.read_text(encoding="utf-8"))
+    try:
+        os.kill(server["pid"], signal.SIGTERM)
+    except ProcessLookupError:
+        Settings.BROWSER_SERVER_FILE.unlink(missing_ok=True)
+        print("Browser server was not running; removed its stale endpoint file.")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Keep one Chromium running for every test process to connect to.")
+    parser.add_argument("--port", type=int, default=Settings.BROWSER_SERVER_PORT)
+    parser.add_argument("--stop", action="store_true", help="stop the running server")
+    args = parser.parse_args()
+    if args.stop:
+        return stop()
+    if Settings.BROWSER_NAME != "chromium":
+        parser.error("The browser server connects over CDP, which only Chromium supports.")
+    serve(args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,159 @@
+import re
+from typing import NamedTuple
+
+from config import Settings
+
+CATEGORIES_PATTERN = re.compile(r"Categories:\s*(.+)", flags=re.IGNORECASE)
+PRICE_PATTERN = re.compile(
+    r"Price:\s*\$?\s*([\d.]+)\s*\|\s*Rent:\s*\$?\s*([\d.]+)\s*([A-Za-z]*)",
+    flags=re.IGNORECASE,
+)
+PRODUCT_ID_PATTERN = re.compile(r"/(\d+)/?$")
+
+
+def _price(value: str | None) -> float | None:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class ProductCard(NamedTuple):
+    # What one Browse Products card shows, without visiting the product.
+    title: str
+    categories: tuple[str, ...] = ()
+    purchase_price: float | None = None
+    rent_price: float | None = None
+    rent_duration: str = ""
+
+    @classmethod
+    def from_card_text(cls, title: str, card_text: str) -> "ProductCard":
+        categories_match = CATEGORIES_PATTERN.search(card_text)
+        price_match = PRICE_PATTERN.search(card_text)
+        return cls(
+            title=title,
+            categories=tuple(item.strip() for item in categories_match.group(1).split(",")) if categories_match else (),
+            purchase_price=_price(price_match.group(1)) if price_match else None,
+            rent_price=_price(price_match.group(2)) if price_match else None,
+            rent_duration=price_match.group(3).lower() if price_match else "",
+        )
+
+
+class CatalogEntry:
+    def __init__(
+        self,
+        title: str,
+        categories: list[str] | None = None,
+        purchase_price: float | None = None,
+        rent_price: float | None = None,
+        rent_duration: str = "",
+    ) -> None:
+        self.title = title
+        self.categories = categories or []
+        self.purchase_price = purchase_price
+        self.rent_price = rent_price
+        self.rent_duration = rent_duration
+        self.url = ""
+        self.status = ""
+        self.owned = False
+        self.can_buy = False
+        self.can_rent = False
+
+    @classmethod
+    def from_card_text(cls, title: str, card_text: str) -> "CatalogEntry":
+        card = ProductCard.from_card_text(title, card_text)
+        return cls(
+            title=card.title,
+            categories=list(card.categories),
+            purchase_price=card.purchase_price,
+            rent_price=card.rent_price,
+            rent_duration=card.rent_duration,
+        )
+
+    @property
+    def product_id(self) -> str:
+        match = PRODUCT_ID_PATTERN.search(self.url)
+        return match.group(1) if match else ""
+
+    @property
+    def is_visited(self) -> bool:
+        return bool(self.url)
+
+    @property
+    def is_available_to_user(self) -> bool:
+        return self.status.lower() == "available" and not self.owned and self.can_buy and self.can_rent
+
+    def as_dict(self) -> dict:
+        return {
+            "title": self.title,
+            "product_id": self.product_id,
+            "url": self.url,
+            "status": self.status,
+            "owned": self.owned,
+            "categories": self.categories,
+            "purchase_price": self.purchase_price,
+            "rent_price": self.rent_price,
+            "rent_duration": self.rent_duration,
+        }
+
+
+class CatalogIndex:
+    # Built once per session from the browse list plus one visit per product, then kept in sync by the
+    # page objects after buy, rent and delete so later lookups are a single in-app navigation.
+    def __init__(self) -> None:
+        self.base_url = Settings.BASE_URL
+        self.entries: dict[str, CatalogEntry] = {}
+        self.complete = False
+
+    def _check_base_url(self) -> None:
+        if self.base_url != Settings.BASE_URL:
+            self.base_url = Settings.BASE_URL
+            self.clear()
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.complete = False
+
+    def get(self, title: str) -> CatalogEntry | None:
+        self._check_base_url()
+        return self.entries.get(title)
+
+    def upsert(self, entry: CatalogEntry) -> CatalogEntry:
+        self._check_base_url()
+        existing = self.entries.get(entry.title)
+        if existing is None:
+            self.entries[entry.title] = entry
+            return entry
+        # Card data refreshes prices and categories; details already learned from a visit are kept.
+        existing.categories = entry.categories or existing.categories
+        existing.purchase_price = entry.purchase_price if entry.purchase_price is not None else existing.purchase_price
+        existing.rent_price = entry.rent_price if entry.rent_price is not None else existing.rent_price
+        existing.rent_duration = entry.rent_duration or existing.rent_duration
+        return existing
+
+    def record_visit(self, title: str, url: str, status: str, owned: bool, can_buy: bool, can_rent: bool) -> CatalogEntry:
+        entry = self.get(title) or self.upsert(CatalogEntry(title))
+        entry.url = url
+        entry.status = status
+        entry.owned = owned
+        entry.can_buy = can_buy
+        entry.can_rent = can_rent
+        return entry
+
+    def update_status(self, title: str, status: str) -> None:
+        entry = self.get(title)
+        if entry is not None:
+            entry.status = status
+            entry.can_buy = entry.can_rent = status.lower() == "available" and not entry.owned
+
+    def remove(self, title: str) -> None:
+        self._check_base_url()
+        self.entries.pop(title, None)
+
+    def first_available(self) -> CatalogEntry | None:
+        self._check_base_url()
+        return next((entry for entry in self.entries.values() if entry.is_available_to_user), None)
+
+    def titles(self) -> list[str]:
+        self._check_base_url()
+        return list(self.entries)
@@ -0,0 +1,117 @@
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from config import Settings
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext
+
+RESET_PAGE_PATH = "/__context-pool-reset"
+CLEAR_STORAGE_SCRIPT = """
+() => {
+  window.localStorage.clear();
+  window.sessionStorage.clear();
+}
+"""
+SEED_STORAGE_SCRIPT = """
+(items) => {
+  for (const { name, value } of items) window.localStorage.setItem(name, value);
+}
+"""
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class ContextPool:
+    # Contexts are handed back clean instead of closed, so the browser keeps its warm HTTP cache and
+    # skips context creation. Storage-state contexts are re-seeded from the current file on every checkout.
+    def __init__(self, browser: "Browser", enabled: bool | None = None) -> None:
+        self.browser = browser
+        self.enabled = Settings.CONTEXT_POOL_ENABLED if enabled is None else enabled
+        self.idle: list["BrowserContext"] = []
+        self.fresh: set[int] = set()
+        self.created = 0
+        self.reused = 0
+        self.fresh_requests = 0
+        self.reset_failures = 0
+
+    def acquire(self, storage_state: Path | None = None, fresh: bool = False) -> "BrowserContext":
+        if fresh or not self.enabled:
+            self.fresh_requests += 1
+            context = self.browser.new_context(storage_state=str(storage_state) if storage_state else None)
+            self.fresh.add(id(context))
+            return context
+        if self.idle:
+            context = self.idle.pop()
+            self.reused += 1
+            if storage_state:
+                self._seed_storage_state(context, storage_state)
+            return context
+        self.created += 1
+        return self.browser.new_context(storage_state=str(storage_state) if storage_state else None)
+
+    def release(self, context: "BrowserContext") -> None:
+        if id(context) in self.fresh:
+            self.fresh.discard(id(context))
+            context.close()
+            return
+        try:
+            self._reset(context)
+        except Exception:
+            # A context that cannot be cleaned is not worth keeping.
+            self.reset_failures += 1
+            context.close()
+            return
+        self.idle.append(context)
+
+    def close(self) -> None:
+        for context in self.idle:
+            context.close()
+        self.idle.clear()
+
+    def _reset(self, context: "BrowserContext") -> None:
+        for page in list(context.pages):
+            page.close()
+        context.unroute_all(behavior="ignoreErrors")
+        context.clear_cookies()
+        context.clear_permissions()
+        self._run_on_origin(context, _origin(Settings.BASE_URL), CLEAR_STORAGE_SCRIPT)
+
+    def _seed_storage_state(self, context: "BrowserContext", storage_state: Path) -> None:
+        state = json.loads(storage_state.read_text(encoding="utf-8"))
+        if state.get("cookies"):
+            context.add_cookies(state["cookies"])
+        for origin in state.get("origins", []):
+            if origin.get("localStorage"):
+                self._run_on_origin(context, origin["origin"], SEED_STORAGE_SCRIPT, origin["localStorage"])
+
+    @staticmethod
+    def _run_on_origin(context: "BrowserContext", origin: str, script: str, arg=None) -> None:
+        # Storage is per origin, so open a routed blank document there instead of loading the app.
+        if not origin.startswith("http"):
+            return
+        page = context.new_page()
+        try:
+            page.route(
+                f"{origin}{RESET_PAGE_PATH}",
+                lambda route: route.fulfill(status=200, content_type="text/html", body="<html></html>"),
+            )
+            page.goto(f"{origin}{RESET_PAGE_PATH}")
+            page.evaluate(script, arg)
+        finally:
+            page.close()
+
+    def stats(self) -> dict:
+        pooled = self.created + self.reused
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "fresh": self.fresh_requests,
+            "reset_failures": self.reset_failures,
+            "reuse_rate": round(self.reused / pooled, 3) if pooled else 0.0,
+        }
@@ -0,0 +1,39 @@
+import json
+import statistics
+from pathlib import Path
+
+from config import Settings
+from support.locking import exclusive_lock, write_json_atomic
+
+# Unknown tests are predicted at this many seconds until the history has anything to compare them with.
+DEFAULT_DURATION_S = 5.0
+
+
+class DurationHistory:
+    # Last few wall times (setup + call + teardown of the reported attempt) per test id.
+    def __init__(self, path: Path | None = None, size: int | None = None) -> None:
+        self.path = path or Settings.TEST_DURATIONS
+        self.size = size or Settings.DURATION_HISTORY_SIZE
+
+    def load(self) -> dict[str, list[float]]:
+        if not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except ValueError:
+            return {}
+
+    def record(self, durations: dict[str, float]) -> None:
+        if not durations:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with exclusive_lock(self.path):
+            history = self.load()
+            for nodeid, duration in durations.items():
+                history[nodeid] = (history.get(nodeid, []) + [round(duration, 3)])[-self.size :]
+            write_json_atomic(self.path, json.dumps(history, indent=2, sort_keys=True))
+
+    def predict(self, nodeids: list[str]) -> dict[str, float]:
+        known = {nodeid: statistics.median(values) for nodeid, values in self.load().items() if values}
+        fallback = statistics.median(known.values()) if known else DEFAULT_DURATION_S
+        return {nodeid: known.get(nodeid, fallback) for nodeid in nodeids}
@@ -0,0 +1,3 @@
+from support.fake_teebay.server import FakeTeebayServer
+
+__all__ = ["FakeTeebayServer"]
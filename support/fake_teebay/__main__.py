@@ -0,0 +1,25 @@
+import argparse
+import time
+
+from support.fake_teebay.server import RESET_TOKEN_HEADER, FakeTeebayServer
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Serve the local Teebay stand-in.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with FakeTeebayServer(args.host, args.port) as server:
+        print(f"Fake Teebay running at {server.base_url}")
+        print(f"Reset state with POST {server.base_url}/__reset and header {RESET_TOKEN_HEADER}: {server.reset_token}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,183 @@
+import json
+import re
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from support.fake_teebay.state import PAGE_SIZE, FakeAppError, FakeTeebayState
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+PRODUCT_PATH = re.compile(r"^/api/products/(\d+)(?:/(buy|rent))?$")
+FILTER_KEYS = (
+    "title",
+    "category",
+    "min_buy_range",
+    "max_buy_range",
+    "min_rent_range",
+    "max_rent_range",
+    "rent_duration_type",
+)
+RESET_TOKEN_HEADER = "X-Fake-Reset-Token"
+
+
+def _int_param(query: dict, name: str, default: int) -> int:
+    try:
+        value = int(query.get(name, [default])[0])
+    except ValueError:
+        raise FakeAppError(400, f"{name} must be a non-negative integer") from None
+    if value < 0:
+        raise FakeAppError(400, f"{name} must be a non-negative integer")
+    return value
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_FakeHTTPServer"
+    # Headers and body are separate writes; without this every response waits on a delayed ACK.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload) -> None:
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def _payload(self) -> dict:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            payload = json.loads(self.rfile.read(length)) if length else {}
+        except ValueError:
+            raise FakeAppError(400, "request body must be a JSON object") from None
+        if not isinstance(payload, dict):
+            raise FakeAppError(400, "request body must be a JSON object")
+        return payload
+
+    def _user(self) -> dict:
+        header = self.headers.get("Authorization", "")
+        return self.server.state.user_for_token(header.removeprefix("Bearer ").strip() or None)
+
+    def _dispatch(self, method: str) -> None:
+        url = urlparse(self.path)
+        if method == "GET" and not url.path.startswith(("/api/", "/__")):
+            self._serve_static(url.path)
+            return
+        try:
+            self._send_json(200, self._route(method, url.path, parse_qs(url.query)))
+        except FakeAppError as error:
+            self._send_json(error.status, {"error": error.message})
+
+    def _serve_static(self, path: str) -> None:
+        if path == "/static/app.js":
+            self._send(200, (STATIC_DIR / "app.js").read_bytes(), "application/javascript")
+            return
+        # Every other path is a client-side route of the single page app.
+        self._send(200, (STATIC_DIR / "index.html").read_bytes(), "text/html; charset=utf-8")
+
+    def _route(self, method: str, path: str, query: dict):
+        state = self.server.state
+        if (method, path) == ("POST", "/__reset"):
+            # Only whoever started the server knows the token; tests reset through FakeTeebayServer.reset().
+            if not secrets.compare_digest(self.headers.get(RESET_TOKEN_HEADER, ""), self.server.reset_token):
+                raise FakeAppError(403, f"{RESET_TOKEN_HEADER} is required to reset the fake app")
+            state.reset()
+            return {"reset": True}
+        if (method, path) == ("POST", "/api/login"):
+            payload = self._payload()
+            return state.login(payload.get("email", ""), payload.get("password", ""))
+        if (method, path) == ("POST", "/api/register"):
+            return state.register(self._payload())
+
+        user = self._user()
+        if path == "/api/me":
+            if method == "PUT":
+                return state.update_user(user, self._payload())
+            if method == "DELETE":
+                state.delete_user(user)
+                return {"deleted": user["id"]}
+            return state.public_user(user)
+        if path == "/api/my-products":
+            return state.my_products(user)
+        if path == "/api/products":
+            if method == "POST":
+                return state.create_product(user, self._payload())
+            filters = {key: query[key][0] for key in FILTER_KEYS if key in query}
+            return state.browse(user, filters, _int_param(query, "offset", 0), _int_param(query, "limit", PAGE_SIZE))
+
+        match = PRODUCT_PATH.match(path)
+        if not match:
+            raise FakeAppError(404, f"Unknown endpoint {method} {path}")
+        product_id, action = int(match.group(1)), match.group(2)
+        if action == "buy" and method == "POST":
+            return state.buy_product(user, product_id)
+        if action == "rent" and method == "POST":
+            payload = self._payload()
+            return state.rent_product(user, product_id, payload.get("start_date"), payload.get("end_date"))
+        if method == "PUT":
+            return state.update_product(user, product_id, self._payload())
+        if method == "DELETE":
+            state.delete_product(user, product_id)
+            return {"deleted": product_id}
+        return state.product_details(user, product_id)
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PUT(self) -> None:
+        self._dispatch("PUT")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+
+class _FakeHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], state: FakeTeebayState) -> None:
+        super().__init__(address, _Handler)
+        self.state = state
+        self.reset_token = secrets.token_hex(16)
+
+
+class FakeTeebayServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.state = FakeTeebayState()
+        self._server = _FakeHTTPServer((host, port), self.state)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-teebay", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def reset_token(self) -> str:
+        return self._server.reset_token
+
+    def start(self) -> "FakeTeebayServer":
+        self._thread.start()
+        return self
+
+    def reset(self) -> None:
+        self.state.reset()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeTeebayServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
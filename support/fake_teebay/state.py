@@ -0,0 +1,271 @@
+import copy
+import re
+import threading
+from datetime import date
+
+from config import Settings
+
+CATEGORIES = ["Electronics", "Furniture", "Home Appliances", "Sporting Goods", "Outdoor", "Toys"]
+RENT_DURATION_TYPES = ["Hourly", "Daily", "Weekly", "Monthly"]
+PAGE_SIZE = 10
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+class FakeAppError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _seed_users() -> list[dict]:
+    return [
+        {
+            "id": 1,
+            "first_name": "Test",
+            "last_name": "User",
+            "address": "Dhaka",
+            "email": Settings.USERNAME or "testuser@teebay.com",
+            "phone_number": 1712345678,
+            "password": Settings.PASSWORD or "123456",
+        },
+        {
+            "id": 2,
+            "first_name": "Other",
+            "last_name": "Seller",
+            "address": "Chattogram",
+            "email": "seller@teebay.com",
+            "phone_number": 1812345678,
+            "password": "seller123",
+        },
+    ]
+
+
+def _seed_products() -> list[dict]:
+    rows = [
+        ("Last of Us Part II PS5 game", ["Electronics", "Toys"], 60, 5, "Daily", 2, "sold"),
+        ("Ikea couch", ["Furniture"], 800, 100, "Monthly", 2, "available"),
+        ("Funshine bear", ["Toys"], 40, 10, "Daily", 2, "available"),
+        ("Blender", ["Home Appliances"], 1000, 50, "Weekly", 2, "available"),
+        ("Lawn Mower", ["Outdoor"], 300, 30, "Weekly", 2, "available"),
+        ("Cricket kit", ["Sporting Goods"], 250, 20, "Daily", 1, "available"),
+        ("iPhone 13 pro max", ["Electronics"], 1300, 120, "Monthly", 2, "available"),
+    ]
+    return [
+        {
+            "id": index,
+            "title": title,
+            "description": f"{title} in good condition",
+            "categories": categories,
+            "purchase_price": purchase_price,
+            "rent_price": rent_price,
+            "rent_duration_type": rent_duration_type,
+            "owner_id": owner_id,
+            "status": status,
+        }
+        for index, (title, categories, purchase_price, rent_price, rent_duration_type, owner_id, status) in enumerate(
+            rows, start=1
+        )
+    ]
+
+
+def _number(value) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class FakeTeebayState:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.users = _seed_users()
+            self.products = _seed_products()
+            self.rentals: list[dict] = []
+            self._next_product_id = len(self.products) + 1
+
+    @staticmethod
+    def token_for(user: dict) -> str:
+        # Stable per user so cached storage_state keeps working after a reset.
+        return f"fake-token-{user['id']}"
+
+    def user_for_token(self, token: str | None) -> dict:
+        for user in self.users:
+            if token and token == self.token_for(user):
+                return user
+        raise FakeAppError(401, "Unauthorized")
+
+    def public_user(self, user: dict) -> dict:
+        return {key: value for key, value in user.items() if key != "password"}
+
+    def public_product(self, product: dict, user: dict) -> dict:
+        return {**copy.deepcopy(product), "owned": product["owner_id"] == user["id"]}
+
+    def login(self, email: str, password: str) -> dict:
+        for user in self.users:
+            if user["email"] == email and user["password"] == password:
+                return {"token": self.token_for(user), "user": self.public_user(user)}
+        raise FakeAppError(401, "Incorrect username or password. Please try again!")
+
+    def register(self, payload: dict) -> dict:
+        # The real backend has no first name / confirm password validation and fails with a 500 instead.
+        required = ["first_name", "last_name", "address", "email", "phone_number", "password"]
+        if any(not str(payload.get(key, "")).strip() for key in required):
+            raise FakeAppError(500, "Internal error occurred. Please check the server!")
+        if payload["password"] != payload.get("confirm_password", payload["password"]):
+            raise FakeAppError(500, "Internal error occurred. Please check the server!")
+        with self._lock:
+            if any(user["email"] == payload["email"] for user in self.users):
+                raise FakeAppError(500, "Internal error occurred. Please check the server!")
+            user = {
+                "id": max(user["id"] for user in self.users) + 1,
+                "first_name": payload["first_name"],
+                "last_name": payload["last_name"],
+                "address": payload["address"],
+                "email": payload["email"],
+                "phone_number": int(_number(payload["phone_number"]) or 0),
+                "password": payload["password"],
+            }
+            self.users.append(user)
+        return {"token": self.token_for(user), "user": self.public_user(user)}
+
+    def update_user(self, user: dict, payload: dict) -> dict:
+        for key in ("first_name", "last_name", "address", "email"):
+            if not str(payload.get(key, "")).strip():
+                raise FakeAppError(400, f"{key} is required")
+        if not EMAIL_PATTERN.match(payload["email"]):
+            raise FakeAppError(400, "Please enter a valid email address")
+        phone_number = _number(payload.get("phone_number"))
+        if phone_number is None:
+            raise FakeAppError(400, "phone_number must be a `number` type")
+        with self._lock:
+            user.update({key: payload[key] for key in ("first_name", "last_name", "address", "email")})
+            user["phone_number"] = int(phone_number)
+        return self.public_user(user)
+
+    def delete_user(self, user: dict) -> None:
+        with self._lock:
+            self.users.remove(user)
+            self.products = [product for product in self.products if product["owner_id"] != user["id"]]
+
+    def _validate_product(self, payload: dict) -> dict:
+        values = {
+            "title": str(payload.get("title", "")).strip(),
+            "description": str(payload.get("description", "")).strip(),
+            "purchase_price": _number(payload.get("purchase_price")),
+            "rent_price": _number(payload.get("rent_price")),
+            "categories": [category for category in payload.get("categories", []) if category in CATEGORIES],
+            "rent_duration_type": payload.get("rent_duration_type"),
+        }
+        if not values["title"] or not values["description"]:
+            raise FakeAppError(400, "Title and description are required")
+        if values["purchase_price"] is None or values["rent_price"] is None:
+            raise FakeAppError(400, "Prices must be numbers")
+        if not values["categories"] or values["rent_duration_type"] not in RENT_DURATION_TYPES:
+            raise FakeAppError(400, "Need to select an option")
+        return values
+
+    def create_product(self, user: dict, payload: dict) -> dict:
+        values = self._validate_product(payload)
+        with self._lock:
+            product = {
+                "id": self._next_product_id,
+                **values,
+                "owner_id": user["id"],
+                "status": "available",
+            }
+            self.products.append(product)
+            self._next_product_id += 1
+        return self.public_product(product, user)
+
+    def _find_product(self, product_id: int) -> dict:
+        for product in self.products:
+            if product["id"] == product_id:
+                return product
+        raise FakeAppError(404, "Product not found")
+
+    def product_details(self, user: dict, product_id: int) -> dict:
+        return self.public_product(self._find_product(product_id), user)
+
+    # Lookup, ownership/availability check and change happen under one lock, so two concurrent buyers (or a
+    # buyer and the owner deleting) cannot both pass the check.
+    def update_product(self, user: dict, product_id: int, payload: dict) -> dict:
+        with self._lock:
+            product = self._find_product(product_id)
+            if product["owner_id"] != user["id"]:
+                raise FakeAppError(403, "You can only edit your own products")
+            product.update(self._validate_product({**product, **payload}))
+            return self.public_product(product, user)
+
+    def delete_product(self, user: dict, product_id: int) -> None:
+        with self._lock:
+            product = self._find_product(product_id)
+            if product["owner_id"] != user["id"]:
+                raise FakeAppError(403, "You can only delete your own products")
+            self.products.remove(product)
+
+    def _available_product(self, user: dict, product_id: int) -> dict:
+        product = self._find_product(product_id)
+        if product["owner_id"] == user["id"] or product["status"] != "available":
+            raise FakeAppError(400, "Product is not available")
+        return product
+
+    def buy_product(self, user: dict, product_id: int) -> dict:
+        with self._lock:
+            product = self._available_product(user, product_id)
+            product["status"] = "sold"
+            return self.public_product(product, user)
+
+    def rent_product(self, user: dict, product_id: int, start_date: str, end_date: str) -> dict:
+        with self._lock:
+            product = self._available_product(user, product_id)
+            try:
+                start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+            except (TypeError, ValueError):
+                raise FakeAppError(400, "Invalid rent dates") from None
+            if start < date.today() or end <= start or (end - start).days > 7:
+                raise FakeAppError(400, "Invalid rent dates")
+            product["status"] = "rented"
+            self.rentals.append({"product_id": product_id, "user_id": user["id"], "start": start_date, "end": end_date})
+            return self.public_product(product, user)
+
+    def my_products(self, user: dict) -> list[dict]:
+        return [self.public_product(product, user) for product in self.products if product["owner_id"] == user["id"]]
+
+    def browse(self, user: dict, filters: dict, offset: int = 0, limit: int = PAGE_SIZE) -> dict:
+        matches = [product for product in self.products if self._matches(product, filters)]
+        return {
+            "items": [self.public_product(product, user) for product in matches[offset:offset + limit]],
+            "total": len(matches),
+        }
+
+    @staticmethod
+    def _matches(product: dict, filters: dict) -> bool:
+        title = (filters.get("title") or "").strip().lower()
+        if title and title not in product["title"].lower():
+            return False
+        category = filters.get("category")
+        if category and category not in product["categories"]:
+            return False
+        if filters.get("min_buy_range") is not None or filters.get("max_buy_range") is not None:
+            min_buy = _number(filters.get("min_buy_range"))
+            max_buy = _number(filters.get("max_buy_range"))
+            if min_buy is not None and product["purchase_price"] < min_buy:
+                return False
+            if max_buy is not None and product["purchase_price"] > max_buy:
+                return False
+        if filters.get("min_rent_range") is not None or filters.get("max_rent_range") is not None:
+            min_rent = _number(filters.get("min_rent_range"))
+            max_rent = _number(filters.get("max_rent_range"))
+            if min_rent is not None and product["rent_price"] < min_rent:
+                return False
+            if max_rent is not None and product["rent_price"] > max_rent:
+                return False
+        duration = filters.get("rent_duration_type")
+        if duration and product["rent_duration_type"] != duration:
+            return False
+        return True
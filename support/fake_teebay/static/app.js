@@ -0,0 +1,646 @@
+// Local stand-in for the Teebay UI. Backend calls are synchronous so every click leaves the DOM final.
+(function () {
+  "use strict";
+
+  const CATEGORIES = ["Electronics", "Furniture", "Home Appliances", "Sporting Goods", "Outdoor", "Toys"];
+  const RENT_DURATION_TYPES = ["Hourly", "Daily", "Weekly", "Monthly"];
+  const PAGE_SIZE = 10;
+  const EMAIL_PATTERN = /^[^@\s]+@[^@\s]+\.[^@\s]+$/;
+  const TRANSITION_MS = 120;
+  const root = document.getElementById("root");
+  const browse = { filters: {}, items: [], total: 0 };
+
+  const token = () => localStorage.getItem("token");
+  const esc = (value) =>
+    String(value).replace(/[&<>"']/g, (char) => ({ "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" })[char]);
+  const isNumber = (value) => String(value).trim() !== "" && !Number.isNaN(Number(value));
+
+  function api(method, path, body) {
+    const xhr = new XMLHttpRequest();
+    xhr.open(method, path, false);
+    xhr.setRequestHeader("Content-Type", "application/json");
+    if (token()) xhr.setRequestHeader("Authorization", "Bearer " + token());
+    xhr.send(body === undefined ? null : JSON.stringify(body));
+    let data = {};
+    try {
+      data = JSON.parse(xhr.responseText || "{}");
+    } catch (error) {
+      data = {};
+    }
+    if (xhr.status >= 400) {
+      const error = new Error(data.error || "Request failed");
+      error.status = xhr.status;
+      throw error;
+    }
+    return data;
+  }
+
+  // ---------------------------------------------------------------- rendering helpers
+
+  function navbar() {
+    return `
+      <div class="ui menu">
+        <a class="item" href="/my-products" data-link>My Products</a>
+        <a class="item" href="/browse-products" data-link>Browse Products</a>
+        <a class="item" href="/account-settings" data-link>Account Settings</a>
+        <a class="item" data-action="logout">Logout</a>
+      </div>`;
+  }
+
+  function input(name, label, value = "", type = "text") {
+    return `
+      <div class="field" data-field="${name}">
+        <label>${label}</label>
+        <input name="${name}" type="${type}" value="${esc(value)}">
+      </div>`;
+  }
+
+  function dropdown(name, label, options, selected = [], multiple = false) {
+    const text = selected.length ? selected.join(", ") : "Select an option";
+    return `
+      <div class="field" data-field="${name}">
+        <label>${label}</label>
+        <div class="ui selection dropdown" name="${name}" role="listbox" tabindex="0"
+             data-multiple="${multiple}" data-value="${esc(JSON.stringify(selected))}">
+          <div class="text">${esc(text)}</div>
+          <div class="menu">
+            ${options.map((option) => `<div class="item" role="option" data-value="${esc(option)}">${esc(option)}</div>`).join("")}
+          </div>
+        </div>
+      </div>`;
+  }
+
+  function dropdownValue(name) {
+    const element = root.querySelector(`.ui.dropdown[name="${name}"]`);
+    return element ? JSON.parse(element.dataset.value || "[]") : [];
+  }
+
+  function formValues(form) {
+    const values = {};
+    form.querySelectorAll("input[name], textarea[name]").forEach((field) => {
+      values[field.name] = field.type === "checkbox" ? field.checked : field.value;
+    });
+    return values;
+  }
+
+  function showErrors(form, errors) {
+    form.querySelectorAll(".ui.pointing.label").forEach((label) => label.remove());
+    Object.entries(errors).forEach(([field, message]) => {
+      const container = form.querySelector(`[data-field="${field}"]`) || form;
+      container.insertAdjacentHTML("beforeend", `<div class="ui pointing red basic label">${esc(message)}</div>`);
+    });
+    return Object.keys(errors).length > 0;
+  }
+
+  function showMessage(text, positive = false) {
+    const target = root.querySelector("[data-form-message]");
+    if (target) target.innerHTML = `<div class="ui ${positive ? "positive" : "negative"} message">${esc(text)}</div>`;
+  }
+
+  function priceLine(product) {
+    return `Price: $${product.purchase_price} | Rent: $${product.rent_price} ${product.rent_duration_type.toLowerCase()}`;
+  }
+
+  function productCard(product, action) {
+    const deleteButton =
+      action === "edit-product"
+        ? `<button class="ui icon button" aria-label="Delete" data-action="delete-product" data-id="${product.id}"><i class="trash icon"></i></button>`
+        : "";
+    return `
+      <div class="sc-jrQzAO" data-product-id="${product.id}">
+        <div class="sc-hKwDye" data-action="${action}" data-id="${product.id}">${esc(product.title)}</div>
+        ${deleteButton}
+        <div class="sc-categories">Categories: ${esc(product.categories.join(", "))}</div>
+        <div class="sc-prices">${esc(priceLine(product))}</div>
+        <div class="sc-description">${esc(product.description)}</div>
+      </div>`;
+  }
+
+  // ---------------------------------------------------------------- modals
+
+  function openModal(body, buttons) {
+    closeModal(true);
+    document.body.insertAdjacentHTML(
+      "beforeend",
+      `<div class="ui dimmer modals page transition visible active" data-modal>
+         <div class="ui modal transition visible active animating">
+           <div class="content">${body}</div>
+           <div class="actions">
+             ${buttons.map(([label, action, extra]) => `<button class="ui button" data-action="${action}" ${extra || ""}>${label}</button>`).join("")}
+           </div>
+         </div>
+       </div>`
+    );
+    const modal = document.querySelector("[data-modal] .ui.modal");
+    setTimeout(() => modal.classList.remove("animating"), TRANSITION_MS);
+  }
+
+  function closeModal(immediately = false) {
+    const dimmer = document.querySelector("[data-modal]");
+    if (!dimmer) return;
+    if (immediately) {
+      dimmer.remove();
+      return;
+    }
+    dimmer.removeAttribute("data-modal");
+    dimmer.style.pointerEvents = "none";
+    const modal = dimmer.querySelector(".ui.modal");
+    modal.classList.remove("visible", "active");
+    modal.classList.add("animating");
+    dimmer.querySelectorAll("button").forEach((button) => button.remove());
+    setTimeout(() => dimmer.remove(), TRANSITION_MS);
+  }
+
+  // ---------------------------------------------------------------- views
+
+  const views = {
+    login() {
+      return `
+        <div class="sc-page">
+          <h2 class="ui header">SIGN IN</h2>
+          <form class="ui form" data-form="login" novalidate>
+            ${input("email", "Email")}
+            ${input("password", "Password", "", "password")}
+            <button class="ui primary button" type="submit">Sign In</button>
+          </form>
+          <div data-form-message></div>
+          <p>Don't have an account? <a href="/register" data-link>Sign Up</a></p>
+        </div>`;
+    },
+
+    register() {
+      return `
+        <div class="sc-page">
+          <h2 class="ui header">REGISTRATION</h2>
+          <form class="ui form" data-form="register" novalidate>
+            ${input("firstName", "First Name")}
+            ${input("lastName", "Last Name")}
+            ${input("address", "Address")}
+            ${input("email", "Email")}
+            ${input("phoneNumber", "Phone Number")}
+            ${input("password", "Password", "", "password")}
+            ${input("confirmPassword", "Confirm Password", "", "password")}
+            <button class="ui primary button" type="submit">Register</button>
+          </form>
+          <div data-form-message></div>
+          <p>Already have an account? <a href="/signin" data-link>Sign In</a></p>
+        </div>`;
+    },
+
+    myProducts() {
+      const products = api("GET", "/api/my-products");
+      return `
+        ${navbar()}
+        <div class="sc-page">
+          <h2 class="ui header">MY PRODUCTS</h2>
+          <a class="ui button" href="/add-product" data-link>Add Product</a>
+          <div class="sc-product-list">${products.map((product) => productCard(product, "edit-product")).join("")}</div>
+        </div>`;
+    },
+
+    productForm(product) {
+      const editing = Boolean(product);
+      product = product || { title: "", description: "", purchase_price: "", rent_price: "", categories: [], rent_duration_type: null };
+      // The real app reuses the add form for editing, including its submit button label.
+      return `
+        ${navbar()}
+        <div class="sc-page">
+          <h2 class="ui header">${editing ? "EDIT PRODUCT" : "ADD PRODUCT"}</h2>
+          <form class="ui form" data-form="${editing ? "edit-product" : "add-product"}" data-id="${editing ? product.id : ""}" novalidate>
+            ${input("title", "Title", product.title)}
+            <div class="field" data-field="description">
+              <label>Description</label>
+              <textarea name="description">${esc(product.description)}</textarea>
+            </div>
+            ${input("purchase_price", "Purchase Price", product.purchase_price)}
+            ${input("rent_price", "Rent Price", product.rent_price)}
+            ${dropdown("categories", "Categories", CATEGORIES, product.categories, true)}
+            ${dropdown("rent_duration_type", "Rent Duration", RENT_DURATION_TYPES, product.rent_duration_type ? [product.rent_duration_type] : [])}
+            <button class="ui primary button" type="submit">Add Product</button>
+          </form>
+          <div data-form-message></div>
+        </div>`;
+    },
+
+    browseProducts() {
+      browse.filters = {};
+      const page = api("GET", "/api/products?offset=0&limit=" + PAGE_SIZE);
+      browse.items = page.items;
+      browse.total = page.total;
+      return `
+        ${navbar()}
+        <div class="sc-page">
+          <h2 class="ui header">BROWSE PRODUCTS</h2>
+          <form class="ui form" data-form="browse-filter" novalidate>
+            ${input("title", "Title")}
+            ${dropdown("category", "Category", CATEGORIES)}
+            <div class="ui checkbox" data-checkbox="buy">
+              <input type="checkbox" name="is_buy_filter_turned_on" class="hidden" tabindex="0">
+              <label>Buy Filters</label>
+            </div>
+            <div class="sc-range" data-range="buy" hidden>
+              ${input("min_buy_range", "Min Price")}
+              ${input("max_buy_range", "Max Price")}
+            </div>
+            <div class="ui checkbox" data-checkbox="rent">
+              <input type="checkbox" name="is_rent_filter_turned_on" class="hidden" tabindex="0">
+              <label>Rent Filters</label>
+            </div>
+            <div class="sc-range" data-range="rent" hidden>
+              ${input("min_rent_range", "Min Rent")}
+              ${input("max_rent_range", "Max Rent")}
+              ${dropdown("rent_duration_type", "Rent Duration", RENT_DURATION_TYPES)}
+            </div>
+            <button class="ui button" type="button" data-action="clear-filters">Clear</button>
+            <button class="ui primary button" type="submit">Filter</button>
+          </form>
+          <div class="sc-product-list" data-browse-list></div>
+          <div data-load-more></div>
+        </div>`;
+    },
+
+    productDetails(product) {
+      const status = product.status.charAt(0).toUpperCase() + product.status.slice(1);
+      const actions =
+        product.status === "available" && !product.owned
+          ? `<button class="ui button" data-action="buy" data-id="${product.id}">Buy</button>
+             <button class="ui button" data-action="rent" data-id="${product.id}">Rent</button>`
+          : "";
+      return `
+        ${navbar()}
+        <div class="sc-page" data-product-id="${product.id}">
+          <h2 class="ui header">${esc(product.title)}</h2>
+          <div>Categories: ${esc(product.categories.join(", "))}</div>
+          <div>${esc(priceLine(product))}</div>
+          <div>${esc(product.description)}</div>
+          <div class="sc-status">Status: ${status}</div>
+          ${product.owned ? '<div class="ui label">You own this product</div>' : ""}
+          <div class="sc-actions">${actions}</div>
+        </div>`;
+    },
+
+    accountSettings() {
+      const user = api("GET", "/api/me");
+      return `
+        ${navbar()}
+        <div class="sc-page">
+          <h2 class="ui header">ACCOUNT SETTINGS</h2>
+          <form class="ui form" data-form="account" novalidate>
+            ${input("first_name", "First Name", user.first_name)}
+            ${input("last_name", "Last Name", user.last_name)}
+            ${input("address", "Address", user.address)}
+            ${input("email", "Email", user.email)}
+            ${input("phone_number", "Phone Number", user.phone_number)}
+            <button class="ui primary button" type="submit">Update</button>
+          </form>
+          <div data-form-message></div>
+        </div>`;
+    },
+  };
+
+  function resolve(path) {
+    if (path === "/register") return { html: views.register() };
+    if (["/", "/signin", "/teebay-buggy", "/teebay-buggy/"].includes(path)) {
+      if (token() && path !== "/signin") return { redirect: "/my-products" };
+      return { html: views.login() };
+    }
+    if (!token()) return { redirect: "/signin" };
+    if (path === "/my-products") return { html: views.myProducts() };
+    if (path === "/add-product") return { html: views.productForm(null) };
+    if (path === "/browse-products") return { html: views.browseProducts() };
+    if (path === "/account-settings") return { html: views.accountSettings() };
+    const edit = path.match(/^\/edit-product\/(\d+)$/);
+    if (edit) return { html: views.productForm(api("GET", "/api/products/" + edit[1])) };
+    const details = path.match(/^\/product-details\/(\d+)$/);
+    if (details) return { html: views.productDetails(api("GET", "/api/products/" + details[1])) };
+    return { redirect: token() ? "/my-products" : "/signin" };
+  }
+
+  function render(path, mode) {
+    let view;
+    try {
+      view = resolve(path);
+    } catch (error) {
+      if (error.status === 401) {
+        localStorage.removeItem("token");
+        view = { redirect: "/signin" };
+      } else {
+        view = { html: `${navbar()}<div class="sc-page"><div class="ui negative message">${esc(error.message)}</div></div>` };
+      }
+    }
+    if (view.redirect) {
+      render(view.redirect, mode === "push" ? "push" : "replace");
+      return;
+    }
+    if (mode === "push") history.pushState({}, "", path);
+    if (mode === "replace") history.replaceState({}, "", path);
+    closeModal(true);
+    root.innerHTML = view.html;
+    if (path === "/browse-products") renderBrowseList();
+  }
+
+  const navigate = (path) => render(path, "push");
+
+  function renderBrowseList() {
+    const list = root.querySelector("[data-browse-list]");
+    list.innerHTML = browse.items.map((product) => productCard(product, "open-product")).join("");
+    root.querySelector("[data-load-more]").innerHTML =
+      browse.items.length < browse.total ? '<button class="ui button" type="button" data-action="load-more">Load More</button>' : "";
+  }
+
+  function loadBrowsePage(offset) {
+    const query = new URLSearchParams({ ...browse.filters, offset: String(offset), limit: String(PAGE_SIZE) });
+    const page = api("GET", "/api/products?" + query.toString());
+    browse.items = offset === 0 ? page.items : browse.items.concat(page.items);
+    browse.total = page.total;
+    renderBrowseList();
+  }
+
+  // ---------------------------------------------------------------- form handlers
+
+  const forms = {
+    login(form) {
+      const values = formValues(form);
+      if (!values.email || !values.password) return showErrors(form, { password: "Password is required" });
+      if (!EMAIL_PATTERN.test(values.email)) return showErrors(form, { email: "Please enter a valid email address" });
+      showErrors(form, {});
+      try {
+        localStorage.setItem("token", api("POST", "/api/login", { email: values.email, password: values.password }).token);
+        navigate("/my-products");
+      } catch (error) {
+        showMessage(error.message);
+      }
+    },
+
+    register(form) {
+      const values = formValues(form);
+      const errors = {};
+      if (!values.lastName) errors.lastName = "Last Name is required";
+      if (!values.address) errors.address = "Address is required";
+      if (!values.email) errors.email = "Email is required";
+      else if (!EMAIL_PATTERN.test(values.email)) errors.email = "Please enter a valid email address";
+      if (!values.phoneNumber) errors.phoneNumber = "Phone number is required";
+      if (!values.password) errors.password = "Password is required";
+      if (showErrors(form, errors)) return;
+      try {
+        const result = api("POST", "/api/register", {
+          first_name: values.firstName,
+          last_name: values.lastName,
+          address: values.address,
+          email: values.email,
+          phone_number: values.phoneNumber,
+          password: values.password,
+          confirm_password: values.confirmPassword,
+        });
+        localStorage.setItem("token", result.token);
+        navigate("/my-products");
+      } catch (error) {
+        showMessage(error.message);
+      }
+    },
+
+    account(form) {
+      const values = formValues(form);
+      const errors = {};
+      if (!values.first_name) errors.first_name = "First Name is required";
+      if (!values.last_name) errors.last_name = "Last Name is required";
+      if (!values.address) errors.address = "Address is required";
+      if (!values.email) errors.email = "Email is required";
+      else if (!EMAIL_PATTERN.test(values.email)) errors.email = "Please enter a valid email address";
+      if (!isNumber(values.phone_number)) errors.phone_number = "phone_number must be a `number` type";
+      if (showErrors(form, errors)) return;
+      try {
+        api("PUT", "/api/me", { ...values, phone_number: Number(values.phone_number) });
+        showMessage("User updated!", true);
+      } catch (error) {
+        showMessage(error.message);
+      }
+    },
+
+    "add-product"(form) {
+      submitProduct(form, false);
+    },
+
+    "edit-product"(form) {
+      submitProduct(form, true);
+    },
+
+    "browse-filter"(form) {
+      const values = formValues(form);
+      const filters = {};
+      if (values.title.trim()) filters.title = values.title.trim();
+      const category = dropdownValue("category");
+      if (category.length) filters.category = category[0];
+      if (values.is_buy_filter_turned_on) {
+        filters.min_buy_range = values.min_buy_range;
+        filters.max_buy_range = values.max_buy_range;
+      }
+      if (values.is_rent_filter_turned_on) {
+        filters.min_rent_range = values.min_rent_range;
+        filters.max_rent_range = values.max_rent_range;
+        const duration = dropdownValue("rent_duration_type");
+        if (duration.length) filters.rent_duration_type = duration[0];
+      }
+      browse.filters = filters;
+      loadBrowsePage(0);
+    },
+  };
+
+  function submitProduct(form, editing) {
+    const values = formValues(form);
+    const categories = dropdownValue("categories");
+    const duration = dropdownValue("rent_duration_type");
+    const errors = {};
+    // Title errors really are reported with the registration form's last name message.
+    if (!values.title.trim()) errors.title = "Last Name is required";
+    if (!values.description.trim()) errors.description = "Description cannot be empty";
+    ["purchase_price", "rent_price"].forEach((field) => {
+      const label = field === "purchase_price" ? "Purchase price" : "Rent price";
+      if (editing && !values[field].trim()) errors[field] = `${label} is required`;
+      else if (!isNumber(values[field])) errors[field] = `${label} must be a number`;
+    });
+    if (!categories.length) errors.categories = "Need to select an option";
+    if (!duration.length) errors.rent_duration_type = "Need to select an option";
+    if (showErrors(form, errors)) return;
+    const payload = {
+      title: values.title.trim(),
+      description: values.description.trim(),
+      purchase_price: Number(values.purchase_price),
+      rent_price: Number(values.rent_price),
+      categories,
+      rent_duration_type: duration[0],
+    };
+    try {
+      if (editing) {
+        api("PUT", "/api/products/" + form.dataset.id, payload);
+        showMessage("Product updated!", true);
+      } else {
+        api("POST", "/api/products", payload);
+        navigate("/my-products");
+      }
+    } catch (error) {
+      showMessage(error.message);
+    }
+  }
+
+  // ---------------------------------------------------------------- click actions
+
+  function rentDatesValid() {
+    const start = document.querySelector("input[name='start_date']").value;
+    const end = document.querySelector("input[name='end_date']").value;
+    if (!start || !end) return false;
+    const today = new Date().toISOString().slice(0, 10);
+    const days = (new Date(end) - new Date(start)) / 86400000;
+    return start >= today && days > 0 && days <= 7;
+  }
+
+  const actions = {
+    logout() {
+      openModal("Are you sure you want to log out?", [
+        ["Cancel", "modal-cancel"],
+        ["Yes I am sure!", "confirm-logout"],
+      ]);
+    },
+    "confirm-logout"() {
+      localStorage.removeItem("token");
+      closeModal();
+      navigate("/signin");
+    },
+    "modal-cancel"() {
+      closeModal();
+    },
+    "edit-product"(element) {
+      navigate("/edit-product/" + element.dataset.id);
+    },
+    "open-product"(element) {
+      navigate("/product-details/" + element.dataset.id);
+    },
+    "delete-product"(element) {
+      openModal("Are you sure you want to delete this product?", [
+        ["Cancel", "modal-cancel"],
+        ["Yes, delete", "confirm-delete", `data-id="${element.dataset.id}"`],
+      ]);
+    },
+    "confirm-delete"(element) {
+      api("DELETE", "/api/products/" + element.dataset.id);
+      closeModal();
+      render("/my-products", null);
+    },
+    "clear-filters"() {
+      const form = root.querySelector("[data-form='browse-filter']");
+      form.reset();
+      form.querySelectorAll(".ui.dropdown").forEach((element) => setDropdown(element, []));
+      form.querySelectorAll(".ui.checkbox").forEach((element) => setCheckbox(element, false));
+      browse.filters = {};
+      loadBrowsePage(0);
+    },
+    "load-more"() {
+      loadBrowsePage(browse.items.length);
+    },
+    buy(element) {
+      openModal("Are you sure you want to buy this product?", [
+        ["Cancel", "modal-cancel"],
+        ["Yes!", "confirm-buy", `data-id="${element.dataset.id}"`],
+      ]);
+    },
+    "confirm-buy"(element) {
+      api("POST", `/api/products/${element.dataset.id}/buy`);
+      closeModal();
+      render(location.pathname, null);
+    },
+    rent(element) {
+      openModal(
+        `<div class="field"><label>From</label><input type="date" name="start_date"></div>
+         <div class="field"><label>To</label><input type="date" name="end_date"></div>`,
+        [
+          ["Cancel", "modal-cancel"],
+          ["Book rent", "book-rent", `data-id="${element.dataset.id}" disabled`],
+        ]
+      );
+    },
+    "book-rent"(element) {
+      const start_date = document.querySelector("input[name='start_date']").value;
+      const end_date = document.querySelector("input[name='end_date']").value;
+      api("POST", `/api/products/${element.dataset.id}/rent`, { start_date, end_date });
+      closeModal();
+      render(location.pathname, null);
+    },
+  };
+
+  function setDropdown(element, values) {
+    element.dataset.value = JSON.stringify(values);
+    element.querySelector(".text").textContent = values.length ? values.join(", ") : "Select an option";
+  }
+
+  function setCheckbox(element, checked) {
+    element.querySelector("input").checked = checked;
+    element.classList.toggle("checked", checked);
+    const range = root.querySelector(`[data-range="${element.dataset.checkbox}"]`);
+    if (range) range.hidden = !checked;
+  }
+
+  document.addEventListener("click", (event) => {
+    const target = event.target;
+    const link = target.closest("a[data-link]");
+    if (link) {
+      event.preventDefault();
+      navigate(link.getAttribute("href"));
+      return;
+    }
+
+    const openDropdown = target.closest(".ui.dropdown");
+    document.querySelectorAll(".ui.dropdown.active").forEach((element) => {
+      if (element !== openDropdown) element.classList.remove("active", "visible");
+    });
+    const option = target.closest(".ui.dropdown [role='option']");
+    if (option) {
+      const element = option.closest(".ui.dropdown");
+      const current = JSON.parse(element.dataset.value || "[]");
+      const value = option.dataset.value;
+      const multiple = element.dataset.multiple === "true";
+      setDropdown(element, multiple ? (current.includes(value) ? current : current.concat(value)) : [value]);
+      element.classList.remove("active", "visible");
+      return;
+    }
+    if (openDropdown) {
+      openDropdown.classList.toggle("active");
+      openDropdown.classList.toggle("visible");
+      return;
+    }
+
+    const checkbox = target.closest(".ui.checkbox");
+    if (checkbox) {
+      event.preventDefault();
+      setCheckbox(checkbox, !checkbox.querySelector("input").checked);
+      return;
+    }
+
+    const action = target.closest("[data-action]");
+    if (action && actions[action.dataset.action]) {
+      event.preventDefault();
+      try {
+        actions[action.dataset.action](action);
+      } catch (error) {
+        closeModal(true);
+        showMessage(error.message);
+      }
+    }
+  });
+
+  document.addEventListener("submit", (event) => {
+    const form = event.target.closest("form[data-form]");
+    if (!form || !forms[form.dataset.form]) return;
+    event.preventDefault();
+    forms[form.dataset.form](form);
+  });
+
+  document.addEventListener("input", (event) => {
+    if (event.target.matches("input[name='start_date'], input[name='end_date']")) {
+      const book = document.querySelector("button[data-action='book-rent']");
+      if (book) book.disabled = !rentDatesValid();
+    }
+  });
+
+  window.addEventListener("popstate", () => render(location.pathname, "replace"));
+  render(location.pathname, "replace");
+})();
@@ -0,0 +1,225 @@
+import html
+import itertools
+import time
+from typing import TYPE_CHECKING, Callable
+
+import allure
+
+from support.catalog_index import ProductCard
+
+if TYPE_CHECKING:
+    from pages.browse_products_page import BrowseProductsPage
+    from support.filter_oracle import CatalogOracle
+
+FILTER_FIELDS = ("title", "category", "buy_range", "rent_range", "rent_duration")
+
+
+def covering_rows(
+    parameters: dict[str, list],
+    strength: int = 2,
+    allowed: Callable[[dict], bool] | None = None,
+) -> list[dict]:
+    # Greedy covering array: every combination of `strength` parameter values that `allowed` accepts
+    # appears in at least one row. `allowed` gets partial rows and must accept any that can still be
+    # completed. strength=len(parameters) is the full cartesian product.
+    names = list(parameters)
+    strength = min(strength, len(names))
+    allowed = allowed or (lambda row: True)
+
+    def values(assignment: dict[str, int]) -> dict:
+        return {name: parameters[name][index] for name, index in assignment.items()}
+
+    uncovered = set()
+    for group in itertools.combinations(names, strength):
+        for indexes in itertools.product(*(range(len(parameters[name])) for name in group)):
+            assignment = dict(zip(group, indexes))
+            if allowed(values(assignment)):
+                uncovered.add(tuple(assignment.items()))
+
+    rows = []
+    while uncovered:
+        row = dict(min(uncovered))
+        for name in names:
+            if name in row:
+                continue
+            candidates = [index for index in range(len(parameters[name])) if allowed(values({**row, name: index}))]
+            if not candidates:
+                raise ValueError(f"No allowed value for '{name}' after {values(row)}")
+            row[name] = max(candidates, key=lambda index: _newly_covered(uncovered, row, name, index))
+        for group in itertools.combinations(names, strength):
+            uncovered.discard(tuple((name, row[name]) for name in group))
+        rows.append(values({name: row[name] for name in names}))
+    return rows
+
+
+def _newly_covered(uncovered: set, row: dict[str, int], name: str, index: int) -> int:
+    candidate = {**row, name: index}
+    return sum(
+        1
+        for combination in uncovered
+        if (name, index) in combination and all(candidate.get(other) == value for other, value in combination)
+    )
+
+
+def rent_duration_needs_range(row: dict) -> bool:
+    # A rent duration is only entered together with a rent range, and a rent range always needs one.
+    if "rent_range" not in row or "rent_duration" not in row:
+        return True
+    return (row["rent_range"] is None) == (row["rent_duration"] is None)
+
+
+def filter_rows(matrix: dict) -> list[dict]:
+    parameters = {
+        "title": matrix["titles"],
+        "category": matrix["categories"],
+        "buy_range": matrix["buy_ranges"],
+        "rent_range": matrix["rent_ranges"],
+        "rent_duration": [None, *matrix["rent_durations"]],
+    }
+    return covering_rows(parameters, matrix.get("strength", 2), allowed=rent_duration_needs_range)
+
+
+def describe(row: dict) -> str:
+    parts = []
+    for field in FILTER_FIELDS:
+        value = row.get(field)
+        if value is not None:
+            parts.append(f"{field}={'-'.join(value) if isinstance(value, list) else value}")
+    return ", ".join(parts) or "no filters"
+
+
+def _number(value: str) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _in_range(price: float | None, bounds: list[str]) -> bool:
+    minimum, maximum = (_number(bound) for bound in bounds)
+    if price is None:
+        return True
+    return (minimum is None or price >= minimum) and (maximum is None or price <= maximum)
+
+
+def card_violations(row: dict, card: ProductCard) -> list[str]:
+    # Filters the card contradicts; a price or duration the card does not show is not held against it.
+    violated = []
+    if row.get("title") and row["title"].lower() not in card.title.lower():
+        violated.append("title")
+    if row.get("category") and card.categories and row["category"] not in card.categories:
+        violated.append("category")
+    if row.get("buy_range") and not _in_range(card.purchase_price, row["buy_range"]):
+        violated.append("buy_range")
+    if row.get("rent_range") and not _in_range(card.rent_price, row["rent_range"]):
+        violated.append("rent_range")
+    if row.get("rent_duration") and card.rent_duration and card.rent_duration != row["rent_duration"].lower():
+        violated.append("rent_duration")
+    return violated
+
+
+class FilterExplorer:
+    # Runs filter combinations one after another in one Browse Products session. Only the controls whose
+    # value differs from the previous combination are touched; a selected category cannot be unselected
+    # on its own, so rows are ordered with the category-free ones first and Clear is never needed after.
+    # With an oracle the shown products are diffed against the expected ones, which also catches products
+    # missing from the list; without one only cards contradicting the filters are caught.
+    def __init__(
+        self,
+        browse_page: "BrowseProductsPage",
+        known_bug_filters: list[str] | None = None,
+        oracle: "CatalogOracle | None" = None,
+    ) -> None:
+        self.browse_page = browse_page
+        self.known_bug_filters = set(known_bug_filters or [])
+        self.oracle = oracle
+        self.current = dict.fromkeys(FILTER_FIELDS)
+        self.results: list[dict] = []
+
+    @staticmethod
+    def session_order(rows: list[dict]) -> list[dict]:
+        return sorted(rows, key=lambda row: (row.get("category") is not None, row.get("category") or ""))
+
+    def apply(self, row: dict) -> list[str]:
+        changed = [field for field in FILTER_FIELDS if row.get(field) != self.current[field]]
+        if "category" in changed and row.get("category") is None:
+            self.browse_page.clear_filters()
+            self.current = dict.fromkeys(FILTER_FIELDS)
+            changed = [field for field in FILTER_FIELDS if row.get(field) is not None]
+        if "title" in changed:
+            self.browse_page.fill_title(row.get("title") or "")
+        if "category" in changed:
+            self.browse_page.choose_category(row["category"])
+        if "buy_range" in changed:
+            if row.get("buy_range") is None:
+                self.browse_page.disable_buy_filter()
+            else:
+                self.browse_page.set_buy_range(*row["buy_range"])
+        if "rent_range" in changed or "rent_duration" in changed:
+            if row.get("rent_range") is None:
+                self.browse_page.disable_rent_filter()
+            else:
+                self.browse_page.set_rent_range(*row["rent_range"], row["rent_duration"])
+        self.browse_page.apply_filters()
+        self.current = {field: row.get(field) for field in FILTER_FIELDS}
+        return changed
+
+    def run(self, rows: list[dict]) -> list[dict]:
+        for row in self.session_order(rows):
+            start = time.perf_counter()
+            changed = self.apply(row)
+            cards = self.browse_page.all_product_cards()
+            violations = {card.title: card_violations(row, card) for card in cards}
+            violations = {title: fields for title, fields in violations.items() if fields}
+            if self.oracle is not None:
+                diff = self.oracle.diff(row, cards)
+            else:
+                diff = {"missing": [], "unexpected": sorted(violations)}
+            # Extra products are a known bug only when every filter they break is listed as one.
+            unexplained = [
+                title
+                for title in diff["unexpected"]
+                if not violations.get(title) or not set(violations[title]) <= self.known_bug_filters
+            ]
+            if not diff["missing"] and not diff["unexpected"]:
+                status = "passed"
+            elif not diff["missing"] and not unexplained:
+                status = "known_bug"
+            else:
+                status = "failed"
+            self.results.append(
+                {
+                    "combination": describe(row),
+                    "changed": changed,
+                    "count": len(cards),
+                    "expected_count": self.oracle.count(row) if self.oracle is not None else None,
+                    "missing": diff["missing"],
+                    "unexpected": diff["unexpected"],
+                    "violations": violations,
+                    "status": status,
+                    "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+                }
+            )
+        return self.results
+
+    def attach_results(self) -> None:
+        rows = []
+        for result in self.results:
+            violations = "; ".join(f"{title}: {', '.join(fields)}" for title, fields in result["violations"].items())
+            cells = [
+                result["combination"],
+                ", ".join(result["changed"]) or "-",
+                result["count"],
+                "-" if result["expected_count"] is None else result["expected_count"],
+                result["status"],
+                ", ".join(result["missing"]),
+                violations,
+                result["elapsed_ms"],
+            ]
+            rows.append("<tr>" + "".join(f"<td>{html.escape(str(cell))}</td>" for cell in cells) + "</tr>")
+        table = (
+            "<table border='1' cellpadding='4'><tr><th>Filters</th><th>Changed</th><th>Products</th>"
+            "<th>Expected</th><th>Status</th><th>Missing</th><th>Violations</th><th>ms</th></tr>"
+            f"{''.join(rows)}</table>"
+        )
+        allure.attach(table, name="Filter combinations", attachment_type=allure.attachment_type.HTML)
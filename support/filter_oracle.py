@@ -0,0 +1,132 @@
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING
+
+from support.catalog_index import ProductCard
+
+if TYPE_CHECKING:
+    from pages.browse_products_page import BrowseProductsPage
+
+
+def _number(value) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def filters_from_case(case: dict) -> dict:
+    # browse_products.json case keys -> the filter row format FilterExplorer applies.
+    buy_range = [case["min_buy_range"], case["max_buy_range"]] if "min_buy_range" in case else None
+    rent_range = [case["min_rent_range"], case["max_rent_range"]] if "min_rent_range" in case else None
+    return {
+        "title": case.get("title"),
+        "category": case.get("category"),
+        "buy_range": buy_range,
+        "rent_range": rent_range,
+        "rent_duration": case.get("rent_duration_type") if rent_range else None,
+    }
+
+
+class _PriceColumn:
+    # Row masks over the cards sorted by price: prefix[j] holds the j cheapest cards, so any price range is
+    # the difference of two prefixes found by bisection.
+    def __init__(self, prices: list[float | None]) -> None:
+        order = sorted((price, index) for index, price in enumerate(prices) if price is not None)
+        self.values = [price for price, _ in order]
+        self.prefix = [0]
+        for _, index in order:
+            self.prefix.append(self.prefix[-1] | (1 << index))
+
+    def between(self, minimum: float | None, maximum: float | None) -> int:
+        low = bisect_left(self.values, minimum) if minimum is not None else 0
+        high = bisect_right(self.values, maximum) if maximum is not None else len(self.values)
+        return self.prefix[high] & ~self.prefix[low] if high > low else 0
+
+
+class CatalogOracle:
+    # Expected Browse Products results computed from one catalog snapshot. Each filter value is a bitmask
+    # over the cards (bit i = card i) and a combination is the AND of its masks, so a query is a handful of
+    # big-integer operations however many products the catalog holds.
+    def __init__(self, cards: list[ProductCard]) -> None:
+        self.cards = list(cards)
+        self.all_rows = (1 << len(self.cards)) - 1
+        self._titles = [card.title.lower() for card in self.cards]
+        self._title_masks: dict[str, int] = {}
+        self._category_masks: dict[str, int] = defaultdict(int)
+        self._duration_masks: dict[str, int] = defaultdict(int)
+        for index, card in enumerate(self.cards):
+            for category in card.categories:
+                self._category_masks[category] |= 1 << index
+            self._duration_masks[card.rent_duration] |= 1 << index
+        self._purchase = _PriceColumn([card.purchase_price for card in self.cards])
+        self._rent = _PriceColumn([card.rent_price for card in self.cards])
+
+    @classmethod
+    def capture(cls, browse_page: "BrowseProductsPage") -> "CatalogOracle":
+        browse_page.clear_filters()
+        return cls(browse_page.all_product_cards())
+
+    def _title_mask(self, needle: str) -> int:
+        if needle not in self._title_masks:
+            mask = 0
+            for index, title in enumerate(self._titles):
+                if needle in title:
+                    mask |= 1 << index
+            self._title_masks[needle] = mask
+        return self._title_masks[needle]
+
+    def _range_mask(self, column: _PriceColumn, bounds: list[str]) -> int:
+        minimum, maximum = (_number(bound) for bound in bounds)
+        if minimum is None and maximum is None:
+            return self.all_rows
+        return column.between(minimum, maximum)
+
+    def mask(self, filters: dict) -> int:
+        mask = self.all_rows
+        title = (filters.get("title") or "").strip().lower()
+        if title:
+            mask &= self._title_mask(title)
+        if filters.get("category"):
+            mask &= self._category_masks.get(filters["category"], 0)
+        if filters.get("buy_range"):
+            mask &= self._range_mask(self._purchase, filters["buy_range"])
+        if filters.get("rent_range"):
+            mask &= self._range_mask(self._rent, filters["rent_range"])
+            if filters.get("rent_duration"):
+                mask &= self._duration_masks.get(filters["rent_duration"].lower(), 0)
+        return mask
+
+    def count(self, filters: dict) -> int:
+        return self.mask(filters).bit_count()
+
+    def expected(self, filters: dict) -> list[ProductCard]:
+        mask = self.mask(filters)
+        return [card for index, card in enumerate(self.cards) if mask >> index & 1]
+
+    def diff(self, filters: dict, shown: list[ProductCard]) -> dict[str, list[str]]:
+        expected = Counter(card.title for card in self.expected(filters))
+        actual = Counter(card.title for card in shown)
+        return {
+            "missing": sorted((expected - actual).elements()),
+            "unexpected": sorted((actual - expected).elements()),
+        }
+
+
+class CatalogSnapshot:
+    # One oracle per pytest process; tests that change the catalog drop it so the next user captures again.
+    def __init__(self) -> None:
+        self.oracle: CatalogOracle | None = None
+        self.captures = 0
+
+    def oracle_for(self, browse_page: "BrowseProductsPage") -> CatalogOracle:
+        if self.oracle is None:
+            self.oracle = CatalogOracle.capture(browse_page)
+            self.captures += 1
+        return self.oracle
+
+    def invalidate(self) -> None:
+        self.oracle = None
+
+
+CATALOG_SNAPSHOT = CatalogSnapshot()
@@ -0,0 +1,356 @@
+import argparse
+import asyncio
+import functools
+import inspect
+import json
+import math
+import random
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from config import Settings
+from pages.aio.browse_products_page import BrowseProductsPage
+from pages.aio.login_page import LoginPage
+from pages.aio.my_products_page import MyProductsPage
+from pages.aio.view_product_page import ViewProductPage
+from support.browser_server import connect_or_launch_async
+from support.catalog_index import CatalogIndex
+from support.fake_teebay import FakeTeebayServer
+from test_data import load_data
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser
+
+# Cards a virtual user picks from; small enough to stay on the first page, where products are opened from.
+BROWSE_SAMPLE = 5
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    mix = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        name, _, weight = item.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    unknown = set(mix) - set(SCENARIOS)
+    if unknown:
+        raise ValueError(f"Unknown load scenarios: {', '.join(sorted(unknown))}")
+    return mix
+
+
+class LoadProfile:
+    def __init__(
+        self,
+        users: int,
+        ramp_up_s: float,
+        duration_s: float,
+        think_time_s: tuple[float, float],
+        mix: dict[str, float],
+        iterations: int | None = None,
+        seed: int | None = None,
+    ) -> None:
+        self.users = users
+        self.ramp_up_s = ramp_up_s
+        self.duration_s = duration_s
+        self.think_time_s = think_time_s
+        self.mix = mix
+        self.iterations = iterations
+        self.seed = seed
+
+    @classmethod
+    def from_settings(cls, **overrides) -> "LoadProfile":
+        think_time = Settings.LOAD_THINK_TIME_SECONDS or [0.0]
+        values = {
+            "users": Settings.LOAD_USERS,
+            "ramp_up_s": Settings.LOAD_RAMP_UP_SECONDS,
+            "duration_s": Settings.LOAD_DURATION_SECONDS,
+            "think_time_s": (think_time[0], think_time[-1]),
+            "mix": parse_mix(Settings.LOAD_SCENARIO_MIX),
+        }
+        values.update({key: value for key, value in overrides.items() if value is not None})
+        return cls(**values)
+
+    def as_dict(self) -> dict:
+        return {
+            "users": self.users,
+            "ramp_up_s": self.ramp_up_s,
+            "duration_s": self.duration_s,
+            "think_time_s": list(self.think_time_s),
+            "mix": self.mix,
+            "iterations": self.iterations,
+            "seed": self.seed,
+        }
+
+
+class LoadRecorder:
+    def __init__(self) -> None:
+        self.records: list[dict] = []
+        self.started = time.perf_counter()
+
+    def add(self, user: int, scenario: str, action: str, elapsed_ms: float, failed: bool) -> None:
+        self.records.append(
+            {
+                "user": user,
+                "scenario": scenario,
+                "action": action,
+                "elapsed_ms": round(elapsed_ms, 2),
+                "at_s": round(time.perf_counter() - self.started, 3),
+                "failed": failed,
+            }
+        )
+
+
+class TimedPageObject:
+    # Times only the calls a scenario makes on the page object; the methods they call internally are
+    # part of that action's latency rather than separate rows.
+    def __init__(self, page_object, user: "VirtualUser") -> None:
+        self._page_object = page_object
+        self._user = user
+
+    def __getattr__(self, name: str):
+        value = getattr(self._page_object, name)
+        if name.startswith("_") or not inspect.iscoroutinefunction(value):
+            return value
+
+        @functools.wraps(value)
+        async def call(*args, **kwargs):
+            return await self._user.timed(f"{type(self._page_object).__name__}.{name}", value(*args, **kwargs))
+
+        return call
+
+
+class VirtualUser:
+    def __init__(self, index: int, browser: "Browser", profile: LoadProfile, recorder: LoadRecorder) -> None:
+        self.index = index
+        self.browser = browser
+        self.profile = profile
+        self.recorder = recorder
+        self.rng = random.Random(None if profile.seed is None else profile.seed + index)
+        self.catalog = CatalogIndex()
+        self.context = None
+        self.page = None
+        self.scenario = ""
+        self.logged_in = False
+
+    async def timed(self, action: str, awaitable):
+        start = time.perf_counter()
+        failed = False
+        try:
+            return await awaitable
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.recorder.add(self.index, self.scenario, action, (time.perf_counter() - start) * 1000, failed)
+
+    async def page_object(self, cls, *args):
+        return TimedPageObject(await cls.create(self.page, *args), self)
+
+    async def think(self) -> None:
+        await asyncio.sleep(self.rng.uniform(*self.profile.think_time_s))
+
+    async def open(self) -> None:
+        self.context = await self.browser.new_context()
+        self.page = await self.context.new_page()
+        self.logged_in = False
+
+    async def close(self) -> None:
+        if self.context is not None:
+            await self.context.close()
+            self.context = None
+
+    async def run(self, deadline: float) -> None:
+        await self.open()
+        names, weights = list(self.profile.mix), list(self.profile.mix.values())
+        completed = 0
+        try:
+            while time.perf_counter() < deadline and (
+                self.profile.iterations is None or completed < self.profile.iterations
+            ):
+                self.scenario = self.rng.choices(names, weights)[0]
+                try:
+                    if not self.logged_in:
+                        await login(self)
+                    await self.timed(f"scenario:{self.scenario}", SCENARIOS[self.scenario](self))
+                except Exception:
+                    # Start over from a clean context so one broken page does not fail every later iteration.
+                    await self.close()
+                    await self.open()
+                completed += 1
+        finally:
+            await self.close()
+
+
+async def login(user: VirtualUser) -> None:
+    login_page = await user.page_object(LoginPage)
+    await login_page.open()
+    await user.think()
+    await login_page.login(email=Settings.USERNAME, password=Settings.PASSWORD)
+    await user.timed("navigation:my_products", user.page.wait_for_url(Settings.MY_PRODUCTS_URL))
+    user.logged_in = True
+    await user.think()
+
+
+def _filter_categories() -> list[str]:
+    cases = load_data("browse_products")["category_filter"]
+    return sorted({case["category"] for group in cases.values() for case in group})
+
+
+async def _browse(user: VirtualUser, with_filter: bool) -> list[str]:
+    browse_page = await user.page_object(BrowseProductsPage)
+    await browse_page.open_from_my_products()
+    await user.think()
+    if with_filter:
+        await browse_page.choose_category(user.rng.choice(_filter_categories()))
+        await browse_page.apply_filters()
+        await user.think()
+    return await browse_page.all_product_titles(limit=BROWSE_SAMPLE)
+
+
+async def _open_random_product(user: VirtualUser, titles: list[str]):
+    view_page = await user.page_object(ViewProductPage, user.catalog)
+    if titles:
+        await view_page.open_product_by_title(user.rng.choice(titles))
+        await user.think()
+    return view_page
+
+
+async def _back_to_my_products(user: VirtualUser) -> None:
+    my_products_page = await user.page_object(MyProductsPage)
+    await my_products_page.refresh()
+    await user.think()
+
+
+async def browse_scenario(user: VirtualUser) -> None:
+    titles = await _browse(user, with_filter=True)
+    await _open_random_product(user, titles)
+    await _back_to_my_products(user)
+
+
+async def buy_scenario(user: VirtualUser) -> None:
+    view_page = await _open_random_product(user, await _browse(user, with_filter=False))
+    if await view_page.buy_button_visible() and not await view_page.is_owned_by_logged_user():
+        await view_page.open_buy_modal()
+        await user.think()
+        await view_page.confirm_buy()
+        await user.think()
+    await _back_to_my_products(user)
+
+
+async def rent_scenario(user: VirtualUser) -> None:
+    view_page = await _open_random_product(user, await _browse(user, with_filter=False))
+    if await view_page.rent_button_visible() and not await view_page.is_owned_by_logged_user():
+        await view_page.open_rent_modal()
+        await view_page.set_rent_dates_from_offsets(1, 3)
+        await user.think()
+        await view_page.book_rent()
+        await user.think()
+    await _back_to_my_products(user)
+
+
+SCENARIOS = {"browse": browse_scenario, "buy": buy_scenario, "rent": rent_scenario}
+
+
+async def run_load(browser: "Browser", profile: LoadProfile, recorder: LoadRecorder) -> float:
+    start = time.perf_counter()
+    deadline = start + profile.ramp_up_s + profile.duration_s
+    users = [VirtualUser(index, browser, profile, recorder) for index in range(profile.users)]
+
+    async def start_user(user: VirtualUser) -> None:
+        # Users join evenly across the ramp-up window; each keeps going until the shared deadline.
+        await asyncio.sleep(profile.ramp_up_s * user.index / max(profile.users, 1))
+        await user.run(deadline)
+
+    await asyncio.gather(*(start_user(user) for user in users))
+    return time.perf_counter() - start
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[max(math.ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+
+def summarize_load(records: list[dict], elapsed_s: float) -> list[dict]:
+    grouped: dict[str, list[dict]] = defaultdict(list)
+    for record in records:
+        grouped[record["action"]].append(record)
+    summary = []
+    for action, calls in grouped.items():
+        latencies = [call["elapsed_ms"] for call in calls if not call["failed"]]
+        summary.append(
+            {
+                "action": action,
+                "count": len(calls),
+                "errors": sum(call["failed"] for call in calls),
+                "throughput_per_s": round(len(calls) / elapsed_s, 3) if elapsed_s else 0.0,
+                "p50_ms": percentile(latencies, 50),
+                "p95_ms": percentile(latencies, 95),
+                "p99_ms": percentile(latencies, 99),
+                "max_ms": max(latencies, default=0.0),
+            }
+        )
+    return sorted(summary, key=lambda row: row["p95_ms"], reverse=True)
+
+
+def format_load_summary(summary: list[dict]) -> list[str]:
+    lines = [f"{'action':<45} {'count':>6} {'errors':>6} {'per s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"]
+    for row in summary:
+        lines.append(
+            f"{row['action']:<45} {row['count']:>6} {row['errors']:>6} {row['throughput_per_s']:>7.2f} "
+            f"{row['p50_ms']:>8.0f} {row['p95_ms']:>8.0f} {row['p99_ms']:>8.0f}"
+        )
+    return lines
+
+
+async def _launch_and_run(profile: LoadProfile, recorder: LoadRecorder) -> float:
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as playwright:
+        browser = await connect_or_launch_async(playwright)
+        try:
+            return await run_load(browser, profile, recorder)
+        finally:
+            await browser.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Drive the page-object flows with concurrent virtual users.")
+    parser.add_argument("--users", type=int, help="number of virtual users, each in its own browser context")
+    parser.add_argument("--ramp-up", type=float, dest="ramp_up_s", help="seconds over which users start")
+    parser.add_argument("--duration", type=float, dest="duration_s", help="seconds to keep running after ramp-up")
+    parser.add_argument("--iterations", type=int, help="stop each user after this many scenarios")
+    parser.add_argument("--think-time", type=float, nargs=2, dest="think_time_s", metavar=("MIN", "MAX"))
+    parser.add_argument("--mix", type=parse_mix, help="scenario weights, e.g. browse=6,buy=2,rent=2")
+    parser.add_argument("--seed", type=int, help="seed for scenario choice, think time and product picks")
+    args = parser.parse_args()
+    profile = LoadProfile.from_settings(**vars(args))
+    if not Settings.USERNAME or not Settings.PASSWORD:
+        parser.error("USERNAME/PASSWORD are required for the login step.")
+
+    server = None
+    if Settings.APP_MODE == "fake":
+        server = FakeTeebayServer(port=Settings.FAKE_APP_PORT).start()
+        Settings.use_base_url(server.base_url)
+    recorder = LoadRecorder()
+    try:
+        elapsed_s = asyncio.run(_launch_and_run(profile, recorder))
+    finally:
+        if server is not None:
+            server.stop()
+
+    summary = summarize_load(recorder.records, elapsed_s)
+    Settings.LOAD_REPORT_DIR.mkdir(parents=True, exist_ok=True)
+    report_path = Settings.LOAD_REPORT_DIR / f"{Settings.RUN_ID}.json"
+    report = {"profile": profile.as_dict(), "elapsed_s": round(elapsed_s, 2), "summary": summary, "records": recorder.records}
+    report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    for line in format_load_summary(summary):
+        print(line)
+    print(f"{len(recorder.records)} actions in {elapsed_s:.1f}s; report written to {report_path}")
+    return 1 if any(row["errors"] for row in summary if row["action"].startswith("scenario:")) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
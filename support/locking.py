@@ -0,0 +1,31 @@
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def exclusive_lock(path: Path, timeout_s: float = 10.0):
+    # Parallel workers finish at about the same time; an exclusive lock file serialises their updates.
+    lock_path = path.with_suffix(".lock")
+    deadline = time.monotonic() + timeout_s
+    while True:
+        try:
+            descriptor = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if time.monotonic() > deadline:
+                # A crashed run left the lock behind.
+                lock_path.unlink(missing_ok=True)
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        os.close(descriptor)
+        lock_path.unlink(missing_ok=True)
+
+
+def write_json_atomic(path: Path, text: str) -> None:
+    temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    temp_path.write_text(text, encoding="utf-8")
+    temp_path.replace(path)
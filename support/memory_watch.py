@@ -0,0 +1,232 @@
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from config import Settings
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Page
+
+    from support.browser_server import RecyclableBrowser
+
+METRICS = ("js_heap_mb", "nodes", "listeners", "session_heap_mb", "rss_mb")
+# Performance.getMetrics names -> sample fields; the heap comes back in bytes.
+CDP_METRICS = {"JSHeapUsedSize": "js_heap_mb", "Nodes": "nodes", "JSEventListeners": "listeners"}
+CHROMIUM_PROCESS_NAMES = ("chrome", "chromium", "headless_shell")
+BLAMED_TESTS = 3
+
+
+class MemorySample(NamedTuple):
+    nodeid: str
+    js_heap_mb: float | None = None
+    nodes: int | None = None
+    listeners: int | None = None
+    session_heap_mb: float | None = None
+    rss_mb: float | None = None
+
+
+def page_metrics(page: "Page") -> dict:
+    # Renderer metrics of the test's page; empty for engines without CDP or a page that is already gone.
+    try:
+        session = page.context.new_cdp_session(page)
+        try:
+            session.send("Performance.enable")
+            metrics = session.send("Performance.getMetrics")["metrics"]
+        finally:
+            session.detach()
+    except Exception:
+        return {}
+    values = {CDP_METRICS[metric["name"]]: metric["value"] for metric in metrics if metric["name"] in CDP_METRICS}
+    if "js_heap_mb" in values:
+        values["js_heap_mb"] = round(values["js_heap_mb"] / 2**20, 2)
+    return {name: value if name == "js_heap_mb" else int(value) for name, value in values.items()}
+
+
+def _process_table(proc: Path) -> dict[int, tuple[int, str]]:
+    table = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # "pid (comm) state ppid ..."; comm may itself contain spaces or parentheses.
+        name = stat[stat.index("(") + 1 : stat.rindex(")")]
+        table[int(entry.name)] = (int(stat[stat.rindex(")") + 2 :].split()[1]), name)
+    return table
+
+
+def chromium_rss_mb(root_pids: list[int], proc: Path = Path("/proc")) -> float | None:
+    # Resident memory of every Chromium process below the given roots (the Playwright driver launches it as
+    # a grandchild of this process; a browser server owns its own tree). Shared pages are counted once per
+    # process, so this overstates the absolute size but tracks growth faithfully. None off Linux.
+    if not proc.is_dir():
+        return None
+    table = _process_table(proc)
+    children: dict[int, list[int]] = {}
+    for pid, (ppid, _) in table.items():
+        children.setdefault(ppid, []).append(pid)
+    pending, total_kb = list(root_pids), 0
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, []))
+        if pid not in table or not table[pid][1].startswith(CHROMIUM_PROCESS_NAMES):
+            continue
+        try:
+            status = (proc / str(pid) / "status").read_text()
+        except OSError:
+            continue
+        total_kb += next((int(line.split()[1]) for line in status.splitlines() if line.startswith("VmRSS:")), 0)
+    return round(total_kb / 1024, 1)
+
+
+def browser_root_pids() -> list[int]:
+    roots = [os.getpid()]
+    try:
+        roots.append(json.loads(Settings.BROWSER_SERVER_FILE.read_text(encoding="utf-8"))["pid"])
+    except (OSError, ValueError, KeyError):
+        pass
+    return roots
+
+
+def sustained_growth(samples: list[MemorySample], metric: str, window: int, min_percent: float) -> list[dict]:
+    # Growth that keeps going from test to test: windows of `window` consecutive tests in which at least
+    # three quarters of the steps go up and the value ends `min_percent` above where it started. Overlapping
+    # windows are merged, and the tests with the largest steps inside a streak are blamed for it.
+    values = [(sample.nodeid, getattr(sample, metric)) for sample in samples if getattr(sample, metric) is not None]
+    flagged = []
+    for start in range(len(values) - window):
+        steps = [values[index + 1][1] - values[index][1] for index in range(start, start + window)]
+        first, last = values[start][1], values[start + window][1]
+        rising = sum(step > 0 for step in steps) >= 0.75 * window
+        if rising and first > 0 and (last - first) * 100 / first >= min_percent:
+            if flagged and start <= flagged[-1][1]:
+                flagged[-1][1] = start + window
+            else:
+                flagged.append([start, start + window])
+    streaks = []
+    for start, end in flagged:
+        steps = [(values[index][0], values[index][1] - values[index - 1][1]) for index in range(start + 1, end + 1)]
+        blamed = sorted((step for step in steps if step[1] > 0), key=lambda step: step[1], reverse=True)
+        streaks.append(
+            {
+                "metric": metric,
+                "from_test": values[start + 1][0],
+                "to_test": values[end][0],
+                "tests": end - start,
+                "start": values[start][1],
+                "end": values[end][1],
+                "growth_percent": round((values[end][1] - values[start][1]) * 100 / values[start][1], 1),
+                "blamed": [{"nodeid": nodeid, "delta": round(delta, 2)} for nodeid, delta in blamed[:BLAMED_TESTS]],
+            }
+        )
+    return streaks
+
+
+class MemoryWatch:
+    # One sample per test, taken on the test's page just before it closes: renderer heap, DOM nodes and
+    # listeners over CDP plus the RSS of the whole Chromium process tree from /proc. Each test gets a fresh
+    # page, so its heap cannot show growth across the session; the recycle rule reads the heap of a probe
+    # page instead, opened on the app once per (re)launch and kept open, whose renderer stays alive as long
+    # as the browser does. The heap baseline is the probe's first sample; once its heap has grown
+    # MEMORY_RECYCLE_HEAP_MB past it the session browser is replaced after the current test finishes.
+    def __init__(self, enabled: bool | None = None, recycle_heap_mb: float | None = None) -> None:
+        self.enabled = Settings.MEMORY_WATCH_ENABLED if enabled is None else enabled
+        self.recycle_heap_mb = Settings.MEMORY_RECYCLE_HEAP_MB if recycle_heap_mb is None else recycle_heap_mb
+        self.samples: list[MemorySample] = []
+        self.recycles: list[dict] = []
+        self.browser: "RecyclableBrowser | None" = None
+        self.probe: "Page | None" = None
+        self.heap_baseline: float | None = None
+        self.recycle_due = False
+        self.recycle_skipped = False
+
+    def _probe_page(self) -> "Page | None":
+        if self.probe is None and self.browser is not None:
+            context: "BrowserContext | None" = None
+            try:
+                context = self.browser.new_context()
+                self.probe = context.new_page()
+                self.probe.goto(Settings.BASE_URL, wait_until="domcontentloaded")
+            except Exception:
+                # Without a probe the run still gets per-test samples; only the recycle rule has nothing to read.
+                if context is not None:
+                    context.close()
+                self.probe = None
+        return self.probe
+
+    def close_probe(self) -> None:
+        if self.probe is not None:
+            try:
+                self.probe.context.close()
+            except Exception:
+                pass
+        self.probe = None
+
+    def sample(self, page: "Page", nodeid: str) -> MemorySample | None:
+        if not self.enabled:
+            return None
+        probe = self._probe_page()
+        session_heap = page_metrics(probe).get("js_heap_mb") if probe is not None else None
+        sample = MemorySample(
+            nodeid, **page_metrics(page), session_heap_mb=session_heap, rss_mb=chromium_rss_mb(browser_root_pids())
+        )
+        self.samples.append(sample)
+        if session_heap is not None:
+            if self.heap_baseline is None:
+                self.heap_baseline = session_heap
+            elif self.recycle_heap_mb and session_heap - self.heap_baseline >= self.recycle_heap_mb:
+                self.recycle_due = True
+        return sample
+
+    def recycle_if_due(self, nodeid: str) -> bool:
+        if not self.recycle_due or self.browser is None:
+            return False
+        self.recycle_due = False
+        if self.browser.connected:
+            # Reported once; the baseline stays put so later growth keeps counting from the same point.
+            if not self.recycle_skipped:
+                self.recycles.append(self._recycle_record(nodeid, skipped=True))
+                self.recycle_skipped = True
+            return False
+        self.recycles.append(self._recycle_record(nodeid, skipped=False))
+        self.close_probe()
+        self.browser.recycle()
+        self.heap_baseline = None
+        return True
+
+    def _recycle_record(self, nodeid: str, skipped: bool) -> dict:
+        return {
+            "after_test": nodeid,
+            "heap_baseline_mb": self.heap_baseline,
+            "heap_mb": self.samples[-1].session_heap_mb,
+            "rss_mb": self.samples[-1].rss_mb,
+            "skipped": skipped,
+        }
+
+    def growth(self) -> list[dict]:
+        return [
+            streak
+            for metric in METRICS
+            for streak in sustained_growth(
+                self.samples, metric, Settings.MEMORY_GROWTH_WINDOW, Settings.MEMORY_GROWTH_PERCENT
+            )
+        ]
+
+    def write_report(self, directory: Path) -> Path | None:
+        if not self.samples:
+            return None
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{Settings.RUN_ID}-{Settings.WORKER_ID}.json"
+        report = {
+            "samples": [sample._asdict() for sample in self.samples],
+            "growth": self.growth(),
+            "recycles": self.recycles,
+        }
+        path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        return path
+
+
+MEMORY = MemoryWatch()
@@ -0,0 +1,145 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from config import PROJECT_ROOT, Settings
+from support.action_timing import format_summary, summarize
+
+ALLURE_RESULTS_DIR = PROJECT_ROOT / "reports" / "allure-results"
+WORKER_LOG_DIR = PROJECT_ROOT / "reports" / "workers"
+MANIFEST_ENV = "TEST_COLLECTION_MANIFEST"
+
+
+def collect_tests(pytest_args: list[str]) -> list[dict]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manifest_path = Path(tmp_dir) / "manifest.json"
+        env = {**os.environ, MANIFEST_ENV: str(manifest_path)}
+        cmd = [sys.executable, "-m", "pytest", "--collect-only", "-q", "-o", "addopts=", *pytest_args]
+        result = subprocess.run(cmd, cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, check=False)
+        if not manifest_path.exists():
+            sys.stderr.write(result.stdout + result.stderr)
+            raise RuntimeError("Test collection failed; see pytest output above.")
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+
+def build_units(manifest: list[dict]) -> list[list[str]]:
+    # Tests sharing any shared_state group end up in one unit so a single worker runs them serially.
+    parent: dict[str, str] = {}
+
+    def root(group: str) -> str:
+        while parent.setdefault(group, group) != group:
+            group = parent[group]
+        return group
+
+    for entry in manifest:
+        for group in entry["shared_state"][1:]:
+            parent[root(group)] = root(entry["shared_state"][0])
+
+    units: list[list[str]] = []
+    unit_by_root: dict[str, list[str]] = {}
+    for entry in manifest:
+        if not entry["shared_state"]:
+            units.append([entry["nodeid"]])
+            continue
+        group_root = root(entry["shared_state"][0])
+        if group_root not in unit_by_root:
+            unit_by_root[group_root] = []
+            units.append(unit_by_root[group_root])
+        unit_by_root[group_root].append(entry["nodeid"])
+    return units
+
+
+def balance(units: list[list[str]], count: int, predicted: dict[str, float]) -> list[list[list[str]]]:
+    # Longest-processing-time first: each unit, slowest first, goes to the bucket with the least predicted time.
+    # Buckets keep that order, so every worker starts with its longest tests. Ties break on node id so every
+    # CI shard computes the same split from the same history.
+    def unit_seconds(unit: list[str]) -> float:
+        return sum(predicted.get(nodeid, 0.0) for nodeid in unit)
+
+    buckets: list[list[list[str]]] = [[] for _ in range(count)]
+    totals = [0.0] * count
+    for unit in sorted(units, key=lambda unit: (-unit_seconds(unit), unit[0])):
+        index = totals.index(min(totals))
+        buckets[index].append(unit)
+        totals[index] += unit_seconds(unit)
+    return buckets
+
+
+def distribute(units: list[list[str]], workers: int, predicted: dict[str, float]) -> list[list[str]]:
+    buckets = [[nodeid for unit in bucket for nodeid in unit] for bucket in balance(units, workers, predicted)]
+    return [bucket for bucket in buckets if bucket]
+
+
+def shard(units: list[list[str]], index: int, count: int, predicted: dict[str, float]) -> list[list[str]]:
+    return balance(units, count, predicted)[index - 1]
+
+
+def predicted_seconds(bucket: list[str], predicted: dict[str, float]) -> float:
+    return sum(predicted.get(nodeid, 0.0) for nodeid in bucket)
+
+
+def _is_test_path(arg: str) -> bool:
+    return not arg.startswith("-") and (PROJECT_ROOT / arg.split("::", 1)[0]).exists()
+
+
+def run_workers(
+    buckets: list[list[str]],
+    pytest_args: list[str],
+    clean_results: bool = True,
+    predicted: dict[str, float] | None = None,
+) -> int:
+    if clean_results:
+        shutil.rmtree(ALLURE_RESULTS_DIR, ignore_errors=True)
+        shutil.rmtree(Settings.ACTION_TIMING_DIR, ignore_errors=True)
+    ALLURE_RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    WORKER_LOG_DIR.mkdir(parents=True, exist_ok=True)
+    passthrough = [arg for arg in pytest_args if not _is_test_path(arg)]
+
+    processes = []
+    for index, bucket in enumerate(buckets):
+        worker_id = f"w{index}"
+        args_file = WORKER_LOG_DIR / f"{worker_id}.args"
+        args_file.write_text("\n".join(bucket), encoding="utf-8")
+        log_file = (WORKER_LOG_DIR / f"{worker_id}.log").open("w", encoding="utf-8")
+        # Every worker writes uuid-named results into the shared folder; only this runner cleans it.
+        cmd = [
+            sys.executable, "-m", "pytest",
+            "-o", "addopts=-ra",
+            f"--alluredir={ALLURE_RESULTS_DIR}",
+            *passthrough,
+            f"@{args_file}",
+        ]
+        env = {**os.environ, "TEST_WORKER_ID": worker_id, "TEST_RUN_ID": Settings.RUN_ID}
+        process = subprocess.Popen(cmd, cwd=PROJECT_ROOT, env=env, stdout=log_file, stderr=subprocess.STDOUT)
+        processes.append((worker_id, process, log_file, bucket))
+
+    exit_code = 0
+    for worker_id, process, log_file, bucket in processes:
+        return_code = process.wait()
+        log_file.close()
+        summary = (WORKER_LOG_DIR / f"{worker_id}.log").read_text(encoding="utf-8").strip().splitlines()
+        expected = f", predicted {predicted_seconds(bucket, predicted):.0f}s" if predicted else ""
+        print(
+            f"[{worker_id}] {len(bucket)} tests{expected}, exit code {return_code}: "
+            f"{summary[-1] if summary else ''}"
+        )
+        if return_code != 0 and exit_code == 0:
+            exit_code = return_code
+    _print_timing_summary()
+    return exit_code
+
+
+def _print_timing_summary() -> None:
+    records = [
+        record
+        for path in sorted(Settings.ACTION_TIMING_DIR.glob("*.json"))
+        for record in json.loads(path.read_text(encoding="utf-8"))["records"]
+    ]
+    if records:
+        print("Slowest page-object methods across workers:")
+        for line in format_summary(summarize(records)):
+            print(line)
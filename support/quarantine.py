@@ -0,0 +1,59 @@
+import json
+from pathlib import Path
+
+from config import Settings
+from support.locking import exclusive_lock, write_json_atomic
+
+QUARANTINE_MODES = {"off", "exclude", "only"}
+# Only a change between these counts as a flip; xfailed (known bugs) and skipped runs say nothing about flakiness.
+FLIP_OUTCOMES = {"passed", "failed"}
+
+
+def outcome_of(reports: list) -> str:
+    if any(report.failed for report in reports):
+        return "failed"
+    if any(hasattr(report, "wasxfail") for report in reports):
+        return "xfailed"
+    if any(report.skipped for report in reports):
+        return "skipped"
+    return "passed"
+
+
+class QuarantineLedger:
+    # Per-test outcome history across runs, including every in-run rerun attempt. A test is quarantined
+    # while its recent history flips between passed and failed often enough, and leaves quarantine on
+    # its own once those flips age out of the window.
+    def __init__(
+        self,
+        path: Path | None = None,
+        window: int | None = None,
+        flip_threshold: int | None = None,
+    ) -> None:
+        self.path = path or Settings.TEST_LEDGER
+        self.window = window or Settings.LEDGER_WINDOW
+        self.flip_threshold = flip_threshold or Settings.QUARANTINE_FLIPS
+
+    def load(self) -> dict[str, list[str]]:
+        if not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except ValueError:
+            return {}
+
+    def flips(self, history: list[str]) -> int:
+        outcomes = [outcome for outcome in history[-self.window :] if outcome in FLIP_OUTCOMES]
+        return sum(previous != current for previous, current in zip(outcomes, outcomes[1:]))
+
+    def quarantined(self) -> set[str]:
+        return {nodeid for nodeid, history in self.load().items() if self.flips(history) >= self.flip_threshold}
+
+    def record(self, results: dict[str, list[str]]) -> None:
+        if not results:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with exclusive_lock(self.path):
+            ledger = self.load()
+            for nodeid, outcomes in results.items():
+                ledger[nodeid] = (ledger.get(nodeid, []) + outcomes)[-self.window :]
+            write_json_atomic(self.path, json.dumps(ledger, indent=2, sort_keys=True))
@@ -0,0 +1,165 @@
+import base64
+import json
+import weakref
+from collections import Counter
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+from config import Settings
+
+if TYPE_CHECKING:
+    from playwright.sync_api import APIRequestContext, BrowserContext, Request, Response, Route
+
+TRANSPARENT_GIF = base64.b64decode("R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7")
+STUB_CONTENT_TYPES = {
+    "image": ("image/gif", TRANSPARENT_GIF),
+    "stylesheet": ("text/css", b""),
+    "script": ("application/javascript", b""),
+    "font": ("font/woff2", b""),
+}
+
+_LEARNING_CONTEXTS = weakref.WeakSet()
+
+
+class ResourcePolicy:
+    def __init__(
+        self,
+        block_types: list[str] | tuple[str, ...] = (),
+        stub_types: list[str] | tuple[str, ...] = (),
+        block_url_patterns: list[str] | tuple[str, ...] = (),
+    ) -> None:
+        self.block_types = set(block_types)
+        self.stub_types = set(stub_types)
+        self.block_url_patterns = list(block_url_patterns)
+
+    @classmethod
+    def from_settings(cls, **overrides) -> "ResourcePolicy":
+        # Keyword overrides come from @pytest.mark.resource_policy(...); enabled=False turns routing off.
+        if not overrides.pop("enabled", Settings.RESOURCE_POLICY_ENABLED):
+            return cls()
+        return cls(
+            block_types=overrides.get("block_types", Settings.BLOCKED_RESOURCE_TYPES),
+            stub_types=overrides.get("stub_types", Settings.STUBBED_RESOURCE_TYPES),
+            block_url_patterns=overrides.get("block_url_patterns", Settings.BLOCKED_URL_PATTERNS),
+        )
+
+    @property
+    def active(self) -> bool:
+        return bool(self.block_types or self.stub_types or self.block_url_patterns)
+
+    def decision(self, request: "Request") -> str | None:
+        if request.url.startswith(Settings.BASE_URL) and request.resource_type in {"document", "xhr", "fetch"}:
+            return None
+        if any(fnmatch(request.url, pattern) for pattern in self.block_url_patterns):
+            return "block"
+        if request.resource_type in self.stub_types:
+            return "stub"
+        if request.resource_type in self.block_types:
+            return "block"
+        return None
+
+
+class ResourceSizeLedger:
+    # Sizes are learned from responses that were allowed through, e.g. in a learning run with RESOURCE_POLICY=off.
+    # With RESOURCE_SIZE_PROBE=on, blocked URLs the ledger has never seen are also asked for their size once
+    # after the test (see estimate_blocked_sizes); either way sizes are kept for later runs.
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.sizes: dict[str, int] = {}
+        self.unmeasurable: set[str] = set()
+        if path.exists():
+            self.sizes = json.loads(path.read_text(encoding="utf-8"))
+
+    def learn(self, response: "Response") -> None:
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self.sizes[response.url] = int(length)
+
+    def measure(self, urls: list[str], fetch_size: Callable[[str], int | None]) -> None:
+        for url in dict.fromkeys(urls):
+            if url in self.sizes or url in self.unmeasurable:
+                continue
+            size = fetch_size(url)
+            if size is None:
+                self.unmeasurable.add(url)
+            else:
+                self.sizes[url] = size
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        stored = json.loads(self.path.read_text(encoding="utf-8")) if self.path.exists() else {}
+        stored.update(self.sizes)
+        self.path.write_text(json.dumps(stored, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def probe_size(api: "APIRequestContext", url: str) -> int | None:
+    # Content-Length from a HEAD request only: downloading the body would fetch the very bytes the policy
+    # blocks. No header, an error or a slow host leaves the URL unmeasurable for the rest of the session.
+    try:
+        response = api.head(url, timeout=Settings.RESOURCE_SIZE_PROBE_TIMEOUT_MS)
+    except Exception:
+        return None
+    length = response.headers.get("content-length")
+    return int(length) if response.ok and length and length.isdigit() else None
+
+
+class ResourceStats:
+    # Byte counts are read from the ledger when reported, so sizes measured after the test still count.
+    def __init__(self, ledger: ResourceSizeLedger) -> None:
+        self.ledger = ledger
+        self.blocked = 0
+        self.stubbed = 0
+        self.urls: list[str] = []
+        self.by_type: Counter = Counter()
+
+    def record(self, decision: str, request: "Request") -> None:
+        if decision == "stub":
+            self.stubbed += 1
+        else:
+            self.blocked += 1
+        self.by_type[request.resource_type] += 1
+        self.urls.append(request.url)
+
+    def unknown_urls(self) -> list[str]:
+        return [url for url in self.urls if url not in self.ledger.sizes]
+
+    def as_dict(self) -> dict:
+        return {
+            "requests_blocked": self.blocked,
+            "requests_stubbed": self.stubbed,
+            "bytes_avoided": sum(self.ledger.sizes.get(url, 0) for url in self.urls),
+            "requests_with_unknown_size": len(self.unknown_urls()),
+            "by_resource_type": dict(self.by_type),
+        }
+
+
+def estimate_blocked_sizes(context: "BrowserContext", stats: ResourceStats) -> None:
+    if Settings.RESOURCE_SIZE_PROBE and stats.unknown_urls():
+        stats.ledger.measure(stats.unknown_urls(), lambda url: probe_size(context.request, url))
+
+
+def apply_resource_policy(context: "BrowserContext", policy: ResourcePolicy, ledger: ResourceSizeLedger) -> ResourceStats:
+    stats = ResourceStats(ledger)
+    if context not in _LEARNING_CONTEXTS:
+        # Pooled contexts come back for many tests; keep a single size listener on each.
+        context.on("response", ledger.learn)
+        _LEARNING_CONTEXTS.add(context)
+    if not policy.active:
+        return stats
+
+    def handle(route: "Route") -> None:
+        request = route.request
+        decision = policy.decision(request)
+        if decision is None:
+            route.fallback()
+            return
+        stats.record(decision, request)
+        if decision == "stub":
+            content_type, body = STUB_CONTENT_TYPES.get(request.resource_type, ("text/plain", b""))
+            route.fulfill(status=200, content_type=content_type, body=body)
+        else:
+            route.abort("blockedbyclient")
+
+    context.route("**/*", handle)
+    return stats
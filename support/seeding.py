@@ -0,0 +1,110 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+from config import Settings
+
+PRODUCT_DEFAULTS = {
+    "description": "Seeded product",
+    "purchase_price": 500,
+    "rent_price": 50,
+    "categories": ["Outdoor"],
+    "rent_duration_type": "Daily",
+}
+
+
+class SeedingError(RuntimeError):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.message = message
+
+
+class SeedingClient:
+    # Talks to the backend REST API directly so test preconditions skip the browser entirely. The routes are
+    # the contract served by support.fake_teebay; the real Teebay backend has not been verified against them.
+    def __init__(self, api_base_url: str, token: str | None = None, timeout_s: float = 10.0, workers: int = 8) -> None:
+        self.api_base_url = api_base_url.rstrip("/")
+        self.token = token
+        self.timeout_s = timeout_s
+        self.workers = workers
+
+    @classmethod
+    def from_settings(cls) -> "SeedingClient | None":
+        if not Settings.API_BASE_URL or not Settings.USERNAME or not Settings.PASSWORD:
+            return None
+        client = cls(Settings.API_BASE_URL)
+        client.login(Settings.USERNAME, Settings.PASSWORD)
+        return client
+
+    def _request(self, method: str, path: str, payload: dict | None = None, token: str | None = None):
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        request = Request(f"{self.api_base_url}{path}", data=body, method=method)
+        request.add_header("Content-Type", "application/json")
+        token = token or self.token
+        if token:
+            request.add_header("Authorization", f"Bearer {token}")
+        try:
+            with urlopen(request, timeout=self.timeout_s) as response:
+                return json.loads(response.read() or b"null")
+        except HTTPError as error:
+            try:
+                message = json.loads(error.read() or b"{}").get("error", error.reason)
+            except ValueError:
+                message = error.reason
+            raise SeedingError(error.code, message) from None
+        except URLError as error:
+            raise SeedingError(0, str(error.reason)) from None
+
+    def _bulk(self, function, items: list) -> list:
+        with ThreadPoolExecutor(max_workers=min(self.workers, max(len(items), 1))) as executor:
+            return list(executor.map(function, items))
+
+    def login(self, email: str, password: str) -> dict:
+        result = self._request("POST", "/login", {"email": email, "password": password})
+        self.token = result["token"]
+        return result["user"]
+
+    def create_product(self, title: str, **fields) -> dict:
+        return self._request("POST", "/products", {**PRODUCT_DEFAULTS, **fields, "title": title})
+
+    def create_products(self, products: list[dict]) -> list[dict]:
+        return self._bulk(lambda product: self.create_product(**product), products)
+
+    def update_product(self, product_id: int, **fields) -> dict:
+        return self._request("PUT", f"/products/{product_id}", fields)
+
+    def delete_product(self, product_id: int) -> None:
+        self._request("DELETE", f"/products/{product_id}")
+
+    def delete_products(self, product_ids: list[int]) -> None:
+        self._bulk(self.delete_product, product_ids)
+
+    def my_products(self) -> list[dict]:
+        return self._request("GET", "/my-products")
+
+    def find_my_products(self, title: str) -> list[dict]:
+        return [product for product in self.my_products() if product["title"] == title]
+
+    def ensure_product(self, title: str, **fields) -> dict:
+        existing = self.find_my_products(title)
+        return existing[0] if existing else self.create_product(title, **fields)
+
+    def create_user(self, **fields) -> dict:
+        # Returns the public user with its own token, so the caller can act as that user afterwards.
+        result = self._request("POST", "/register", fields)
+        return {**result["user"], "token": result["token"]}
+
+    def create_users(self, users: list[dict]) -> list[dict]:
+        return self._bulk(lambda user: self.create_user(**user), users)
+
+    def update_user(self, token: str, **fields) -> dict:
+        current = self._request("GET", "/me", token=token)
+        return self._request("PUT", "/me", {**current, **fields}, token=token)
+
+    def delete_user(self, token: str) -> None:
+        self._request("DELETE", "/me", token=token)
+
+    def delete_users(self, tokens: list[str]) -> None:
+        self._bulk(self.delete_user, tokens)
@@ -0,0 +1,438 @@
+import argparse
+import ast
+import importlib
+import inspect
+import json
+import re
+import statistics
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from config import PROJECT_ROOT, Settings
+from pages import selectors as selector_constants
+from support.locking import write_json_atomic
+from test_data import load_data
+from test_data.loader import DATA_DIR
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Locator, Page
+
+PAGES_DIR = PROJECT_ROOT / "pages"
+LOCATOR_CALLS = {"locator": "css", "get_by_text": "text", "get_by_role": "role"}
+CSS_SELECTOR = re.compile(r"^([a-z][a-z0-9-]*|\*)?([.#\[:]|\s*>|\s+[a-z.#\[]|$)")
+GENERATED_CLASS = re.compile(r"\.sc-[A-Za-z0-9]+")
+SCRIPT_TAG = re.compile(r"<script\b[^>]*>.*?</script>", re.IGNORECASE | re.DOTALL)
+# Page-object arguments only known at run time are profiled as "<name>", which matches nothing and so
+# costs a full scan, the worst case for a filter.
+RUNTIME_VALUE = "<{}>"
+
+
+@dataclass(frozen=True)
+class Probe:
+    # One way a page object resolves elements, replayable against any page.
+    engine: str
+    value: str
+    role: str = ""
+    exact: bool = False
+    has_text: str = ""
+    has: "Probe | None" = None
+
+    def __str__(self) -> str:
+        if self.engine == "text":
+            args = [json.dumps(self.value)] + (["exact=True"] if self.exact else [])
+            call = "get_by_text"
+        elif self.engine == "role":
+            args = [json.dumps(self.role), f"name={json.dumps(self.value)}"] + (["exact=True"] if self.exact else [])
+            call = "get_by_role"
+        else:
+            args = [json.dumps(self.value)]
+            call = "locator"
+        if self.has_text:
+            args.append(f"has_text={json.dumps(self.has_text)}")
+        if self.has is not None:
+            args.append(f"has={self.has}")
+        return f"{call}({', '.join(args)})"
+
+    def locator(self, page: "Page") -> "Locator":
+        if self.engine == "text":
+            locator = page.get_by_text(self.value, exact=self.exact)
+        elif self.engine == "role":
+            locator = page.get_by_role(self.role, name=self.value, exact=self.exact)
+        else:
+            locator = page.locator(self.value)
+        if self.has_text or self.has is not None:
+            locator = locator.filter(
+                has_text=self.has_text or None, has=self.has.locator(page) if self.has is not None else None
+            )
+        return locator
+
+    def flags(self) -> list[str]:
+        found = []
+        if GENERATED_CLASS.search(self.value) and self.engine == "css":
+            found.append("generated-class")
+        if self.engine == "text" or self.value.startswith("text="):
+            found.append("text-scan")
+        if ":has-text(" in self.value:
+            found.append("has-text-pseudo")
+        if self.has_text:
+            found.append("has-text-filter")
+        if self.has is not None:
+            found.append("nested-has")
+            found.extend(flag for flag in self.has.flags() if flag not in found)
+        return found
+
+
+@dataclass
+class SelectorEntry:
+    probe: Probe
+    owners: set[str] = field(default_factory=set)
+    # True when some page method spells the selector out instead of using a pages/selectors.py constant.
+    inline: bool = False
+
+    def flags(self) -> list[str]:
+        return self.probe.flags() + (["inline-literal"] if self.inline else [])
+
+
+class SelectorRegistry:
+    def __init__(self) -> None:
+        self.entries: dict[Probe, SelectorEntry] = {}
+
+    def add(self, probe: Probe, owner: str, inline: bool = False) -> None:
+        entry = self.entries.setdefault(probe, SelectorEntry(probe))
+        entry.owners.add(owner)
+        entry.inline = entry.inline or inline
+
+    def __iter__(self):
+        return iter(sorted(self.entries.values(), key=lambda entry: str(entry.probe)))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, selector: str) -> SelectorEntry | None:
+        return next((entry for entry in self.entries.values() if str(entry.probe) == selector), None)
+
+    @classmethod
+    def collect(cls) -> "SelectorRegistry":
+        registry = cls()
+        registry._add_constants()
+        for path in sorted(PAGES_DIR.glob("*_page.py")):
+            registry._add_usages(path)
+        return registry
+
+    def _add_constants(self) -> None:
+        # Every CSS-looking constant, including the mappings handed to element_states(); text constants
+        # only count as selectors where a page method resolves them, which _add_usages() picks up.
+        for class_name, selector_class in inspect.getmembers(selector_constants, inspect.isclass):
+            for name, value in vars(selector_class).items():
+                if not name.isupper():
+                    continue
+                values = value.items() if isinstance(value, dict) else [(None, value)]
+                for key, selector in values:
+                    if isinstance(selector, str) and CSS_SELECTOR.match(selector):
+                        owner = f"{class_name}.{name}" + (f"[{key!r}]" if key is not None else "")
+                        self.add(Probe("css", selector), owner)
+
+    def _add_usages(self, path: Path) -> None:
+        module = importlib.import_module(f"pages.{path.stem}")
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for class_node in (node for node in tree.body if isinstance(node, ast.ClassDef)):
+            page_class = getattr(module, class_node.name)
+            for function in (node for node in class_node.body if isinstance(node, ast.FunctionDef)):
+                for call in ast.walk(function):
+                    resolved = _probe_from_call(call, page_class)
+                    if resolved is not None:
+                        probe, inline = resolved
+                        self.add(probe, f"{class_node.name}.{function.name}", inline)
+
+
+def _resolve(node: ast.expr, page_class: type) -> tuple[str, bool]:
+    # The string an argument evaluates to, and whether it is a literal written in the page method.
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value, True
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == "self":
+        value = getattr(page_class, node.attr, None)
+        if isinstance(value, str):
+            return value, False
+    if isinstance(node, ast.JoinedStr):
+        parts = []
+        for part in node.values:
+            inner = part.value if isinstance(part, ast.FormattedValue) else part
+            parts.append(_resolve(inner, page_class)[0])
+        return "".join(parts), False
+    if isinstance(node, ast.Name):
+        return RUNTIME_VALUE.format(node.id), False
+    return RUNTIME_VALUE.format(ast.unparse(node)), False
+
+
+def _probe_from_call(node: ast.AST, page_class: type) -> tuple[Probe, bool] | None:
+    if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.args):
+        return None
+    engine = LOCATOR_CALLS.get(node.func.attr)
+    if engine is None:
+        return None
+    keywords = {keyword.arg: keyword.value for keyword in node.keywords}
+    exact = isinstance(keywords.get("exact"), ast.Constant) and keywords["exact"].value is True
+    has_text = _resolve(keywords["has_text"], page_class)[0] if "has_text" in keywords else ""
+    nested = _probe_from_call(keywords["has"], page_class) if "has" in keywords else None
+    has = nested[0] if nested is not None else None
+    if engine == "role":
+        if "name" not in keywords:
+            return None
+        role = _resolve(node.args[0], page_class)[0]
+        value, inline = _resolve(keywords["name"], page_class)
+        return Probe(engine, value, role=role, exact=exact, has_text=has_text, has=has), inline
+    value, inline = _resolve(node.args[0], page_class)
+    return Probe(engine, value, exact=exact, has_text=has_text, has=has), inline
+
+
+def capture_pages(out_dir: Path) -> list[Path]:
+    # Walks the page objects through every screen and saves the rendered DOM without scripts, so the
+    # snapshots can be profiled later without the app.
+    from playwright.sync_api import sync_playwright
+
+    from pages.account_settings_page import AccountSettingsPage
+    from pages.browse_products_page import BrowseProductsPage
+    from pages.login_page import LoginPage
+    from pages.my_products_page import AddUpdateProductPage, MyProductsPage
+    from pages.registration_page import RegistrationPage
+    from pages.view_product_page import ViewProductPage
+    from support.browser_server import connect_or_launch
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    captured = []
+    with sync_playwright() as playwright:
+        browser = connect_or_launch(playwright)
+        context = browser.new_context()
+        page = context.new_page()
+
+        def snapshot(name: str, page_object) -> None:
+            page_object.wait_for_settle()
+            path = out_dir / f"{name}.html"
+            path.write_text(SCRIPT_TAG.sub("", page.content()), encoding="utf-8")
+            captured.append(path)
+
+        try:
+            login_page = LoginPage(page)
+            login_page.open()
+            snapshot("login", login_page)
+            registration_page = RegistrationPage(page)
+            registration_page.open_from_login()
+            snapshot("registration", registration_page)
+            login_page.open()
+            login_page.login(Settings.USERNAME, Settings.PASSWORD)
+            page.wait_for_url(Settings.MY_PRODUCTS_URL)
+            snapshot("my_products", MyProductsPage(page))
+            add_page = AddUpdateProductPage(page)
+            add_page.open_from_my_products()
+            snapshot("add_product", add_page)
+            add_page.go_to_my_products()
+            browse_page = BrowseProductsPage(page)
+            browse_page.open_from_my_products()
+            snapshot("browse_products", browse_page)
+            titles = browse_page.product_titles()
+            if titles:
+                view_page = ViewProductPage(page)
+                view_page.open_product_by_title(titles[0])
+                snapshot("view_product", view_page)
+            account_page = AccountSettingsPage(page)
+            account_page.open_from_my_products()
+            snapshot("account_settings", account_page)
+        finally:
+            context.close()
+            browser.close()
+    return captured
+
+
+def _median_ms(locator: "Locator", repeat: int) -> tuple[float, int]:
+    samples = []
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = locator.count()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), count
+
+
+def profile_selectors(registry: SelectorRegistry, pages: list[Path], repeat: int) -> list[dict]:
+    from playwright.sync_api import Error, sync_playwright
+
+    from support.browser_server import connect_or_launch
+
+    results = {
+        entry.probe: {"cost_ms": 0.0, "baseline_ms": 0.0, "worst_page": "", "matches": 0, "errors": []}
+        for entry in registry
+    }
+    with sync_playwright() as playwright:
+        browser = connect_or_launch(playwright)
+        page = browser.new_page()
+        try:
+            for path in pages:
+                page.set_content(path.read_text(encoding="utf-8"), wait_until="domcontentloaded")
+                # A round trip for a trivial selector, taken off every sample so only resolution cost remains.
+                baseline_ms, _ = _median_ms(page.locator("html"), repeat)
+                for probe, result in results.items():
+                    try:
+                        elapsed_ms, count = _median_ms(probe.locator(page), repeat)
+                    except Error as error:
+                        result["errors"].append(f"{path.stem}: {str(error).splitlines()[0]}")
+                        continue
+                    cost_ms = max(elapsed_ms - baseline_ms, 0.0)
+                    result["matches"] += count
+                    if cost_ms >= result["cost_ms"]:
+                        result["cost_ms"], result["baseline_ms"], result["worst_page"] = cost_ms, baseline_ms, path.stem
+        finally:
+            page.close()
+            browser.close()
+    rows = []
+    for entry in registry:
+        result = results[entry.probe]
+        flags = entry.flags() + (["no-match"] if not result["matches"] else [])
+        rows.append(
+            _row(
+                entry,
+                flags,
+                round(result["cost_ms"], 3),
+                round(result["baseline_ms"], 3),
+                result["worst_page"],
+                result["matches"],
+                result["errors"],
+            )
+        )
+    return sorted(rows, key=lambda row: (-row["cost_ms"], row["selector"]))
+
+
+def static_rows(registry: SelectorRegistry) -> list[dict]:
+    rows = [_row(entry, entry.flags()) for entry in registry]
+    return sorted(rows, key=lambda row: (-len(row["flags"]), row["selector"]))
+
+
+def _row(
+    entry: SelectorEntry,
+    flags: list[str],
+    cost_ms: float | None = None,
+    baseline_ms: float | None = None,
+    worst_page: str = "",
+    matches: int | None = None,
+    errors: list[str] | None = None,
+) -> dict:
+    return {
+        "selector": str(entry.probe),
+        "cost_ms": cost_ms,
+        "baseline_ms": baseline_ms,
+        "worst_page": worst_page,
+        "matches": matches,
+        "flags": flags,
+        "owners": sorted(entry.owners),
+        "errors": errors or [],
+    }
+
+
+def exceeds(row: dict, limits: dict) -> bool:
+    # A fraction of a millisecond is timer noise, so a selector is only over the limit when its median cost is
+    # both above max_cost_ms and more than max_cost_ratio times the trivial-selector round trip on that page.
+    if row["cost_ms"] is None:
+        return False
+    relative_limit = limits["max_cost_ratio"] * (row.get("baseline_ms") or 0.0)
+    return row["cost_ms"] > max(limits["max_cost_ms"], relative_limit)
+
+
+def over_budget(rows: list[dict], budget: dict) -> list[dict]:
+    # Selectors already over the limit when they were accepted into test_data/selector_budget.json
+    # are reported but do not fail; anything new that crosses the limit does.
+    accepted = {case["name"] for case in budget["accepted"]}
+    return [row for row in rows if exceeds(row, budget["limits"]) and row["selector"] not in accepted]
+
+
+def accept(rows: list[dict], budget: dict) -> None:
+    budget = {
+        "limits": budget["limits"],
+        "accepted": [
+            {"name": row["selector"], "cost_ms": row["cost_ms"], "owners": row["owners"]}
+            for row in rows
+            if exceeds(row, budget["limits"])
+        ],
+    }
+    write_json_atomic(DATA_DIR / "selector_budget.json", json.dumps(budget, indent=2) + "\n")
+
+
+def _describe(limits: dict) -> str:
+    return f"{limits['max_cost_ms']} ms and {limits['max_cost_ratio']}x the baseline"
+
+
+def format_rows(rows: list[dict], limit: int) -> list[str]:
+    lines = [f"{'cost ms':>8} {'matches':>7}  {'selector':<80} flags / used by"]
+    for row in rows[:limit]:
+        cost = "-" if row["cost_ms"] is None else f"{row['cost_ms']:.2f}"
+        matches = "-" if row["matches"] is None else str(row["matches"])
+        lines.append(f"{cost:>8} {matches:>7}  {row['selector']:<80} {', '.join(row['flags']) or '-'}")
+        lines.append(f"{'':>18}{'':<80} {', '.join(row['owners'])}")
+        lines.extend(f"{'':>18}error: {error}" for error in row["errors"])
+    return lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rank page-object selectors by resolution cost against captured pages.")
+    parser.add_argument("--capture", action="store_true", help="capture fresh page snapshots from the app first")
+    parser.add_argument("--static", action="store_true", help="only list selectors and their flags, no browser")
+    parser.add_argument("--repeat", type=int, default=15, help="timed resolutions per selector and page")
+    parser.add_argument("--max-cost-ms", type=float, help="override max_cost_ms from test_data/selector_budget.json")
+    parser.add_argument(
+        "--max-cost-ratio", type=float, help="override max_cost_ratio from test_data/selector_budget.json"
+    )
+    parser.add_argument("--accept", action="store_true", help="accept every selector now over the limit")
+    parser.add_argument("--limit", type=int, default=30, help="rows to print")
+    args = parser.parse_args()
+
+    registry = SelectorRegistry.collect()
+    if args.static:
+        for line in format_rows(static_rows(registry), len(registry)):
+            print(line)
+        return 0
+
+    server = None
+    if args.capture:
+        if not Settings.USERNAME or not Settings.PASSWORD:
+            parser.error("USERNAME/PASSWORD are required to capture the logged-in screens.")
+        if Settings.APP_MODE == "fake":
+            from support.fake_teebay import FakeTeebayServer
+
+            server = FakeTeebayServer(port=Settings.FAKE_APP_PORT).start()
+            Settings.use_base_url(server.base_url)
+        try:
+            capture_pages(Settings.SELECTOR_CAPTURE_DIR)
+        finally:
+            if server is not None:
+                server.stop()
+    pages = sorted(Settings.SELECTOR_CAPTURE_DIR.glob("*.html"))
+    if not pages:
+        parser.error(f"No captured pages in {Settings.SELECTOR_CAPTURE_DIR}; run with --capture first.")
+
+    rows = profile_selectors(registry, pages, args.repeat)
+    budget = load_data("selector_budget")
+    overrides = {"max_cost_ms": args.max_cost_ms, "max_cost_ratio": args.max_cost_ratio}
+    budget = {
+        **budget,
+        "limits": {**budget["limits"], **{key: value for key, value in overrides.items() if value is not None}},
+    }
+    Settings.SELECTOR_REPORT_DIR.mkdir(parents=True, exist_ok=True)
+    report_path = Settings.SELECTOR_REPORT_DIR / f"{Settings.RUN_ID}.json"
+    report = {"pages": [path.stem for path in pages], "limits": budget["limits"], "selectors": rows}
+    report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    for line in format_rows(rows, args.limit):
+        print(line)
+    print(f"{len(rows)} selectors profiled against {len(pages)} pages; report written to {report_path}")
+
+    if args.accept:
+        accept(rows, budget)
+        print(f"Accepted the selectors over {_describe(budget['limits'])} into test_data/selector_budget.json")
+        return 0
+    failing = over_budget(rows, budget)
+    for row in failing:
+        print(f"New selector over {_describe(budget['limits'])}: {row['selector']} ({row['cost_ms']:.2f} ms)")
+    return 1 if failing else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,107 @@
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+from config import PROJECT_ROOT
+
+OUTPUT_ENV = "STARTUP_PROFILE_OUTPUT"
+PROJECT_PACKAGES = {"config", "pages", "support", "test_data", "tests"}
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|\s+(\S+)")
+
+_collect_started: dict[str, float] = {}
+_collect_ms: dict[str, float] = {}
+
+
+# Loaded into the profiled pytest run with `-p support.startup_profile`: times the collection of every test
+# module, which includes importing it and everything it pulls in first.
+def pytest_collectstart(collector: pytest.Collector) -> None:
+    if isinstance(collector, pytest.Module):
+        _collect_started[collector.nodeid] = time.perf_counter()
+
+
+def pytest_collectreport(report: pytest.CollectReport) -> None:
+    started = _collect_started.pop(report.nodeid, None)
+    if started is not None:
+        _collect_ms[report.nodeid] = (time.perf_counter() - started) * 1000
+
+
+def pytest_collection_finish(session: pytest.Session) -> None:
+    output = os.getenv(OUTPUT_ENV)
+    if output:
+        Path(output).write_text(json.dumps(_collect_ms), encoding="utf-8")
+
+
+def parse_import_times(stderr: str) -> list[dict]:
+    imports = []
+    for line in stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, module = match.groups()
+            imports.append(
+                {
+                    "module": module,
+                    "self_ms": int(self_us) / 1000,
+                    "cumulative_ms": int(cumulative_us) / 1000,
+                }
+            )
+    return imports
+
+
+def by_package(imports: list[dict]) -> list[tuple[str, float]]:
+    totals: dict[str, float] = defaultdict(float)
+    for entry in imports:
+        totals[entry["module"].split(".")[0]] += entry["self_ms"]
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Break pytest startup down into import and collection time.")
+    parser.add_argument("--limit", type=int, default=15)
+    args, pytest_args = parser.parse_known_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output = Path(tmp_dir) / "collection.json"
+        cmd = [
+            sys.executable, "-X", "importtime", "-m", "pytest",
+            "--collect-only", "-q", "-o", "addopts=", "-p", "support.startup_profile",
+            *(pytest_args or ["tests"]),
+        ]
+        start = time.perf_counter()
+        result = subprocess.run(
+            cmd, cwd=PROJECT_ROOT, env={**os.environ, OUTPUT_ENV: str(output)}, capture_output=True, text=True
+        )
+        wall_ms = (time.perf_counter() - start) * 1000
+        if not output.exists():
+            sys.stderr.write(result.stdout + result.stderr[-4000:])
+            return result.returncode or 1
+        collect_ms = json.loads(output.read_text(encoding="utf-8"))
+
+    imports = parse_import_times(result.stderr)
+    project = [entry for entry in imports if entry["module"].split(".")[0] in PROJECT_PACKAGES]
+    print(f"pytest --collect-only: {wall_ms:.0f} ms wall, {sum(collect_ms.values()):.0f} ms collecting test modules")
+
+    print(f"\n{'import time by top-level package (self ms)':<60} {'ms':>8}")
+    for package, total_ms in by_package(imports)[: args.limit]:
+        print(f"{package:<60} {total_ms:>8.1f}")
+
+    print(f"\n{'slowest project imports (cumulative ms)':<60} {'ms':>8}")
+    for entry in sorted(project, key=lambda entry: entry["cumulative_ms"], reverse=True)[: args.limit]:
+        print(f"{entry['module']:<60} {entry['cumulative_ms']:>8.1f}")
+
+    print(f"\n{'collection time per test module':<60} {'ms':>8}")
+    for nodeid, elapsed_ms in sorted(collect_ms.items(), key=lambda item: item[1], reverse=True)[: args.limit]:
+        print(f"{nodeid:<60} {elapsed_ms:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
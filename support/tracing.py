@@ -0,0 +1,89 @@
+import re
+import time
+import weakref
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import allure
+
+from config import Settings
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Page
+
+TRACING_MODES = {"off", "on-failure"}
+
+
+def _trace_name(nodeid: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_")[:150]
+
+
+class FailureTracer:
+    # Tracing starts once per context (pooled contexts keep it across tests) and every test records into its
+    # own chunk. Chunks of passing tests are dropped in the driver; only a failing chunk is written to disk.
+    def __init__(self, mode: str | None = None, trace_dir: Path | None = None) -> None:
+        mode = mode or Settings.TRACING_MODE
+        if mode not in TRACING_MODES:
+            raise ValueError(f"TRACING must be one of {sorted(TRACING_MODES)}, got {mode!r}")
+        self.mode = mode
+        self.trace_dir = trace_dir or Settings.TRACE_DIR
+        self._tracing_contexts = weakref.WeakSet()
+        self.chunks = 0
+        self.kept = 0
+        self.overhead_ms = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def start_test(self, context: "BrowserContext", nodeid: str) -> None:
+        if not self.enabled:
+            return
+        start = time.perf_counter()
+        if context not in self._tracing_contexts:
+            context.tracing.start(screenshots=True, snapshots=True, sources=False)
+            self._tracing_contexts.add(context)
+        context.tracing.start_chunk(title=nodeid)
+        self.chunks += 1
+        self.overhead_ms += (time.perf_counter() - start) * 1000
+
+    def finish_test(self, context: "BrowserContext", nodeid: str, failed: bool) -> Path | None:
+        if not self.enabled or context not in self._tracing_contexts:
+            return None
+        start = time.perf_counter()
+        path = self.trace_dir / f"{Settings.RUN_ID}-{_trace_name(nodeid)}.zip" if failed else None
+        try:
+            context.tracing.stop_chunk(path=path)
+        except Exception:
+            # The test closed or broke the context; there is nothing left to save.
+            self._tracing_contexts.discard(context)
+            return None
+        finally:
+            self.overhead_ms += (time.perf_counter() - start) * 1000
+        if path is None:
+            return None
+        self.kept += 1
+        allure.attach.file(str(path), name="Playwright trace", extension="zip")
+        return path
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "chunks": self.chunks,
+            "kept": self.kept,
+            "overhead_ms": round(self.overhead_ms, 1),
+            "mean_overhead_ms": round(self.overhead_ms / self.chunks, 2) if self.chunks else 0.0,
+        }
+
+
+TRACER = FailureTracer()
+
+
+def attach_failure_screenshot(page: "Page") -> None:
+    if page.is_closed():
+        return
+    try:
+        screenshot = page.screenshot(full_page=True)
+    except Exception:
+        return
+    allure.attach(screenshot, name="Final screenshot", attachment_type=allure.attachment_type.PNG)
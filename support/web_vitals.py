@@ -0,0 +1,172 @@
+import functools
+import json
+import warnings
+from collections import Counter
+from pathlib import Path
+
+import allure
+
+from config import Settings
+from test_data import load_data
+
+# Buffered observers for the paint, layout-shift and long-task entries of the current document.
+VITALS_INSTALL_SCRIPT = """
+(() => {
+  if (window.__teebayVitals) return;
+  const vitals = { lcp: [], shifts: [], longTasks: [] };
+  window.__teebayVitals = vitals;
+  const observe = (type, handler) => {
+    try {
+      new PerformanceObserver((list) => list.getEntries().forEach(handler)).observe({ type, buffered: true });
+    } catch (error) {
+      // Entry type not supported by this browser.
+    }
+  };
+  observe("largest-contentful-paint", (entry) => vitals.lcp.push(entry.startTime));
+  observe("layout-shift", (entry) => { if (!entry.hadRecentInput) vitals.shifts.push([entry.startTime, entry.value]); });
+  observe("longtask", (entry) => vitals.longTasks.push([entry.startTime, entry.duration]));
+})();
+"""
+
+VITALS_MARK_SCRIPT = """
+() => ({ now: performance.now(), documentId: window.__teebaySettle ? window.__teebaySettle.documentId : null })
+"""
+
+# Metrics since the mark when the entry point stayed on the same document (client-side route change),
+# otherwise since navigation start of the new document, including its Navigation Timing entry.
+VITALS_COLLECT_SCRIPT = """
+(mark) => {
+  const vitals = window.__teebayVitals || { lcp: [], shifts: [], longTasks: [] };
+  const settle = window.__teebaySettle;
+  const sameDocument = Boolean(mark && mark.documentId && settle && mark.documentId === settle.documentId);
+  const since = sameDocument ? mark.now : 0;
+  const lcp = vitals.lcp.filter((time) => time >= since);
+  const longTasks = vitals.longTasks.filter(([start]) => start >= since);
+  const metrics = {
+    full_load: !sameDocument,
+    duration_ms: performance.now() - since,
+    lcp_ms: lcp.length ? lcp[lcp.length - 1] - since : null,
+    cls: vitals.shifts.filter(([start]) => start >= since).reduce((total, [, value]) => total + value, 0),
+    long_task_count: longTasks.length,
+    long_task_ms: longTasks.reduce((total, [, duration]) => total + duration, 0),
+    ttfb_ms: null,
+    dom_content_loaded_ms: null,
+    load_ms: null,
+  };
+  const navigation = performance.getEntriesByType("navigation")[0];
+  if (!sameDocument && navigation) {
+    metrics.ttfb_ms = navigation.responseStart - navigation.startTime;
+    metrics.dom_content_loaded_ms = navigation.domContentLoadedEventEnd - navigation.startTime || null;
+    metrics.load_ms = navigation.loadEventEnd - navigation.startTime || null;
+  }
+  return metrics;
+}
+"""
+
+
+class PerformanceBudgetWarning(UserWarning):
+    pass
+
+
+class VitalsRecorder:
+    def __init__(self) -> None:
+        self.measurements: list[dict] = []
+        self.current_test = ""
+        self.test_violations: list[str] = []
+        self.loads: Counter = Counter()
+
+    def wants_sample(self, page_name: str) -> bool:
+        # Pages without a budget are never measured; the others on their 1st, (N+1)th, (2N+1)th... load with
+        # N = PERF_SAMPLE_EVERY, so a regression that only shows up late in the run is still sampled.
+        if Settings.PERF_BUDGET_MODE == "off" or page_name not in budgets():
+            return False
+        self.loads[page_name] += 1
+        return (self.loads[page_name] - 1) % max(Settings.PERF_SAMPLE_EVERY, 1) == 0
+
+    def start_test(self, nodeid: str) -> None:
+        self.current_test = nodeid
+        self.test_violations = []
+
+    def record(self, page_name: str, metrics: dict) -> None:
+        fail_violations, warn_violations = check_budget(page_name, metrics)
+        self.measurements.append(
+            {
+                "run_id": Settings.RUN_ID,
+                "worker": Settings.WORKER_ID,
+                "test": self.current_test,
+                "page": page_name,
+                **{key: round(value, 4) if isinstance(value, float) else value for key, value in metrics.items()},
+                "failed_budgets": fail_violations,
+                "warned_budgets": warn_violations,
+            }
+        )
+        allure.attach(
+            json.dumps(metrics, indent=2), name=f"Web vitals: {page_name}", attachment_type=allure.attachment_type.JSON
+        )
+        for violation in warn_violations:
+            warnings.warn(f"{page_name}: {violation}", PerformanceBudgetWarning, stacklevel=3)
+            with allure.step(f"Budget warning ({page_name}): {violation}"):
+                pass
+        for violation in fail_violations:
+            self.test_violations.append(f"{page_name}: {violation}")
+            try:
+                # Marks the Allure step as failed without interrupting the functional flow of the test.
+                with allure.step(f"Budget exceeded ({page_name}): {violation}"):
+                    raise AssertionError(violation)
+            except AssertionError:
+                pass
+
+    def write_trend(self, directory: Path) -> Path | None:
+        if not self.measurements:
+            return None
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{Settings.RUN_ID}-{Settings.WORKER_ID}.json"
+        path.write_text(json.dumps(self.measurements, indent=2), encoding="utf-8")
+        return path
+
+
+VITALS = VitalsRecorder()
+
+
+def budgets() -> dict[str, dict]:
+    return {budget["name"]: budget for budget in load_data("performance_budgets")["pages"]}
+
+
+def check_budget(page_name: str, metrics: dict) -> tuple[list[str], list[str]]:
+    budget = budgets().get(page_name, {})
+    violations = []
+    for level in ("fail", "warn"):
+        exceeded = []
+        for metric, limit in budget.get(level, {}).items():
+            value = metrics.get(metric)
+            if value is not None and value > limit:
+                exceeded.append(f"{metric} {value:.2f} > {limit}")
+        violations.append(exceeded)
+    return violations[0], violations[1]
+
+
+def measured(page_name: str):
+    # Wraps a page-object entry point: marks the browser timeline before it and records vitals once settled.
+    # Only calls that take a sample pay for the settle wait; the others run the entry point untouched.
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(self, *args, **kwargs):
+            if not VITALS.wants_sample(page_name):
+                return function(self, *args, **kwargs)
+            try:
+                mark = self.page.evaluate(VITALS_MARK_SCRIPT)
+            except Exception:
+                mark = None
+            result = function(self, *args, **kwargs)
+            self.wait_for_settle()
+            try:
+                metrics = self.page.evaluate(VITALS_COLLECT_SCRIPT, mark)
+            except Exception:
+                # The page navigated again while collecting; this call goes unmeasured.
+                return result
+            VITALS.record(page_name, metrics)
+            return result
+
+        return wrapper
+
+    return decorate
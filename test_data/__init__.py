@@ -1 +1,13 @@
+from test_data.case_index import CaseRef, case_refs, refresh_case_index
+from test_data.loader import InvalidTestDataError, cases, load_data, stream_cases, validate_all
 
+__all__ = [
+    "CaseRef",
+    "InvalidTestDataError",
+    "case_refs",
+    "cases",
+    "load_data",
+    "refresh_case_index",
+    "stream_cases",
+    "validate_all",
+]
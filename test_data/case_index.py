@@ -0,0 +1,98 @@
+import json
+from functools import cache
+from pathlib import Path
+from typing import NamedTuple
+
+from config import Settings
+from support.locking import write_json_atomic
+from test_data.loader import (
+    DATA_DIR,
+    InvalidTestDataError,
+    load_data,
+    read_case_at,
+    stream_case_offsets,
+    stream_cases,
+)
+from test_data.schemas import SCHEMAS
+
+# Bumped when the stored layout changes, so an index written by an older checkout is rebuilt.
+INDEX_VERSION = 2
+
+
+class CaseRef(NamedTuple):
+    # What collection sees of a case: enough to build the test id, with the payload read when the test runs.
+    data: str
+    section: str
+    name: str
+    offset: int | None = None  # Byte offset of the case line in <data>.jsonl; None for cases in <data>.json.
+
+    def __str__(self) -> str:
+        return self.name
+
+    def load(self) -> dict:
+        if self.offset is not None:
+            case = read_case_at(self.data, self.section, self.offset)
+            if case is not None and case["name"] == self.name:
+                return case
+        # The .json file is already parsed and cached; a .jsonl edited since collection is scanned once more.
+        for case in stream_cases(self.data, self.section):
+            if case["name"] == self.name:
+                return case
+        raise InvalidTestDataError(f"{self.data}:{self.section}: no case named '{self.name}'")
+
+
+def _fingerprint(path: Path) -> list[int] | None:
+    if not path.exists():
+        return None
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _index_section(name: str, section: str) -> list[list]:
+    if (DATA_DIR / f"{name}.jsonl").exists():
+        return [[case["name"], offset] for offset, case in stream_case_offsets(name, section)]
+    return [[case["name"], None] for case in stream_cases(name, section)]
+
+
+def _index_file(name: str) -> dict:
+    # Reading the file through the loader validates it, so a stale entry is only replaced by a valid one.
+    if (DATA_DIR / f"{name}.json").exists():
+        load_data(name)
+    return {
+        section: _index_section(name, section)
+        for section, schema in SCHEMAS[name].items()
+        if schema["kind"] == "cases"
+    }
+
+
+@cache
+def refresh_case_index() -> dict[str, dict[str, list[list]]]:
+    # Only data files whose size or mtime changed since the index was written are read and validated again.
+    try:
+        stored = json.loads(Settings.CASE_INDEX.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        stored = {}
+    schemas_fingerprint = _fingerprint(DATA_DIR / "schemas.py")
+    if stored.get("schemas") != schemas_fingerprint or stored.get("version") != INDEX_VERSION:
+        stored = {}
+    files = stored.get("files", {})
+    index = {"version": INDEX_VERSION, "schemas": schemas_fingerprint, "files": {}}
+    for name in SCHEMAS:
+        fingerprint = [_fingerprint(DATA_DIR / f"{name}.json"), _fingerprint(DATA_DIR / f"{name}.jsonl")]
+        if fingerprint == [None, None]:
+            continue
+        entry = files.get(name)
+        if entry is None or entry["fingerprint"] != fingerprint:
+            entry = {"fingerprint": fingerprint, "sections": _index_file(name)}
+        index["files"][name] = entry
+    if index != stored:
+        Settings.CASE_INDEX.parent.mkdir(parents=True, exist_ok=True)
+        write_json_atomic(Settings.CASE_INDEX, json.dumps(index, indent=2))
+    return {name: entry["sections"] for name, entry in index["files"].items()}
+
+
+def case_refs(name: str, section: str) -> list[CaseRef]:
+    return [
+        CaseRef(name, section, case_name, offset)
+        for case_name, offset in refresh_case_index().get(name, {}).get(section, [])
+    ]
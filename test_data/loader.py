@@ -0,0 +1,124 @@
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator
+
+from test_data.schemas import SCHEMAS
+
+DATA_DIR = Path(__file__).resolve().parent
+
+
+class InvalidTestDataError(ValueError):
+    pass
+
+
+def _section(data: dict, section: str, source: str):
+    value = data
+    for key in section.split("."):
+        if not isinstance(value, dict) or key not in value:
+            raise InvalidTestDataError(f"{source}: missing section '{section}'")
+        value = value[key]
+    return value
+
+
+def _validate_case(case, schema: dict, where: str) -> None:
+    if not isinstance(case, dict):
+        raise InvalidTestDataError(f"{where}: expected an object, got {type(case).__name__}")
+    missing = [key for key in schema["required"] if key not in case]
+    if missing:
+        raise InvalidTestDataError(f"{where}: missing required keys {missing}")
+    if schema["one_of"] and not any(all(key in case for key in group) for group in schema["one_of"]):
+        raise InvalidTestDataError(f"{where}: needs one of {[list(group) for group in schema['one_of']]}")
+    if schema["kind"] == "cases" and not isinstance(case["name"], str):
+        raise InvalidTestDataError(f"{where}: 'name' must be a string")
+
+
+def _validate_section(name: str, section: str, value) -> None:
+    schema = SCHEMAS[name][section]
+    source = f"{name}.json:{section}"
+    if schema["kind"] == "fields":
+        _validate_case(value, schema, source)
+        return
+    if not isinstance(value, list):
+        raise InvalidTestDataError(f"{source}: expected a list of cases")
+    seen: set[str] = set()
+    for index, case in enumerate(value):
+        _validate_case(case, schema, f"{source}[{index}]")
+        if case["name"] in seen:
+            raise InvalidTestDataError(f"{source}[{index}]: duplicate case name '{case['name']}'")
+        seen.add(case["name"])
+
+
+@lru_cache(maxsize=None)
+def load_data(name: str) -> dict:
+    path = DATA_DIR / f"{name}.json"
+    text = path.read_text(encoding="utf-8")
+    if not text.strip():
+        raise InvalidTestDataError(f"{path.name}: file is empty")
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as error:
+        raise InvalidTestDataError(f"{path.name}: invalid JSON ({error})") from None
+    for section in SCHEMAS.get(name, {}):
+        _validate_section(name, section, _section(data, section, path.name))
+    return data
+
+
+def cases(name: str, section: str) -> list[dict]:
+    return _section(load_data(name), section, f"{name}.json")
+
+
+def stream_cases(name: str, section: str) -> Iterator[dict]:
+    # Large data sets live in <name>.jsonl (one case per line, tagged with "section") and are never fully loaded.
+    if not (DATA_DIR / f"{name}.jsonl").exists():
+        yield from cases(name, section)
+        return
+    for _, case in stream_case_offsets(name, section):
+        yield case
+
+
+def stream_case_offsets(name: str, section: str) -> Iterator[tuple[int, dict]]:
+    # Yields each case of a .jsonl section with the byte offset of its line, for read_case_at.
+    path = DATA_DIR / f"{name}.jsonl"
+    offset = 0
+    with path.open("rb") as lines:
+        for line_number, line in enumerate(lines, start=1):
+            line_offset, offset = offset, offset + len(line)
+            case = _parse_line(name, section, line, f"{path.name}:{line_number}")
+            if case is not None:
+                yield line_offset, case
+
+
+def read_case_at(name: str, section: str, offset: int) -> dict | None:
+    # Reads the one case line starting at offset; None when that line is not a case of this section.
+    path = DATA_DIR / f"{name}.jsonl"
+    with path.open("rb") as lines:
+        lines.seek(offset)
+        return _parse_line(name, section, lines.readline(), f"{path.name}@{offset}")
+
+
+def _parse_line(name: str, section: str, line: bytes, where: str) -> dict | None:
+    if not line.strip():
+        return None
+    try:
+        case = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError) as error:
+        raise InvalidTestDataError(f"{where}: invalid JSON ({error})") from None
+    if not isinstance(case, dict):
+        raise InvalidTestDataError(f"{where}: expected an object, got {type(case).__name__}")
+    if case.pop("section", None) != section:
+        return None
+    schema = SCHEMAS.get(name, {}).get(section)
+    if schema:
+        _validate_case(case, schema, where)
+    return case
+
+
+def validate_all() -> None:
+    for name, sections in SCHEMAS.items():
+        if (DATA_DIR / f"{name}.json").exists():
+            load_data(name)
+        if (DATA_DIR / f"{name}.jsonl").exists():
+            for section in sections:
+                for _ in stream_cases(name, section):
+                    pass
@@ -0,0 +1,91 @@
+def cases(*required: str, one_of: tuple[tuple[str, ...], ...] = ()) -> dict:
+    # Every case needs a unique "name"; one_of lists alternative key groups of which one must be complete.
+    return {"kind": "cases", "required": ("name", *required), "one_of": one_of}
+
+
+def fields(*required: str) -> dict:
+    return {"kind": "fields", "required": required, "one_of": ()}
+
+
+EXPECTED_MESSAGE = (("expected_message",), ("expected_messages",), ("expected_any_groups",))
+ACCOUNT_FIELDS = ("first_name", "last_name", "address", "email", "phone_number")
+REGISTRATION_FIELDS = (*ACCOUNT_FIELDS, "password", "confirm_password")
+PRODUCT_FIELDS = ("title", "description", "purchase_price", "rent_price")
+
+SCHEMAS = {
+    "login": {
+        "ui_validations": cases(),
+        "positive_cases": cases("email", "password"),
+        "negative_cases": cases("email", "password", "expected_message"),
+    },
+    "registration": {
+        "ui_validations": cases(),
+        "positive_cases": cases(*REGISTRATION_FIELDS),
+        "negative_cases": cases(*REGISTRATION_FIELDS, one_of=EXPECTED_MESSAGE),
+    },
+    "account_settings": {
+        "ui_validations": cases(),
+        "positive_cases": cases(*ACCOUNT_FIELDS),
+        "negative_cases": cases(*ACCOUNT_FIELDS, one_of=EXPECTED_MESSAGE),
+    },
+    "add_update_product": {
+        "ui_validations": cases(),
+        "positive_cases": cases(*PRODUCT_FIELDS, "category", "rent_duration_type"),
+        "negative_cases": cases(*PRODUCT_FIELDS, "category", "rent_duration_type", one_of=EXPECTED_MESSAGE),
+        "update_ui_validations": cases("search_title_from_add_positive"),
+        "update_seed_product": fields("description", "purchase_price", "rent_price", "category", "rent_duration_type"),
+        "update_positive_cases": cases(
+            "search_title_from_add_positive",
+            "updated_title",
+            "updated_description",
+            "updated_purchase_price",
+            "updated_rent_price",
+            "updated_category",
+            "updated_rent_duration_type",
+        ),
+        "update_negative_cases": cases("search_title_from_add_positive", *PRODUCT_FIELDS, one_of=EXPECTED_MESSAGE),
+    },
+    "delete_product": {
+        "ui_validations": cases(),
+        "positive_cases": cases(
+            "product_title_prefix", "description", "purchase_price", "rent_price", "category", "rent_duration_type"
+        ),
+    },
+    "browse_products": {
+        "ui_validations": cases(),
+        "title_filter.positive_cases": cases("title", "expected_titles"),
+        "title_filter.negative_cases": cases("title", "expected_count"),
+        "category_filter.positive_cases": cases("category", "expected_titles"),
+        "category_filter.negative_cases": cases("category", one_of=(("expected_count",), ("unexpected_titles",))),
+        "buy_filter.positive_cases": cases("min_buy_range", "max_buy_range", "expected_titles"),
+        "buy_filter.negative_cases": cases("min_buy_range", "max_buy_range", "expected_count"),
+        "rent_filter.positive_cases": cases("min_rent_range", "max_rent_range", "rent_duration_type", "expected_titles"),
+        "rent_filter.negative_cases": cases("min_rent_range", "max_rent_range", "rent_duration_type", "expected_count"),
+        "filter_matrix": fields("titles", "categories", "buy_ranges", "rent_ranges", "rent_durations"),
+        "oracle_cases": cases(),
+    },
+    "performance_budgets": {
+        "pages": cases(one_of=(("fail",), ("warn",))),
+    },
+    "selector_budget": {
+        "limits": fields("max_cost_ms", "max_cost_ratio"),
+        "accepted": cases(),
+    },
+    "buy_rent_product": {
+        "product_targets": fields(
+            "sold_product_title",
+            "rent_product_title",
+            "buy_product_title",
+            "own_available_product_title",
+            "own_available_category",
+        ),
+        "rent_cases.positive_cases": cases(
+            "start_offset_days", "end_offset_days", "expected_statuses_after"
+        ),
+        "rent_cases.negative_cases": cases(
+            one_of=(("start_offset_days", "end_offset_days"), ("start_date", "end_date")),
+        ),
+        "buy_cases.positive_cases": cases("expected_statuses_after"),
+        "buy_cases.negative_cases": cases("expected_statuses_after"),
+    },
+}
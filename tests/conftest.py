@@ -1,59 +1,483 @@
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import allure
 import pytest
-from playwright.sync_api import Browser, BrowserContext, BrowserType, Page, Playwright, sync_playwright
+from _pytest.runner import runtestprotocol
 
 from config import Settings
+from pages.base_page import BODY_TEXT_CACHE_STATS
+from pages.browse_products_page import BrowseProductsPage
+from pages.login_page import LoginPage
+from support.action_timing import TIMER, format_summary, summarize
+from support.async_loop import LoopThread
+from support.auth_state import AuthStateCache
+from support.browser_server import RecyclableBrowser, connect_or_launch_async
+from support.catalog_index import CatalogIndex
+from support.context_pool import ContextPool
+from support.durations import DurationHistory
+from support.fake_teebay import FakeTeebayServer
+from support.filter_oracle import CATALOG_SNAPSHOT, CatalogOracle
+from support.memory_watch import MEMORY
+from support.parallel import MANIFEST_ENV
+from support.quarantine import QUARANTINE_MODES, QuarantineLedger, outcome_of
+from support.resource_policy import (
+    ResourcePolicy,
+    ResourceSizeLedger,
+    ResourceStats,
+    apply_resource_policy,
+    estimate_blocked_sizes,
+)
+from support.seeding import SeedingClient
+from support.tracing import TRACER, attach_failure_screenshot
+from support.web_vitals import VITALS
+from test_data import CaseRef, InvalidTestDataError, refresh_case_index
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser as AsyncBrowser
+    from playwright.async_api import BrowserContext as AsyncBrowserContext
+    from playwright.async_api import Page as AsyncPage
+    from playwright.sync_api import Browser, BrowserContext, Page, Playwright
+
+
+CONTEXT_POOL_STATS: dict = {}
+LEDGER = QuarantineLedger()
+# Every attempt's outcome per test id in this session, in order; the ledger gets them at session end.
+TEST_OUTCOMES: dict[str, list[str]] = {}
+TEST_DURATIONS: dict[str, float] = {}
+
+
+def pytest_collection(session: pytest.Session) -> None:
+    # Bad data must stop the run before any browser starts, not halfway through it. Builds the case index that
+    # parametrization reads; only data files changed since the last run are loaded and validated.
+    try:
+        refresh_case_index()
+    except InvalidTestDataError as error:
+        raise pytest.UsageError(f"Invalid test data: {error}") from None
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    # run_all_tests.py runs quarantined tests in their own non-blocking batch (QUARANTINE=only).
+    if Settings.QUARANTINE_MODE not in QUARANTINE_MODES:
+        raise pytest.UsageError(f"QUARANTINE must be one of {sorted(QUARANTINE_MODES)}")
+    if Settings.QUARANTINE_MODE != "off":
+        quarantined = LEDGER.quarantined()
+        selected, deselected = [], []
+        for item in items:
+            keep = (item.nodeid in quarantined) == (Settings.QUARANTINE_MODE == "only")
+            (selected if keep else deselected).append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+    if Settings.LONGEST_FIRST:
+        # run_all_tests.py turns this on so every process, including a single-worker run, starts with its
+        # slowest tests; the sort is stable, so tests with the same prediction keep their collection order.
+        predicted = DurationHistory().predict([item.nodeid for item in items])
+        items.sort(key=lambda item: -predicted[item.nodeid])
+
+
+def pytest_collection_finish(session: pytest.Session) -> None:
+    # Written for run_all_tests.py --workers so it can keep shared_state groups on one worker.
+    manifest_path = os.getenv(MANIFEST_ENV)
+    if not manifest_path:
+        return
+    manifest = [
+        {
+            "nodeid": item.nodeid,
+            "shared_state": sorted({marker.args[0] for marker in item.iter_markers("shared_state")}),
+        }
+        for item in session.items
+    ]
+    Path(manifest_path).write_text(json.dumps(manifest), encoding="utf-8")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem: pytest.Item | None) -> bool:
+    # With RERUN_FAILURES (run_all_tests.py sets 1) a test that failed in its body is rerun straight away in this
+    # process, so the session browser and cached login stay warm; setup errors are not retried. Only the last
+    # attempt is reported to pytest, a pass after a failure is marked flaky, and all attempts go to the ledger.
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    outcomes = TEST_OUTCOMES.setdefault(item.nodeid, [])
+    for _ in range(Settings.RERUN_FAILURES + 1):
+        reports = runtestprotocol(item, nextitem=nextitem, log=False)
+        outcomes.append(outcome_of(reports))
+        if outcomes[-1] != "failed" or any(report.when == "setup" and report.failed for report in reports):
+            break
+    if len(outcomes) > 1:
+        item.user_properties.append(("attempts", outcomes))
+        if outcomes[-1] == "passed":
+            item.user_properties.append(("flaky", True))
+            for report in reports:
+                report.user_properties = list(item.user_properties)
+    for report in reports:
+        item.ihook.pytest_runtest_logreport(report=report)
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return True
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call):
+    # Keeps each phase's report on the item so fixture teardown can tell whether the test failed.
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+    if report.when == "teardown" and any(
+        marker.args[0] == "catalog" and not marker.kwargs.get("read_only")
+        for marker in item.iter_markers("shared_state")
+    ):
+        # The test may have added, changed or removed products; the next filter_oracle user captures again.
+        CATALOG_SNAPSHOT.invalidate()
+
+
+def pytest_runtest_logreport(report: pytest.TestReport) -> None:
+    # Setup, call and teardown of the reported attempt; run_all_tests.py balances workers and shards on these.
+    TEST_DURATIONS[report.nodeid] = TEST_DURATIONS.get(report.nodeid, 0.0) + report.duration
+
+
+def _test_failed(request: pytest.FixtureRequest) -> bool:
+    return any(
+        getattr(getattr(request.node, f"rep_{when}", None), "failed", False) for when in ("setup", "call")
+    )
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    if TIMER.records:
+        TIMER.write_report(Settings.ACTION_TIMING_DIR / f"{Settings.WORKER_ID}.json")
+    VITALS.write_trend(Settings.PERF_TREND_DIR)
+    LEDGER.record(TEST_OUTCOMES)
+    DurationHistory().record(TEST_DURATIONS)
+    MEMORY.write_report(Settings.MEMORY_REPORT_DIR)
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    hits, misses = BODY_TEXT_CACHE_STATS["hits"], BODY_TEXT_CACHE_STATS["misses"]
+    if hits or misses:
+        # Hits still cost one evaluate call each; what they save is the layout and the text transfer.
+        terminalreporter.write_line(
+            f"body text cache: {hits + misses} reads (one evaluate call each), {hits} reused the snapshot "
+            f"instead of re-reading innerText ({BODY_TEXT_CACHE_STATS['chars_not_sent']} characters not sent)"
+        )
+    if CONTEXT_POOL_STATS:
+        terminalreporter.write_line(
+            "context pool: {created} created, {reused} reused ({reuse_rate:.0%}), {fresh} fresh, "
+            "{reset_failures} reset failures".format(**CONTEXT_POOL_STATS)
+        )
+    rerun = {nodeid: outcomes for nodeid, outcomes in TEST_OUTCOMES.items() if len(outcomes) > 1}
+    if rerun:
+        terminalreporter.section("reruns")
+        for nodeid, outcomes in rerun.items():
+            flaky = " (FLAKY: passed only on rerun)" if outcomes[-1] == "passed" else ""
+            terminalreporter.write_line(f"{nodeid}: {' -> '.join(outcomes)}{flaky}")
+    if TRACER.chunks:
+        terminalreporter.write_line(
+            "tracing ({mode}): {chunks} chunks, {kept} traces kept, "
+            "{overhead_ms:.0f} ms chunk overhead ({mean_overhead_ms:.1f} ms per test)".format(**TRACER.stats())
+        )
+    if CATALOG_SNAPSHOT.captures:
+        terminalreporter.write_line(f"catalog snapshot: captured {CATALOG_SNAPSHOT.captures} times for the filter oracle")
+    growth = MEMORY.growth()
+    if growth or MEMORY.recycles:
+        terminalreporter.section("browser memory")
+        for streak in growth:
+            blamed = ", ".join(f"{test['nodeid']} (+{test['delta']})" for test in streak["blamed"])
+            terminalreporter.write_line(
+                f"{streak['metric']} grew {streak['growth_percent']}% over {streak['tests']} tests "
+                f"({streak['start']} -> {streak['end']}); largest steps: {blamed}"
+            )
+        for recycle in MEMORY.recycles:
+            action = "recycle skipped (browser server over CDP)" if recycle["skipped"] else "browser recycled"
+            terminalreporter.write_line(
+                f"{action} after {recycle['after_test']}: session heap {recycle['heap_mb']} MB "
+                f"(baseline {recycle['heap_baseline_mb']} MB), RSS {recycle['rss_mb']} MB"
+            )
+    if TIMER.records:
+        terminalreporter.section("slowest page-object methods")
+        for line in format_summary(summarize(TIMER.records)):
+            terminalreporter.write_line(line)
+
+
+@pytest.fixture(autouse=True)
+def performance_budgets(request: pytest.FixtureRequest) -> None:
+    VITALS.start_test(request.node.nodeid)
+    yield
+    if VITALS.test_violations and Settings.PERF_BUDGET_MODE == "enforce":
+        pytest.fail("Performance budget exceeded: " + "; ".join(VITALS.test_violations), pytrace=False)
+
+
+@pytest.fixture(autouse=True)
+def memory_watch(request: pytest.FixtureRequest) -> None:
+    # Autouse fixtures are torn down last, so by now the test's context is back in the pool and the
+    # browser can be swapped safely.
+    yield
+    MEMORY.recycle_if_due(request.node.nodeid)
+
+
+def _sample_memory(page: "Page", request: pytest.FixtureRequest) -> None:
+    sample = MEMORY.sample(page, request.node.nodeid)
+    if sample is not None:
+        request.node.user_properties.append(("memory", sample._asdict()))
+
+
+@pytest.fixture(autouse=True)
+def action_timing_scope(request: pytest.FixtureRequest) -> None:
+    TIMER.current_test = request.node.nodeid
+    yield
+    TIMER.current_test = ""
+
+
+@pytest.fixture(scope="session", autouse=True)
+def app_server() -> FakeTeebayServer | None:
+    # APP_MODE=fake points every page object at a per-worker local stand-in instead of BASE_URL.
+    if Settings.APP_MODE != "fake":
+        yield None
+        return
+    live_base_url, live_api_base_url = Settings.BASE_URL, Settings.API_BASE_URL
+    server = FakeTeebayServer(port=Settings.FAKE_APP_PORT).start()
+    Settings.use_base_url(server.base_url)
+    Settings.API_BASE_URL = f"{server.base_url}/api"
+    yield server
+    server.stop()
+    Settings.use_base_url(live_base_url)
+    Settings.API_BASE_URL = live_api_base_url
 
 
 @pytest.fixture(scope="session")
-def playwright_instance() -> Playwright:
+def playwright_instance() -> "Playwright":
+    from playwright.sync_api import sync_playwright
+
     with sync_playwright() as playwright:
         yield playwright
 
 
 @pytest.fixture(scope="session")
-def browser(playwright_instance: Playwright) -> Browser:
-    browser_type: BrowserType = getattr(playwright_instance, Settings.BROWSER_NAME)
-    browser = browser_type.launch(headless=Settings.HEADLESS)
+def browser(playwright_instance: "Playwright") -> RecyclableBrowser:
+    # Connects to `python -m support.browser_server` when one is running, otherwise launches locally.
+    # Closing a connected browser only disconnects; the server keeps running for the next invocation.
+    # The memory watch may replace the browser between tests; the wrapper keeps this reference valid.
+    browser = RecyclableBrowser(playwright_instance)
+    MEMORY.browser = browser
     yield browser
+    MEMORY.close_probe()
+    MEMORY.browser = None
     browser.close()
 
 
+@pytest.fixture(scope="session")
+def async_loop() -> LoopThread:
+    loop = LoopThread().start()
+    yield loop
+    loop.stop()
+
+
+@pytest.fixture(scope="session")
+def async_browser(async_loop: LoopThread) -> "AsyncBrowser":
+    from playwright.async_api import async_playwright
+
+    async def launch():
+        playwright = await async_playwright().start()
+        return playwright, await connect_or_launch_async(playwright)
+
+    playwright, browser = async_loop.run(launch())
+    yield browser
+    async_loop.run(browser.close())
+    async_loop.run(playwright.stop())
+
+
 @pytest.fixture()
-def context(browser: Browser) -> BrowserContext:
-    context = browser.new_context()
+def async_context(async_loop: LoopThread, async_browser: "AsyncBrowser") -> "AsyncBrowserContext":
+    context = async_loop.run(async_browser.new_context())
     yield context
-    context.close()
+    async_loop.run(context.close())
 
 
 @pytest.fixture()
-def page(context: BrowserContext) -> Page:
-    page = context.new_page()
-    yield page
+def async_page(async_loop: LoopThread, async_context: "AsyncBrowserContext") -> "AsyncPage":
+    return async_loop.run(async_context.new_page())
+
+
+@pytest.fixture(scope="session")
+def resource_size_ledger() -> ResourceSizeLedger:
+    ledger = ResourceSizeLedger(Settings.RESOURCE_SIZE_LEDGER)
+    yield ledger
+    ledger.save()
 
 
 @pytest.fixture()
-def authenticated_context(browser: Browser) -> BrowserContext:
-    context = browser.new_context()
+def resource_policy(request: pytest.FixtureRequest) -> ResourcePolicy:
+    marker = request.node.get_closest_marker("resource_policy")
+    return ResourcePolicy.from_settings(**(marker.kwargs if marker else {}))
+
+
+def _report_resource_stats(request: pytest.FixtureRequest, stats: ResourceStats) -> None:
+    report = stats.as_dict()
+    request.node.user_properties.append(("resource_policy", report))
+    allure.attach(json.dumps(report, indent=2), name="Resource policy", attachment_type=allure.attachment_type.JSON)
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser: RecyclableBrowser) -> ContextPool:
+    pool = ContextPool(browser)
+    browser.before_recycle.append(pool.close)
+    yield pool
+    pool.close()
+    CONTEXT_POOL_STATS.update(pool.stats())
+
+
+def _wants_fresh_context(request: pytest.FixtureRequest) -> bool:
+    return request.node.get_closest_marker("fresh_context") is not None
+
+
+@pytest.fixture()
+def context(
+    context_pool: ContextPool,
+    request: pytest.FixtureRequest,
+    resource_policy: ResourcePolicy,
+    resource_size_ledger: ResourceSizeLedger,
+) -> "BrowserContext":
+    context = context_pool.acquire(fresh=_wants_fresh_context(request))
+    stats = apply_resource_policy(context, resource_policy, resource_size_ledger)
+    TRACER.start_test(context, request.node.nodeid)
     yield context
-    context.close()
+    TRACER.finish_test(context, request.node.nodeid, _test_failed(request))
+    estimate_blocked_sizes(context, stats)
+    context_pool.release(context)
+    _report_resource_stats(request, stats)
 
 
 @pytest.fixture()
-def authenticated_page(authenticated_context: BrowserContext) -> Page:
-    page = authenticated_context.new_page()
+def page(context: "BrowserContext", request: pytest.FixtureRequest) -> "Page":
+    page = context.new_page()
+    yield page
+    _sample_memory(page, request)
+    if _test_failed(request):
+        attach_failure_screenshot(page)
+
+
+def _login_through_ui(page: "Page") -> None:
+    login_page = LoginPage(page)
+    login_page.open()
+    login_page.login(email=Settings.USERNAME, password=Settings.PASSWORD)
+    try:
+        page.wait_for_url(Settings.MY_PRODUCTS_URL)
+    except Exception:
+        raise RuntimeError(f"Authenticated page setup failed. Current URL: {page.url}") from None
+
 
+def _refresh_auth_state(browser: "Browser", auth_state: AuthStateCache) -> None:
+    context = browser.new_context()
+    try:
+        _login_through_ui(context.new_page())
+        auth_state.save(context)
+    finally:
+        context.close()
+
+
+def _resume_cached_session(page: "Page") -> bool:
+    # Opens my-products straight away with the stored session; a rejected session redirects to the login form.
+    login_page = LoginPage(page)
+    page.goto(Settings.MY_PRODUCTS_URL, wait_until="domcontentloaded")
+    try:
+        page.locator(login_page.EMAIL_INPUT).or_(page.get_by_text(login_page.MY_PRODUCTS_TEXT)).first.wait_for()
+    except Exception:
+        return False
+    return page.url == Settings.MY_PRODUCTS_URL and page.locator(login_page.EMAIL_INPUT).count() == 0
+
+
+@pytest.fixture(scope="session")
+def auth_state(browser: "Browser") -> AuthStateCache:
     if not Settings.USERNAME or not Settings.PASSWORD:
         raise RuntimeError("USERNAME/PASSWORD are required for authenticated_page.")
 
-    page.goto(Settings.LOGIN_URL, wait_until="domcontentloaded")
-    page.locator("input[name='email']").fill(Settings.USERNAME)
-    page.locator("input[name='password']").fill(Settings.PASSWORD)
-    page.get_by_role("button", name="Sign In").click()
-    page.wait_for_timeout(1500)
+    auth_state = AuthStateCache.for_worker()
+    if not auth_state.is_fresh():
+        _refresh_auth_state(browser, auth_state)
+    return auth_state
 
-    if page.url != Settings.MY_PRODUCTS_URL:
-        raise RuntimeError(f"Authenticated page setup failed. Current URL: {page.url}")
+
+@pytest.fixture()
+def authenticated_context(
+    browser: "Browser",
+    auth_state: AuthStateCache,
+    context_pool: ContextPool,
+    request: pytest.FixtureRequest,
+    resource_policy: ResourcePolicy,
+    resource_size_ledger: ResourceSizeLedger,
+) -> "BrowserContext":
+    if not auth_state.is_fresh():
+        _refresh_auth_state(browser, auth_state)
+    context = context_pool.acquire(storage_state=auth_state.path, fresh=_wants_fresh_context(request))
+    stats = apply_resource_policy(context, resource_policy, resource_size_ledger)
+    TRACER.start_test(context, request.node.nodeid)
+    yield context
+    TRACER.finish_test(context, request.node.nodeid, _test_failed(request))
+    estimate_blocked_sizes(context, stats)
+    context_pool.release(context)
+    _report_resource_stats(request, stats)
+
+
+@pytest.fixture()
+def authenticated_page(
+    authenticated_context: "BrowserContext", auth_state: AuthStateCache, request: pytest.FixtureRequest
+) -> "Page":
+    page = authenticated_context.new_page()
+
+    if not _resume_cached_session(page):
+        # Stored session was rejected by the app: drop it, log in again and refresh the cache for later tests.
+        auth_state.invalidate()
+        _login_through_ui(page)
+        auth_state.save(authenticated_context)
 
     yield page
+    _sample_memory(page, request)
+    if _test_failed(request):
+        attach_failure_screenshot(page)
     page.close()
 
+
+@pytest.fixture()
+def async_authenticated_context(
+    async_loop: LoopThread,
+    async_browser: "AsyncBrowser",
+    browser: "Browser",
+    auth_state: AuthStateCache,
+) -> "AsyncBrowserContext":
+    # Every page opened here starts signed in from the cached storage state, so tests can fan out
+    # across many pages of one context without logging in per page.
+    if not auth_state.is_fresh():
+        _refresh_auth_state(browser, auth_state)
+    context = async_loop.run(async_browser.new_context(storage_state=str(auth_state.path)))
+    yield context
+    async_loop.run(context.close())
+
+
+@pytest.fixture()
+def case(request: pytest.FixtureRequest) -> dict:
+    # Parametrized indirectly with case_refs(...): the payload is read when the test runs, not at collection.
+    ref: CaseRef = request.param
+    return ref.load()
+
+
+@pytest.fixture(scope="session")
+def catalog_index() -> CatalogIndex:
+    return CatalogIndex()
+
+
+@pytest.fixture()
+def filter_oracle(authenticated_page: "Page") -> CatalogOracle | None:
+    # Expected browse results computed locally from one catalog snapshot; None with FILTER_ORACLE=off, where
+    # tests fall back to the expectations written in browse_products.json.
+    if not Settings.FILTER_ORACLE_ENABLED:
+        return None
+    if CATALOG_SNAPSHOT.oracle is None:
+        browse_page = BrowseProductsPage(authenticated_page)
+        browse_page.open_from_my_products()
+        return CATALOG_SNAPSHOT.oracle_for(browse_page)
+    return CATALOG_SNAPSHOT.oracle
+
+
+@pytest.fixture(scope="session")
+def seeding_client(app_server) -> SeedingClient | None:
+    # None when no API_BASE_URL is configured; callers then fall back to the UI flows.
+    return SeedingClient.from_settings()
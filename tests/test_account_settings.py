@@ -1,36 +1,24 @@
-import json
-from pathlib import Path
-
 import pytest
 
 from config import Settings
 from pages.account_settings_page import AccountSettingsPage
+from test_data import case_refs
 
 
-def _load_account_settings_data() -> dict:
-    data_path = Path(__file__).resolve().parent.parent / "test_data" / "account_settings.json"
-    return json.loads(data_path.read_text(encoding="utf-8"))
-
-
-ACCOUNT_SETTINGS_DATA = _load_account_settings_data()
+pytestmark = pytest.mark.shared_state("account")
 
 
-@pytest.mark.parametrize("case", ACCOUNT_SETTINGS_DATA["ui_validations"], ids=lambda c: c["name"])
+@pytest.mark.parametrize("case", case_refs("account_settings", "ui_validations"), ids=str, indirect=True)
 def test_account_settings_ui_validation(authenticated_page, case: dict) -> None:
     account_settings_page = AccountSettingsPage(authenticated_page)
     account_settings_page.open_from_my_products()
 
     assert account_settings_page.is_on_account_settings_page()
     assert account_settings_page.text_visible(account_settings_page.PAGE_HEADING_TEXT)
-    assert authenticated_page.locator(account_settings_page.FIRST_NAME_INPUT).is_visible()
-    assert authenticated_page.locator(account_settings_page.LAST_NAME_INPUT).is_visible()
-    assert authenticated_page.locator(account_settings_page.ADDRESS_INPUT).is_visible()
-    assert authenticated_page.locator(account_settings_page.EMAIL_INPUT).is_visible()
-    assert authenticated_page.locator(account_settings_page.PHONE_NUMBER_INPUT).is_visible()
-    assert authenticated_page.locator(account_settings_page.UPDATE_BUTTON).is_visible()
+    assert account_settings_page.hidden_elements(account_settings_page.FORM_CONTROLS) == []
 
 
-@pytest.mark.parametrize("case", ACCOUNT_SETTINGS_DATA["positive_cases"], ids=lambda c: c["name"])
+@pytest.mark.parametrize("case", case_refs("account_settings", "positive_cases"), ids=str, indirect=True)
 def test_update_account_settings_positive(authenticated_page, case: dict) -> None:
     account_settings_page = AccountSettingsPage(authenticated_page)
     account_settings_page.open_from_my_products()
@@ -56,7 +44,7 @@ def test_update_account_settings_positive(authenticated_page, case: dict) -> Non
     assert actual_values["phone_number"].lstrip("0") == case["phone_number"].lstrip("0")
 
 
-@pytest.mark.parametrize("case", ACCOUNT_SETTINGS_DATA["negative_cases"], ids=lambda c: c["name"])
+@pytest.mark.parametrize("case", case_refs("account_settings", "negative_cases"), ids=str, indirect=True)
 def test_update_account_settings_negative(authenticated_page, case: dict) -> None:
     account_settings_page = AccountSettingsPage(authenticated_page)
     account_settings_page.open_from_my_products()
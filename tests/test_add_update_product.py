@@ -1,28 +1,35 @@
-import json
 import time
-from pathlib import Path
 
 import pytest
 
 from config import Settings
 from pages.my_products_page import AddUpdateProductPage, MyProductsPage
-
-
-def _load_add_product_data() -> dict:
-    data_path = Path(__file__).resolve().parent.parent / "test_data" / "add_update_product.json"
-    return json.loads(data_path.read_text(encoding="utf-8"))
+from test_data import case_refs, load_data
 
 
 def _unique_title(base_title: str) -> str:
     return f"{base_title} {int(time.time() * 1000)}"
 
 
-ADD_PRODUCT_DATA = _load_add_product_data()
+pytestmark = pytest.mark.shared_state("catalog")
 
 
-def _ensure_product_for_update(authenticated_page, product_title: str) -> None:
+def _ensure_product_for_update(authenticated_page, product_title: str, seeding_client=None) -> None:
     add_product_page = AddUpdateProductPage(authenticated_page)
     my_products_page = MyProductsPage(authenticated_page)
+    seed = load_data("add_update_product")["update_seed_product"]
+    if seeding_client is not None:
+        seeding_client.ensure_product(
+            product_title,
+            description=seed["description"],
+            purchase_price=seed["purchase_price"],
+            rent_price=seed["rent_price"],
+            categories=[seed["category"]],
+            rent_duration_type=seed["rent_duration_type"],
+        )
+        my_products_page.refresh()
+        return
+
     add_product_page.go_to_my_products()
     if my_products_page.product_count(product_title) > 0:
         return
@@ -30,33 +37,27 @@ def _ensure_product_for_update(authenticated_page, product_title: str) -> None:
     add_product_page.open_from_my_products()
     add_product_page.submit_product(
         title=product_title,
-        description="Seed product for update test flow",
-        purchase_price="500",
-        rent_price="50",
-        category="Outdoor",
-        rent_duration_type="Daily",
+        description=seed["description"],
+        purchase_price=seed["purchase_price"],
+        rent_price=seed["rent_price"],
+        category=seed["category"],
+        rent_duration_type=seed["rent_duration_type"],
     )
     add_product_page.go_to_my_products()
     assert my_products_page.product_count(product_title) > 0
 
 
-@pytest.mark.parametrize("case", ADD_PRODUCT_DATA["ui_validations"], ids=lambda c: c["name"])
+@pytest.mark.parametrize("case", case_refs("add_update_product", "ui_validations"), ids=str, indirect=True)
 def test_add_product_ui_validation(authenticated_page, case: dict) -> None:
     add_product_page = AddUpdateProductPage(authenticated_page)
     add_product_page.open_from_my_products()
 
     assert add_product_page.is_on_add_product_page()
     assert add_product_page.text_visible(add_product_page.PAGE_HEADING_TEXT)
-    assert authenticated_page.locator(add_product_page.TITLE_INPUT).is_visible()
-    assert authenticated_page.locator(add_product_page.DESCRIPTION_INPUT).is_visible()
-    assert authenticated_page.locator(add_product_page.PURCHASE_PRICE_INPUT).is_visible()
-    assert authenticated_page.locator(add_product_page.RENT_PRICE_INPUT).is_visible()
-    assert authenticated_page.locator(add_product_page.CATEGORIES_DROPDOWN).is_visible()
-    assert authenticated_page.locator(add_product_page.RENT_DURATION_DROPDOWN).is_visible()
-    assert authenticated_page.locator(add_product_page.SUBMIT_BUTTON).is_visible()
+    assert add_product_page.hidden_elements(add_product_page.FORM_CONTROLS) == []
 
 
-@pytest.mark.parametrize("case", ADD_PRODUCT_DATA["positive_cases"], ids=lambda c: c["name"])
+@pytest.mark.parametrize("case", case_refs("add_update_product", "positive_cases"), ids=str, indirect=True)
 def test_add_product_positive(authenticated_page, case: dict) -> None:
     add_product_page = AddUpdateProductPage(authenticated_page)
     add_product_page.open_from_my_products()
@@ -75,7 +76,7 @@ def test_add_product_positive(authenticated_page, case: dict) -> None:
     assert add_product_page.product_visible_on_my_products(title)
 
 
-@pytest.mark.parametrize("case", ADD_PRODUCT_DATA["negative_cases"], ids=lambda c: c["name"])
+@pytest.mark.parametrize("case", case_refs("add_update_product", "negative_cases"), ids=str, indirect=True)
 def test_add_product_negative(authenticated_page, case: dict) -> None:
     add_product_page = AddUpdateProductPage(authenticated_page)
     add_product_page.open_from_my_products()
@@ -102,28 +103,22 @@ def test_add_product_negative(authenticated_page, case: dict) -> None:
         assert add_product_page.text_visible(case["expected_message"])
 
 
-@pytest.mark.parametrize("case", ADD_PRODUCT_DATA["update_ui_validations"], ids=lambda c: c["name"])
-def test_update_product_ui_validation(authenticated_page, case: dict) -> None:
+@pytest.mark.parametrize("case", case_refs("add_update_product", "update_ui_validations"), ids=str, indirect=True)
+def test_update_product_ui_validation(authenticated_page, seeding_client, case: dict) -> None:
     add_product_page = AddUpdateProductPage(authenticated_page)
-    _ensure_product_for_update(authenticated_page, case["search_title_from_add_positive"])
+    _ensure_product_for_update(authenticated_page, case["search_title_from_add_positive"], seeding_client)
     add_product_page.go_to_my_products()
     add_product_page.open_existing_product_for_update(case["search_title_from_add_positive"])
 
     assert add_product_page.is_on_edit_product_page()
     assert add_product_page.text_visible(add_product_page.EDIT_PAGE_HEADING_TEXT)
-    assert authenticated_page.locator(add_product_page.TITLE_INPUT).is_visible()
-    assert authenticated_page.locator(add_product_page.DESCRIPTION_INPUT).is_visible()
-    assert authenticated_page.locator(add_product_page.PURCHASE_PRICE_INPUT).is_visible()
-    assert authenticated_page.locator(add_product_page.RENT_PRICE_INPUT).is_visible()
-    assert authenticated_page.locator(add_product_page.CATEGORIES_DROPDOWN).is_visible()
-    assert authenticated_page.locator(add_product_page.RENT_DURATION_DROPDOWN).is_visible()
-    assert authenticated_page.locator(add_product_page.SUBMIT_BUTTON).is_visible()
+    assert add_product_page.hidden_elements(add_product_page.FORM_CONTROLS) == []
 
 
-@pytest.mark.parametrize("case", ADD_PRODUCT_DATA["update_positive_cases"], ids=lambda c: c["name"])
-def test_update_product_positive(authenticated_page, case: dict) -> None:
+@pytest.mark.parametrize("case", case_refs("add_update_product", "update_positive_cases"), ids=str, indirect=True)
+def test_update_product_positive(authenticated_page, seeding_client, case: dict) -> None:
     add_product_page = AddUpdateProductPage(authenticated_page)
-    _ensure_product_for_update(authenticated_page, case["search_title_from_add_positive"])
+    _ensure_product_for_update(authenticated_page, case["search_title_from_add_positive"], seeding_client)
     add_product_page.go_to_my_products()
     add_product_page.open_existing_product_for_update(case["search_title_from_add_positive"])
 
@@ -144,10 +139,10 @@ def test_update_product_positive(authenticated_page, case: dict) -> None:
     assert add_product_page.product_visible_on_my_products(updated_title)
 
 
-@pytest.mark.parametrize("case", ADD_PRODUCT_DATA["update_negative_cases"], ids=lambda c: c["name"])
-def test_update_product_negative(authenticated_page, case: dict) -> None:
+@pytest.mark.parametrize("case", case_refs("add_update_product", "update_negative_cases"), ids=str, indirect=True)
+def test_update_product_negative(authenticated_page, seeding_client, case: dict) -> None:
     add_product_page = AddUpdateProductPage(authenticated_page)
-    _ensure_product_for_update(authenticated_page, case["search_title_from_add_positive"])
+    _ensure_product_for_update(authenticated_page, case["search_title_from_add_positive"], seeding_client)
     add_product_page.go_to_my_products()
     add_product_page.open_existing_product_for_update(case["search_title_from_add_positive"])
 
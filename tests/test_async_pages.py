@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from config import Settings
+from pages.aio.browse_products_page import BrowseProductsPage
+from pages.aio.login_page import LoginPage
+from pages.aio.my_products_page import MyProductsPage
+from test_data import load_data
+
+CONCURRENT_PAGES = 8
+
+
+# Sends every invalid login CONCURRENT_PAGES times at once, which the live app may treat as an attack.
+@pytest.mark.skipif(
+    Settings.APP_MODE != "fake" and not Settings.LIVE_LOAD_TESTS,
+    reason="concurrent invalid logins run against APP_MODE=fake unless LIVE_LOAD_TESTS=on",
+)
+def test_concurrent_login_negative_cases(async_loop, async_context) -> None:
+    cases = [case for case in load_data("login")["negative_cases"] if case["email"] != "{{USERNAME}}"]
+
+    async def attempt(case: dict) -> bool:
+        login_page = await LoginPage.create(await async_context.new_page())
+        await login_page.open()
+        await login_page.login(email=case["email"], password=case["password"])
+        return await login_page.text_visible(case["expected_message"])
+
+    async def scenario() -> list[bool]:
+        return await asyncio.gather(*(attempt(case) for case in cases * CONCURRENT_PAGES))
+
+    assert all(async_loop.run(scenario()))
+
+
+def test_concurrent_browse_products(async_loop, async_authenticated_context) -> None:
+    async def browse() -> list[str]:
+        page = await async_authenticated_context.new_page()
+        my_products_page = await MyProductsPage.create(page)
+        await page.goto(Settings.LOGIN_URL, wait_until="domcontentloaded")
+        await page.wait_for_url(Settings.MY_PRODUCTS_URL)
+        await my_products_page.wait_for_settle()
+        browse_page = await BrowseProductsPage.create(page)
+        await browse_page.open_from_my_products()
+        await browse_page.wait_for_settle()
+        return await browse_page.product_titles()
+
+    async def scenario() -> list[list[str]]:
+        return await asyncio.gather(*(browse() for _ in range(CONCURRENT_PAGES)))
+
+    titles = async_loop.run(scenario())
+    assert titles[0]
+    assert all(page_titles == titles[0] for page_titles in titles)
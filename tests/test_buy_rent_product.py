@@ -1,14 +1,8 @@
-import json
-from pathlib import Path
 
 import pytest
 
 from pages.view_product_page import ViewProductPage
-
-
-def _load_buy_rent_data() -> dict:
-    data_path = Path(__file__).resolve().parent.parent / "test_data" / "buy_rent_product.json"
-    return json.loads(data_path.read_text(encoding="utf-8"))
+from test_data import case_refs, load_data
 
 
 def _status_matches(actual_status: str, expected_statuses: list[str]) -> bool:
@@ -16,6 +10,10 @@ def _status_matches(actual_status: str, expected_statuses: list[str]) -> bool:
     return any(actual == expected.lower() or actual.startswith(expected.lower()) for expected in expected_statuses)
 
 
+def _targets() -> dict:
+    return load_data("buy_rent_product")["product_targets"]
+
+
 def _open_or_skip(view_product_page: ViewProductPage, title: str, category: str | None = None) -> None:
     try:
         view_product_page.open_product_by_title(title, category=category)
@@ -23,26 +21,25 @@ def _open_or_skip(view_product_page: ViewProductPage, title: str, category: str
         pytest.skip(f"Product not available: {title}")
 
 
-BUY_RENT_DATA = _load_buy_rent_data()
-TARGETS = BUY_RENT_DATA["product_targets"]
+pytestmark = pytest.mark.shared_state("catalog")
 
 
-def test_sold_product_hides_buy_rent_buttons(authenticated_page) -> None:
-    view_product_page = ViewProductPage(authenticated_page)
-    _open_or_skip(view_product_page, TARGETS["sold_product_title"])
+def test_sold_product_hides_buy_rent_buttons(authenticated_page, catalog_index) -> None:
+    view_product_page = ViewProductPage(authenticated_page, catalog=catalog_index)
+    _open_or_skip(view_product_page, _targets()["sold_product_title"])
 
     assert _status_matches(view_product_page.status_text(), ["sold", "s"])
     assert not view_product_page.buy_button_visible()
     assert not view_product_page.rent_button_visible()
 
 
-@pytest.mark.parametrize("case", BUY_RENT_DATA["rent_cases"]["negative_cases"], ids=lambda c: c["name"])
-def test_rent_negative_funshine(authenticated_page, case: dict) -> None:
-    view_product_page = ViewProductPage(authenticated_page)
-    _open_or_skip(view_product_page, TARGETS["rent_product_title"])
+@pytest.mark.parametrize("case", case_refs("buy_rent_product", "rent_cases.negative_cases"), ids=str, indirect=True)
+def test_rent_negative_funshine(authenticated_page, catalog_index, case: dict) -> None:
+    view_product_page = ViewProductPage(authenticated_page, catalog=catalog_index)
+    _open_or_skip(view_product_page, _targets()["rent_product_title"])
 
     if view_product_page.status_text().lower() != "available":
-        pytest.skip(f"Product not available for rent tests: {TARGETS['rent_product_title']}")
+        pytest.skip(f"Product not available for rent tests: {_targets()['rent_product_title']}")
 
     assert view_product_page.rent_button_visible()
     view_product_page.open_rent_modal()
@@ -66,13 +63,13 @@ def test_rent_negative_funshine(authenticated_page, case: dict) -> None:
     assert _status_matches(view_product_page.status_text(), ["available", "a"])
 
 
-@pytest.mark.parametrize("case", BUY_RENT_DATA["rent_cases"]["positive_cases"], ids=lambda c: c["name"])
-def test_rent_positive_funshine(authenticated_page, case: dict) -> None:
-    view_product_page = ViewProductPage(authenticated_page)
-    _open_or_skip(view_product_page, TARGETS["rent_product_title"])
+@pytest.mark.parametrize("case", case_refs("buy_rent_product", "rent_cases.positive_cases"), ids=str, indirect=True)
+def test_rent_positive_funshine(authenticated_page, catalog_index, case: dict) -> None:
+    view_product_page = ViewProductPage(authenticated_page, catalog=catalog_index)
+    _open_or_skip(view_product_page, _targets()["rent_product_title"])
 
     if view_product_page.status_text().lower() != "available":
-        pytest.skip(f"Product not available for rent tests: {TARGETS['rent_product_title']}")
+        pytest.skip(f"Product not available for rent tests: {_targets()['rent_product_title']}")
 
     view_product_page.open_rent_modal()
     view_product_page.set_rent_dates_from_offsets(case["start_offset_days"], case["end_offset_days"])
@@ -84,13 +81,13 @@ def test_rent_positive_funshine(authenticated_page, case: dict) -> None:
     assert status_ok
 
 
-@pytest.mark.parametrize("case", BUY_RENT_DATA["buy_cases"]["negative_cases"], ids=lambda c: c["name"])
-def test_buy_negative_lawn_mower(authenticated_page, case: dict) -> None:
-    view_product_page = ViewProductPage(authenticated_page)
-    _open_or_skip(view_product_page, TARGETS["buy_product_title"])
+@pytest.mark.parametrize("case", case_refs("buy_rent_product", "buy_cases.negative_cases"), ids=str, indirect=True)
+def test_buy_negative_lawn_mower(authenticated_page, catalog_index, case: dict) -> None:
+    view_product_page = ViewProductPage(authenticated_page, catalog=catalog_index)
+    _open_or_skip(view_product_page, _targets()["buy_product_title"])
 
     if view_product_page.status_text().lower() != "available":
-        pytest.skip(f"Product not available for buy tests: {TARGETS['buy_product_title']}")
+        pytest.skip(f"Product not available for buy tests: {_targets()['buy_product_title']}")
 
     assert view_product_page.buy_button_visible()
     assert view_product_page.rent_button_visible()
@@ -103,13 +100,13 @@ def test_buy_negative_lawn_mower(authenticated_page, case: dict) -> None:
     assert view_product_page.rent_button_visible()
 
 
-@pytest.mark.parametrize("case", BUY_RENT_DATA["buy_cases"]["positive_cases"], ids=lambda c: c["name"])
-def test_buy_positive_lawn_mower(authenticated_page, case: dict) -> None:
-    view_product_page = ViewProductPage(authenticated_page)
-    _open_or_skip(view_product_page, TARGETS["buy_product_title"])
+@pytest.mark.parametrize("case", case_refs("buy_rent_product", "buy_cases.positive_cases"), ids=str, indirect=True)
+def test_buy_positive_lawn_mower(authenticated_page, catalog_index, case: dict) -> None:
+    view_product_page = ViewProductPage(authenticated_page, catalog=catalog_index)
+    _open_or_skip(view_product_page, _targets()["buy_product_title"])
 
     if view_product_page.status_text().lower() != "available":
-        pytest.skip(f"Product not available for buy tests: {TARGETS['buy_product_title']}")
+        pytest.skip(f"Product not available for buy tests: {_targets()['buy_product_title']}")
 
     view_product_page.open_buy_modal()
     view_product_page.confirm_buy()
@@ -119,12 +116,26 @@ def test_buy_positive_lawn_mower(authenticated_page, case: dict) -> None:
     assert not view_product_page.rent_button_visible()
 
 
-def test_cricket_kit_available_owned_combined_logic(authenticated_page) -> None:
-    view_product_page = ViewProductPage(authenticated_page)
+def test_first_available_product_offers_buy_and_rent(authenticated_page, catalog_index) -> None:
+    view_product_page = ViewProductPage(authenticated_page, catalog=catalog_index)
+    try:
+        title = view_product_page.open_first_available_non_owned_product()
+    except RuntimeError:
+        pytest.skip("No available product owned by another user.")
+
+    assert view_product_page.status_text().lower() == "available"
+    assert not view_product_page.is_owned_by_logged_user()
+    assert view_product_page.buy_button_visible()
+    assert view_product_page.rent_button_visible()
+    assert catalog_index.get(title).is_available_to_user
+
+
+def test_cricket_kit_available_owned_combined_logic(authenticated_page, catalog_index) -> None:
+    view_product_page = ViewProductPage(authenticated_page, catalog=catalog_index)
     _open_or_skip(
         view_product_page,
-        TARGETS["own_available_product_title"],
-        category=TARGETS["own_available_category"],
+        _targets()["own_available_product_title"],
+        category=_targets()["own_available_category"],
     )
 
     # In app behavior, clicking this product redirects to owner context.
@@ -1,27 +1,21 @@
-import json
 import time
-from pathlib import Path
 
 import pytest
 
 from config import Settings
 from pages.my_products_page import MyProductsPage
 from pages.my_products_page import AddUpdateProductPage
-
-
-def _load_delete_product_data() -> dict:
-    data_path = Path(__file__).resolve().parent.parent / "test_data" / "delete_product.json"
-    return json.loads(data_path.read_text(encoding="utf-8"))
+from test_data import case_refs
 
 
 def _unique_title(base_title: str) -> str:
     return f"{base_title} {int(time.time() * 1000)}"
 
 
-DELETE_PRODUCT_DATA = _load_delete_product_data()
+pytestmark = pytest.mark.shared_state("catalog")
 
 
-@pytest.mark.parametrize("case", DELETE_PRODUCT_DATA["ui_validations"], ids=lambda c: c["name"])
+@pytest.mark.parametrize("case", case_refs("delete_product", "ui_validations"), ids=str, indirect=True)
 def test_delete_product_ui_validation(authenticated_page, case: dict) -> None:
     my_products_page = MyProductsPage(authenticated_page)
     my_products_page.open()
@@ -32,23 +26,34 @@ def test_delete_product_ui_validation(authenticated_page, case: dict) -> None:
     assert authenticated_page.locator(my_products_page.DELETE_BUTTON).count() > 0
 
 
-@pytest.mark.parametrize("case", DELETE_PRODUCT_DATA["positive_cases"], ids=lambda c: c["name"])
-def test_delete_product_positive(authenticated_page, case: dict) -> None:
+@pytest.mark.parametrize("case", case_refs("delete_product", "positive_cases"), ids=str, indirect=True)
+def test_delete_product_positive(authenticated_page, catalog_index, seeding_client, case: dict) -> None:
     add_update_product_page = AddUpdateProductPage(authenticated_page)
-    my_products_page = MyProductsPage(authenticated_page)
+    my_products_page = MyProductsPage(authenticated_page, catalog=catalog_index)
 
     product_title = _unique_title(case["product_title_prefix"]) if case.get("use_unique_title") else case["product_title_prefix"]
 
     # Create a product first so delete validation is deterministic.
-    add_update_product_page.open_from_my_products()
-    add_update_product_page.submit_product(
-        title=product_title,
-        description=case["description"],
-        purchase_price=case["purchase_price"],
-        rent_price=case["rent_price"],
-        category=case["category"],
-        rent_duration_type=case["rent_duration_type"],
-    )
+    if seeding_client is not None:
+        seeding_client.create_product(
+            product_title,
+            description=case["description"],
+            purchase_price=case["purchase_price"],
+            rent_price=case["rent_price"],
+            categories=[case["category"]],
+            rent_duration_type=case["rent_duration_type"],
+        )
+        my_products_page.refresh()
+    else:
+        add_update_product_page.open_from_my_products()
+        add_update_product_page.submit_product(
+            title=product_title,
+            description=case["description"],
+            purchase_price=case["purchase_price"],
+            rent_price=case["rent_price"],
+            category=case["category"],
+            rent_duration_type=case["rent_duration_type"],
+        )
 
     my_products_page.open()
     assert authenticated_page.url == Settings.MY_PRODUCTS_URL
@@ -58,7 +63,6 @@ def test_delete_product_positive(authenticated_page, case: dict) -> None:
     my_products_page.click_delete_for_product(product_title)
     assert my_products_page.delete_modal_visible()
     my_products_page.confirm_delete()
-    authenticated_page.wait_for_timeout(1200)
     my_products_page.open()
     assert authenticated_page.url == Settings.MY_PRODUCTS_URL
     after_count = my_products_page.product_count(product_title)
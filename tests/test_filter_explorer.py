@@ -0,0 +1,44 @@
+import itertools
+
+from support.catalog_index import ProductCard
+from support.filter_explorer import FilterExplorer, card_violations, covering_rows, rent_duration_needs_range
+
+
+def test_pairwise_rows_cover_every_allowed_pair() -> None:
+    parameters = {
+        "title": [None, "Ikea", "bear"],
+        "category": [None, "Furniture", "Toys"],
+        "rent_range": [None, ["1", "15"]],
+        "rent_duration": [None, "Daily", "Hourly"],
+    }
+
+    rows = covering_rows(parameters, strength=2, allowed=rent_duration_needs_range)
+
+    assert all(rent_duration_needs_range(row) for row in rows)
+    for first, second in itertools.combinations(parameters, 2):
+        for pair in itertools.product(parameters[first], parameters[second]):
+            if rent_duration_needs_range(dict(zip((first, second), pair))):
+                assert any((row[first], row[second]) == pair for row in rows)
+    assert len(rows) < len(list(itertools.product(*parameters.values())))
+
+
+class _RecordingBrowsePage:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __getattr__(self, name: str):
+        return lambda *args: self.calls.append(name)
+
+
+def test_explorer_only_touches_changed_controls() -> None:
+    page = _RecordingBrowsePage()
+    explorer = FilterExplorer(page)
+    base = {"title": "Ikea", "category": "Furniture", "buy_range": ["0", "500"], "rent_range": None, "rent_duration": None}
+
+    explorer.apply(base)
+    page.calls.clear()
+    changed = explorer.apply({**base, "buy_range": None})
+
+    assert changed == ["buy_range"]
+    assert page.calls == ["disable_buy_filter", "apply_filters"]
+    assert card_violations(base, ProductCard("Ikea couch", ("Furniture",), 1200.0)) == ["buy_range"]
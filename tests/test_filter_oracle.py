@@ -0,0 +1,34 @@
+from support.catalog_index import ProductCard
+from support.filter_explorer import card_violations
+from support.filter_oracle import CatalogOracle, filters_from_case
+
+CARDS = [
+    ProductCard("Ikea couch", ("Furniture",), 1200.0, 20.0, "daily"),
+    ProductCard("Funshine bear", ("Toys",), 40.0, 10.0, "daily"),
+    ProductCard("Blender", ("Home Appliances",), 1000.0, 50.0, "weekly"),
+    ProductCard("Last of Us Part II PS5 game", ("Electronics", "Toys"), 60.0, 5.0, "daily"),
+]
+
+
+def test_oracle_matches_card_by_card_filtering() -> None:
+    oracle = CatalogOracle(CARDS)
+    rows = [
+        {"category": "Toys", "buy_range": ["0", "50"]},
+        {"rent_range": ["1", "15"], "rent_duration": "Daily"},
+        {"title": "e", "buy_range": ["", "1100"]},
+        {"buy_range": ["2000", "100"]},
+    ]
+
+    for row in rows:
+        expected = [card.title for card in CARDS if not card_violations(row, card)]
+        assert [card.title for card in oracle.expected(row)] == expected
+
+
+def test_oracle_diff_reports_missing_and_unexpected_products() -> None:
+    oracle = CatalogOracle(CARDS)
+    filters = filters_from_case({"category": "Toys", "min_buy_range": "0", "max_buy_range": "1500"})
+
+    diff = oracle.diff(filters, [CARDS[0], CARDS[1]])
+
+    assert diff == {"missing": ["Last of Us Part II PS5 game"], "unexpected": ["Ikea couch"]}
+    assert oracle.count(filters) == 2
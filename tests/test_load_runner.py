@@ -0,0 +1,22 @@
+import pytest
+
+from support.load_runner import parse_mix, percentile, summarize_load
+
+
+def test_parse_mix_weights_and_unknown_scenarios() -> None:
+    assert parse_mix("browse=6, buy=2,rent") == {"browse": 6.0, "buy": 2.0, "rent": 1.0}
+    with pytest.raises(ValueError):
+        parse_mix("browse=1,checkout=1")
+
+
+def test_summary_percentiles_exclude_failed_calls() -> None:
+    records = [{"action": "BrowseProductsPage.apply_filters", "elapsed_ms": float(ms), "failed": False} for ms in range(1, 101)]
+    records.append({"action": "BrowseProductsPage.apply_filters", "elapsed_ms": 9000.0, "failed": True})
+
+    [row] = summarize_load(records, elapsed_s=10.0)
+
+    assert percentile([], 95) == 0.0
+    assert (row["p50_ms"], row["p95_ms"], row["p99_ms"]) == (50.0, 95.0, 99.0)
+    assert row["count"] == 101
+    assert row["errors"] == 1
+    assert row["throughput_per_s"] == 10.1
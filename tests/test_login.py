@@ -1,14 +1,8 @@
-import json
-from pathlib import Path
 import pytest
 
 from config import Settings
 from pages.login_page import LoginPage
-
-
-def _load_login_data() -> dict:
-    data_path = Path(__file__).resolve().parent.parent / "test_data" / "login.json"
-    return json.loads(data_path.read_text(encoding="utf-8"))
+from test_data import case_refs
 
 
 def _resolve_secret(value: str) -> str:
@@ -19,9 +13,6 @@ def _resolve_secret(value: str) -> str:
     return value
 
 
-LOGIN_DATA = _load_login_data()
-
-
 def _login_with_valid_user(login_page: LoginPage) -> None:
     if not Settings.USERNAME or not Settings.PASSWORD:
         pytest.skip("Valid login credentials are not configured.")
@@ -29,7 +20,7 @@ def _login_with_valid_user(login_page: LoginPage) -> None:
     login_page.login(email=Settings.USERNAME, password=Settings.PASSWORD)
 
 
-@pytest.mark.parametrize("case", LOGIN_DATA["ui_validations"], ids=lambda c: c["name"])
+@pytest.mark.parametrize("case", case_refs("login", "ui_validations"), ids=str, indirect=True)
 def test_login_ui_validation(page, case: dict) -> None:
     login_page = LoginPage(page)
     login_page.open()
@@ -41,7 +32,7 @@ def test_login_ui_validation(page, case: dict) -> None:
     assert login_page.sign_up_link_visible()
 
 
-@pytest.mark.parametrize("case", LOGIN_DATA["positive_cases"], ids=lambda c: c["name"])
+@pytest.mark.parametrize("case", case_refs("login", "positive_cases"), ids=str, indirect=True)
 def test_login_positive(page, case: dict) -> None:
     email = _resolve_secret(case["email"])
     password = _resolve_secret(case["password"])
@@ -65,7 +56,6 @@ def test_logout_cancel_keeps_user_logged_in(page) -> None:
     assert login_page.logout_modal_visible()
 
     login_page.cancel_logout()
-    page.wait_for_timeout(700)
 
     assert page.url == Settings.MY_PRODUCTS_URL
     assert login_page.my_products_visible()
@@ -80,13 +70,12 @@ def test_logout_confirm_redirects_to_signin(page) -> None:
     assert login_page.logout_modal_visible()
 
     login_page.confirm_logout()
-    page.wait_for_timeout(1000)
 
     assert page.url == f"{Settings.BASE_URL}/signin"
     assert page.get_by_role("button", name="Sign In").count() > 0
 
 
-@pytest.mark.parametrize("case", LOGIN_DATA["negative_cases"], ids=lambda c: c["name"])
+@pytest.mark.parametrize("case", case_refs("login", "negative_cases"), ids=str, indirect=True)
 def test_login_negative(page, case: dict) -> None:
     email = _resolve_secret(case["email"])
     password = _resolve_secret(case["password"])
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+from support.memory_watch import MemorySample, MemoryWatch, chromium_rss_mb, sustained_growth
+
+
+def test_sustained_growth_blames_the_largest_steps() -> None:
+    heaps = [10, 10.5, 10, 10.5, 10, 12, 12.5, 16, 16.4, 17, 17, 17]
+    samples = [MemorySample(f"test_{index}", js_heap_mb=heap) for index, heap in enumerate(heaps)]
+
+    [streak] = sustained_growth(samples, "js_heap_mb", window=4, min_percent=10)
+
+    assert (streak["from_test"], streak["to_test"]) == ("test_3", "test_10")
+    assert [test["nodeid"] for test in streak["blamed"]] == ["test_7", "test_5", "test_9"]
+    assert sustained_growth(samples[:5], "js_heap_mb", window=4, min_percent=10) == []
+
+
+def _process(proc: Path, pid: int, ppid: int, name: str, rss_kb: int) -> None:
+    (proc / str(pid)).mkdir()
+    (proc / str(pid) / "stat").write_text(f"{pid} ({name}) S {ppid} 1 1 0")
+    (proc / str(pid) / "status").write_text(f"Name:\t{name}\nVmRSS:\t{rss_kb} kB\n")
+
+
+def test_chromium_rss_sums_only_chromium_descendants(tmp_path: Path) -> None:
+    _process(tmp_path, 10, 1, "python", 50_000)
+    _process(tmp_path, 11, 10, "node", 40_000)
+    _process(tmp_path, 12, 11, "chrome", 100_000)
+    _process(tmp_path, 13, 12, "chrome (renderer)", 2_400)
+    _process(tmp_path, 20, 1, "chrome", 999_999)
+
+    assert chromium_rss_mb([10], proc=tmp_path) == 100.0
+
+
+class _Browser:
+    def __init__(self, connected: bool = False) -> None:
+        self.connected = connected
+        self.recycles = 0
+
+    def recycle(self) -> None:
+        self.recycles += 1
+
+
+def _watch_heap(monkeypatch, probe_heaps: list[float], browser: _Browser) -> tuple[MemoryWatch, list[bool]]:
+    heaps = iter(probe_heaps)
+    probe = object()
+    # Test pages always report the same small heap; only the long-lived probe page grows.
+    monkeypatch.setattr(
+        "support.memory_watch.page_metrics", lambda page: {"js_heap_mb": next(heaps) if page is probe else 8.0}
+    )
+    monkeypatch.setattr("support.memory_watch.chromium_rss_mb", lambda roots: 900.0)
+    monkeypatch.setattr(MemoryWatch, "close_probe", lambda watch: setattr(watch, "probe", None))
+    watch = MemoryWatch(enabled=True, recycle_heap_mb=100)
+    watch.browser = browser
+    recycled = []
+    for index in range(len(probe_heaps)):
+        watch.probe = watch.probe or probe
+        watch.sample(None, f"test_{index}")
+        recycled.append(watch.recycle_if_due(f"test_{index}"))
+    return watch, recycled
+
+
+def test_session_heap_growth_past_threshold_recycles_once(monkeypatch) -> None:
+    watch, recycled = _watch_heap(monkeypatch, [30.0, 80.0, 140.0, 32.0, 60.0], _Browser())
+
+    assert recycled == [False, False, True, False, False]
+    assert watch.browser.recycles == 1
+    assert watch.heap_baseline == 32.0
+    assert [sample.js_heap_mb for sample in watch.samples] == [8.0] * 5
+
+
+def test_connected_browser_server_skips_the_recycle_and_keeps_the_baseline(monkeypatch) -> None:
+    watch, recycled = _watch_heap(monkeypatch, [30.0, 140.0, 150.0, 300.0], _Browser(connected=True))
+
+    assert recycled == [False, False, False, False]
+    assert watch.browser.recycles == 0
+    assert watch.heap_baseline == 30.0
+    assert [(recycle["after_test"], recycle["skipped"]) for recycle in watch.recycles] == [("test_1", True)]
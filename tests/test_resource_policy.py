@@ -0,0 +1,59 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+from support.resource_policy import ResourcePolicy, ResourceSizeLedger, apply_resource_policy, estimate_blocked_sizes
+
+IMAGE_URL = "https://cdn.example.com/couch.jpg"
+
+
+class _Route:
+    def __init__(self, url: str, resource_type: str) -> None:
+        self.request = SimpleNamespace(url=url, resource_type=resource_type)
+        self.aborted = False
+
+    def abort(self, error_code: str) -> None:
+        self.aborted = True
+
+
+class _Context:
+    def __init__(self) -> None:
+        self.handler = None
+
+    def on(self, event: str, listener) -> None:
+        pass
+
+    def route(self, pattern: str, handler) -> None:
+        self.handler = handler
+
+
+def test_blocked_image_counts_towards_bytes_avoided_once_measured(tmp_path: Path) -> None:
+    ledger = ResourceSizeLedger(tmp_path / "sizes.json")
+    context = _Context()
+    stats = apply_resource_policy(context, ResourcePolicy(block_types=["image"]), ledger)
+    route = _Route(IMAGE_URL, "image")
+
+    context.handler(route)
+    assert route.aborted
+    assert stats.as_dict()["requests_with_unknown_size"] == 1
+
+    probed = []
+    ledger.measure(stats.unknown_urls(), lambda url: probed.append(url) or 48_000)
+    ledger.measure([IMAGE_URL], lambda url: probed.append(url) or 48_000)
+
+    assert stats.as_dict()["bytes_avoided"] == 48_000
+    assert stats.as_dict()["requests_with_unknown_size"] == 0
+    assert probed == [IMAGE_URL]
+    ledger.save()
+    assert ResourceSizeLedger(tmp_path / "sizes.json").sizes == {IMAGE_URL: 48_000}
+
+
+def test_blocked_sizes_are_not_probed_unless_opted_in(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("support.resource_policy.Settings.RESOURCE_SIZE_PROBE", False)
+    ledger = ResourceSizeLedger(tmp_path / "sizes.json")
+    context = _Context()
+    stats = apply_resource_policy(context, ResourcePolicy(block_types=["image"]), ledger)
+    context.handler(_Route(IMAGE_URL, "image"))
+
+    estimate_blocked_sizes(context, stats)
+
+    assert stats.as_dict()["requests_with_unknown_size"] == 1
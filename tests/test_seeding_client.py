@@ -0,0 +1,87 @@
+import pytest
+
+from support.fake_teebay import FakeTeebayServer
+from support.seeding import SeedingClient, SeedingError
+
+
+@pytest.fixture(scope="module")
+def fake_backend() -> FakeTeebayServer:
+    with FakeTeebayServer() as server:
+        yield server
+
+
+@pytest.fixture()
+def client(fake_backend: FakeTeebayServer) -> SeedingClient:
+    fake_backend.reset()
+    client = SeedingClient(f"{fake_backend.base_url}/api")
+    seed_user = fake_backend.state.users[0]
+    client.login(seed_user["email"], seed_user["password"])
+    return client
+
+
+def test_create_update_delete_product(client: SeedingClient) -> None:
+    product = client.create_product("Seeded lamp", categories=["Furniture"], purchase_price=120)
+    assert client.find_my_products("Seeded lamp")[0]["id"] == product["id"]
+
+    updated = client.update_product(product["id"], rent_price=15)
+    assert updated["rent_price"] == 15
+    assert updated["purchase_price"] == 120
+
+    client.delete_product(product["id"])
+    assert client.find_my_products("Seeded lamp") == []
+
+
+def test_bulk_create_and_delete_products(client: SeedingClient) -> None:
+    before = len(client.my_products())
+    products = client.create_products([{"title": f"Bulk item {index}"} for index in range(25)])
+
+    assert len({product["id"] for product in products}) == 25
+    assert len(client.my_products()) == before + 25
+
+    client.delete_products([product["id"] for product in products])
+    assert len(client.my_products()) == before
+
+
+def test_ensure_product_reuses_existing_title(client: SeedingClient) -> None:
+    first = client.ensure_product("Only once")
+    second = client.ensure_product("Only once")
+
+    assert first["id"] == second["id"]
+    assert len(client.find_my_products("Only once")) == 1
+
+
+def test_create_update_delete_users(client: SeedingClient) -> None:
+    users = client.create_users(
+        [
+            {
+                "first_name": "Seed",
+                "last_name": f"User {index}",
+                "address": "Dhaka",
+                "email": f"seed{index}@teebay.com",
+                "phone_number": "01700000000",
+                "password": "secret1",
+                "confirm_password": "secret1",
+            }
+            for index in range(3)
+        ]
+    )
+    assert [user["email"] for user in users] == [f"seed{index}@teebay.com" for index in range(3)]
+
+    updated = client.update_user(users[0]["token"], address="Sylhet")
+    assert updated["address"] == "Sylhet"
+    assert updated["last_name"] == "User 0"
+
+    client.delete_users([user["token"] for user in users])
+    with pytest.raises(SeedingError) as error:
+        client.update_user(users[0]["token"], address="Khulna")
+    assert error.value.status == 401
+
+
+def test_api_errors_raise_seeding_error(client: SeedingClient) -> None:
+    with pytest.raises(SeedingError) as error:
+        client.create_product("Bad prices", purchase_price="free")
+    assert error.value.status == 400
+
+    with pytest.raises(SeedingError) as error:
+        client.delete_product(99999)
+    assert error.value.status == 404
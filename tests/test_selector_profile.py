@@ -0,0 +1,39 @@
+from support.selector_profile import Probe, SelectorRegistry, exceeds, over_budget
+
+
+def test_registry_flags_nested_has_lookup_on_generated_classes() -> None:
+    registry = SelectorRegistry.collect()
+
+    row_lookup = registry.get(
+        'locator("div.sc-jrQzAO", has=locator("div.sc-hKwDye", has_text="<product_title>"))'
+    )
+
+    assert row_lookup is not None
+    assert row_lookup.owners == {"MyProductsPage.click_delete_for_product"}
+    assert row_lookup.flags() == ["generated-class", "nested-has", "has-text-filter"]
+    assert "RegistrationPageSelectors.FORM_CONTROLS['register']" in registry.get(
+        'locator("button:has-text(\'Register\')")'
+    ).owners
+    assert Probe("css", "input[name='email']").flags() == []
+
+
+def test_only_new_selectors_over_the_limit_fail() -> None:
+    rows = [
+        {"selector": 'get_by_text("My Products")', "cost_ms": 4.0, "baseline_ms": 0.5},
+        {"selector": 'locator("div.sc-hKwDye")', "cost_ms": 3.0, "baseline_ms": 0.5},
+        {"selector": "locator(\"input[name='email']\")", "cost_ms": 0.2, "baseline_ms": 0.5},
+    ]
+    budget = {
+        "limits": {"max_cost_ms": 2.0, "max_cost_ratio": 3.0},
+        "accepted": [{"name": 'get_by_text("My Products")'}],
+    }
+
+    assert [row["selector"] for row in over_budget(rows, budget)] == ['locator("div.sc-hKwDye")']
+
+
+def test_cost_within_a_few_baseline_round_trips_is_not_over_budget() -> None:
+    # On a slow runner the trivial selector already takes 1.5 ms, so 3 ms is noise rather than a slow selector.
+    row = {"selector": 'locator("div.sc-hKwDye")', "cost_ms": 3.0, "baseline_ms": 1.5}
+
+    assert not exceeds(row, {"max_cost_ms": 2.0, "max_cost_ratio": 3.0})
+    assert exceeds({**row, "cost_ms": 5.0}, {"max_cost_ms": 2.0, "max_cost_ratio": 3.0})